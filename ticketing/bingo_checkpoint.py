@@ -0,0 +1,229 @@
+"""
+Checkpoints for long verified bingo runs.
+
+A run over the extended catalog with a lot of permutations can take a long time, and everything it has done lives in
+memory until it finishes. A checkpoint file keeps enough of it on disk to pick the run back up after a crash or a
+cancel:
+
+|  completed faces:  the faces of every finished unit of work (a permutation of one face type, or a whole permutation
+|                    when the face list is reset for each one)
+|  face list:        the paths taken bitmap, the order of the face pool, and the lines left on every face (plus
+|                    the paths the run started with, when it reserves its paths in a LedgerStore)
+|  random state:     the random module's state and the face list's free-space placer, so a resumed run makes the
+|                    same faces it would have made if it had never stopped
+|  job fingerprint:  the bingo amounts, permutations, catalog, and ordering the run was started with
+
+The file is a compressed numpy archive. It's written to a temporary file first and swapped into place, so a crash in
+the middle of a save leaves the previous checkpoint alone. Saves happen at most every CHECKPOINT_INTERVAL seconds
+(and whenever the generators finish a face type), and the file is removed once the run succeeds, so the same job run
+again later starts fresh rather than handing back the faces it already made.
+"""
+import json
+import os
+import random as rn
+import time
+
+import numpy as np
+
+from .bingo_face_list import BingoFaceList
+from .path_ledger import PathLedger
+
+CHECKPOINT_VERSION = 2
+# Minimum number of seconds between saves.
+CHECKPOINT_INTERVAL = 30.0
+
+
+def unit_key(permutation: int, face_type: str = '') -> str:
+    """
+    Return the key a unit of work is saved under.
+
+    :param permutation: index of the permutation
+    :type permutation: int
+    :param face_type: key of the face type (left out when the unit is a whole permutation)
+    :type face_type: str
+    :return: checkpoint key
+    :rtype: str
+    """
+    return f"{permutation}/{face_type}" if face_type else f"{permutation}"
+
+
+def job_fingerprint(mode: str, bingo_amts, perms: int, v_size, order, seed: int | None = None,
+                    catalog: str | None = None) -> str:
+    """
+    Describe a job well enough to tell whether a checkpoint belongs to it.
+
+    :param mode: which generator is running ('without_reset' or 'with_reset')
+    :type mode: str
+    :param bingo_amts: bingo amounts the job was started with
+    :type bingo_amts: list[list[int] | list[list[int]] | bool | str]
+    :param perms: number of permutations
+    :type perms: int
+    :param v_size: standard or extended catalog
+    :type v_size: bool | str
+    :param order: ordering strategy
+    :type order: OrderingStrategy
+    :param seed: seed the job was started with
+    :type seed: int | None
+    :param catalog: compiled catalog file the job draws from (None for the packaged one)
+    :type catalog: str | None
+    :return: fingerprint
+    :rtype: str
+    """
+    return json.dumps([CHECKPOINT_VERSION, mode, bingo_amts, perms, bool(v_size), getattr(order, '__name__', ''),
+                       seed, None if catalog is None else os.path.abspath(catalog)], default=str)
+
+
+class BingoCheckpoint(object):
+    """
+    The on-disk progress of one verified bingo run. Units of work are recorded as they finish and written out
+    every so often along with the state needed to carry on from that point.
+    """
+
+    def __init__(self, path: str, fingerprint: str, interval: float | None = None):
+        """
+        :param path: checkpoint file
+        :type path: str
+        :param fingerprint: description of the job (see job_fingerprint)
+        :type fingerprint: str
+        :param interval: minimum number of seconds between saves (None uses CHECKPOINT_INTERVAL)
+        :type interval: float | None
+        """
+        self.path = path
+        self.fingerprint = fingerprint
+        self.interval = CHECKPOINT_INTERVAL if interval is None else interval
+        self.completed = {}
+        self.seeds = None
+        self.random_state = None
+        self.face_state = None
+        self.base = None
+        self.saved_at = time.monotonic()
+
+    @classmethod
+    def open(cls, path: str, fingerprint: str, interval: float | None = None) -> 'BingoCheckpoint':
+        """
+        Load the checkpoint at path, or start a new one if there isn't one yet.
+
+        :param path: checkpoint file
+        :type path: str
+        :param fingerprint: description of the job (see job_fingerprint)
+        :type fingerprint: str
+        :param interval: minimum number of seconds between saves (None uses CHECKPOINT_INTERVAL)
+        :type interval: float | None
+        :return: checkpoint
+        :rtype: BingoCheckpoint
+        """
+        checkpoint = cls(path, fingerprint, interval)
+        if not os.path.exists(path):
+            return checkpoint
+        with np.load(path) as data:
+            meta = json.loads(data['meta'].tobytes().decode('utf-8'))
+            if meta['fingerprint'] != fingerprint:
+                raise ValueError(f"The checkpoint {path} was saved by a different job.")
+            checkpoint.completed = meta['completed']
+            checkpoint.seeds = meta['seeds']
+            checkpoint.random_state = meta['random_state']
+            if 'ledger' in data:
+                checkpoint.face_state = {name: data[name] for name in ('ledger', 'pool', 'slots', 'remaining')}
+                checkpoint.face_state['counters'] = meta['counters']
+                checkpoint.face_state['placer'] = meta['placer']
+            if 'base' in data:
+                checkpoint.base = data['base']
+        return checkpoint
+
+    def done(self, unit: str) -> bool:
+        """
+        Check whether a unit of work was finished before the checkpoint was saved.
+
+        :param unit: unit key (see unit_key)
+        :type unit: str
+        :return: True if its faces are in the checkpoint
+        :rtype: bool
+        """
+        return unit in self.completed
+
+    def faces(self, unit: str) -> list:
+        """
+        Return the faces a finished unit of work made.
+
+        :param unit: unit key (see unit_key)
+        :type unit: str
+        :return: faces in the same form the generators return them
+        :rtype: list
+        """
+        return self.completed[unit]
+
+    def record(self, unit: str, faces: list, face_list: BingoFaceList | None = None) -> None:
+        """
+        Add a finished unit of work, and save the checkpoint if it's been long enough since the last save.
+
+        :param unit: unit key (see unit_key)
+        :type unit: str
+        :param faces: faces the unit made
+        :type faces: list
+        :param face_list: face list the run is drawing from (None when every unit has its own)
+        :type face_list: BingoFaceList | None
+        :return: None
+        :rtype: None
+        """
+        self.completed[unit] = faces
+        if time.monotonic() - self.saved_at >= self.interval:
+            self.save(face_list)
+
+    def resume(self, face_list: BingoFaceList | None = None) -> None:
+        """
+        Put the random state (and the face list, if one is passed and was saved) back the way they were when the
+        checkpoint was saved. A new checkpoint leaves everything alone.
+
+        :param face_list: face list the run is drawing from
+        :type face_list: BingoFaceList | None
+        :return: None
+        :rtype: None
+        """
+        if self.random_state is not None:
+            version, internal, gauss = self.random_state
+            rn.setstate((version, tuple(internal), gauss))
+        if face_list is not None and self.face_state is not None:
+            face_list.paths_taken = PathLedger(self.face_state['ledger'])
+            face_list.usable_faces.restore(self.face_state['pool'], self.face_state['slots'],
+                                           self.face_state['remaining'])
+            face_list.d_discards, face_list.d_pruned, face_list.d_rejects = self.face_state['counters']
+            face_list.placer.restore(self.face_state['placer'])
+
+    def save(self, face_list: BingoFaceList | None = None) -> None:
+        """
+        Write the checkpoint: every unit recorded so far, the random state, and the face list (if one is passed).
+
+        :param face_list: face list the run is drawing from
+        :type face_list: BingoFaceList | None
+        :return: None
+        :rtype: None
+        """
+        version, internal, gauss = rn.getstate()
+        meta = {'fingerprint': self.fingerprint, 'completed': self.completed, 'seeds': self.seeds,
+                'random_state': [version, list(internal), gauss]}
+        arrays = {}
+        if face_list is not None:
+            pool = face_list.usable_faces
+            arrays = {'ledger': face_list.paths_taken.bits, 'pool': pool.faces(), 'slots': pool.slots,
+                      'remaining': pool.remaining}
+            meta['counters'] = [face_list.d_discards, face_list.d_pruned, face_list.d_rejects]
+            meta['placer'] = face_list.placer.state()
+        if self.base is not None:
+            arrays['base'] = self.base
+        arrays['meta'] = np.frombuffer(json.dumps(meta).encode('utf-8'), dtype=np.uint8)
+        # Write to a temporary file and swap it in, so a crash mid-save doesn't wreck the last good checkpoint.
+        temp_name = f'{self.path}.{os.getpid()}.tmp'
+        with open(temp_name, 'wb') as handle:
+            np.savez_compressed(handle, **arrays)
+        os.replace(temp_name, self.path)
+        self.saved_at = time.monotonic()
+
+    def finish(self) -> None:
+        """
+        Remove the checkpoint file once the run has succeeded.
+
+        :return: None
+        :rtype: None
+        """
+        if os.path.exists(self.path):
+            os.remove(self.path)
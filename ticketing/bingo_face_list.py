@@ -1,19 +1,30 @@
-import csv
 import random as rn
-from typing import Set, Tuple, Any
+from dataclasses import dataclass
+from typing import Any
 
+import numpy as np
 from numpy import matrix
 from itertools import product
-from itertools import cycle
-from itertools import permutations
-import time
-
 
+from .face_catalog import get_catalog_file, get_face_catalog
+from .face_pool import FacePool
+from .free_space_placer import FreeSpacePlacer
 from .full_bingo_face import FullBingoFace
+from .path_ledger import PathLedger, encode_paths
 
 spots = [0, 1, 2, 3, 4]
 
-spots_distribution = [[0, 0], [1, 0], [2, 0], [3, 0], [4, 0]]
+
+@dataclass(frozen=True)
+class FaceListCapacity:
+    """Snapshot of how much a BingoFaceList has left to give and how much it has used up."""
+    faces: int
+    lines: int
+    pairs: int
+    paths_taken: int
+    discards: int
+    pruned: int
+    rejects: int
 
 
 class BingoFaceList(object):
@@ -23,12 +34,17 @@ class BingoFaceList(object):
     (face) number and its associated winning bingo lines. There are two different files available:
     the standard file containing 9,000 faces, and an extended file that contains an additional
     18,000 faces. (The csvs may appear incomplete on inspection, but there were duplicate lines
-    and faces throughout, and I was obliged to remove them.)
+    and faces throughout, and I was obliged to remove them.) The csvs are compiled into memory-mapped
+    catalogs (see face_catalog), so creating a list no longer means parsing them.
+
+    The catalog itself is loaded once per process and shared. Each BingoFaceList is just a view of it:
+    its own face order, the lines left on each face, and its paths taken. Creating one for every
+    permutation doesn't copy any face data.
 
     All list-based methods are implemented in this class.
     """
 
-    def __init__(self, extended: bool = False):
+    def __init__(self, extended: bool = False, catalog: str | None = None):
         """
         Represents a container for managing usable faces and paths in a system.
 
@@ -37,77 +53,111 @@ class BingoFaceList(object):
         the five ranges of numbers for each bingo letter; and d_discards are the number of faces that have been
         thrown out when there aren't enough paths remaining.
 
-        :ivar usable_faces: List of faces that can be used in the system.
-        :ivar paths_taken: Set of paths that have been traversed.
+        :ivar catalog: Read-only catalog holding every face and its lines.
+        :ivar usable_faces: Pool of the faces that can be used in the system, along with the lines left on each.
+        :ivar paths_taken: Bitmap ledger of the (integer-encoded) paths that have been traversed.
         :ivar path_replacements: List of replacements for paths.
         :ivar d_discards: Counter for discarded paths.
+        :ivar d_pruned: Counter for lines pruned because their own winning path was already taken.
+        :ivar d_rejects: Counter for candidate faces thrown out because their paths collided with paths taken.
+        :ivar placer: Picks the columns for free spaces, balancing them across the columns of every face it places.
 
         :param extended: Whether to use the extended, usable-faces list. Defaults to False.
         :type extended: bool
-        """
-        self.usable_faces = []
-        self.paths_taken = set()
-        self.import_usable_faces(extended)
+        :param catalog: Compiled catalog file to use instead of the packaged lists (a superset of the standard or
+                        extended faces written by face_generator). Defaults to None.
+        :type catalog: str | None
+        """
+        self.catalog = None
+        self.usable_faces = None
+        self.paths_taken = PathLedger()
+        self.import_usable_faces(extended, catalog=catalog)
         self.path_replacements = []
         self.populate_path_replacements()
         self.d_discards = 0
+        self.d_pruned = 0
+        self.d_rejects = 0
+        self.placer = FreeSpacePlacer()
         self.debug = False
 
-    def import_usable_faces(self, extended: bool = False, reset_paths_taken: bool = False) -> None:
+    def import_usable_faces(self, extended: bool = False, reset_paths_taken: bool = False,
+                            catalog: str | None = None) -> None:
         """
-        Imports usable faces from the correct CSV file, then processes and appends them to a list.
-        Optionally resets paths taken if the permutations will not be played together.
+        Load the usable faces from the compiled (memory-mapped) face catalog and fill the usable faces pool.
+        The pool holds catalog indexes rather than FullBingoFace objects, and the lines still available on
+        each face are tracked by their positions (slots) within the catalog. Optionally resets paths taken if
+        the permutations will not be played together.
 
         :param extended: Specifies whether to use an extended set of faces. If True,
                          use 'usable27000.csv'. Otherwise, use 'usable9000.csv'.
         :type extended: bool
         :param reset_paths_taken: If True, clears the paths_taken list after processing faces.
         :type reset_paths_taken: bool
+        :param catalog: Compiled catalog file to load instead of the packaged lists (see face_generator).
+        :type catalog: str | None
         :return: None
         :rtype: None
         """
-        self.usable_faces = []
-        filename = 'usable9000.csv' if not extended else 'usable27000.csv'
-        # Open usable quotes file for reading
-        file = open(f'./ticketing/{filename}', 'r')
-        lines = file.readlines()
-        temp_face = ''
-        previous_line_id = ''
-        # Cycle through each line of the file
-        for line in lines:
-            # Split the line into a list. The first element contains the face id plus the
-            # location of the line on that face (i.e., 10.1 represents face 10, line 1).
-            # The face id is the only value we care about. The remaining elements represent
-            # the five bingo spots.
-            temp_array = line.strip().split(',')
-            temp_id = temp_array.pop(0).split('.')[0].replace('"', '')
-            # Check if this bingo line belongs to the same face as the previous line.
-            # If it does, add the line to the current face. Otherwise, create a new
-            # face with the new id and current line.
-            if temp_id != previous_line_id:
-                # Update the previous line id to the new id
-                previous_line_id = temp_id
-                # If this isn't the very first iteration and there are more than two
-                # lines on the previous face, append it to the list of usable faces.
-                if temp_face != '' and temp_face.number_of_paths() >= 2:
-                    temp_face.shuffle_paths()
-                    self.usable_faces.append(temp_face)
-                # This is a whole new face, so create it already.
-                temp_face = FullBingoFace(temp_id, temp_array)
-            else:
-                temp_face.add_path(temp_array)
+        self.catalog = get_face_catalog(bool(extended)) if catalog is None else get_catalog_file(catalog)
+        # Every face in the catalog has at least two lines, so all of them are usable.
+        self.usable_faces = FacePool(self.catalog.path_counts)
         if reset_paths_taken:
             self.paths_taken.clear()
 
+    def path_strings(self, face: int, slot: int) -> list[str]:
+        """
+        Return the bingo line stored in the passed slot of a catalog face as a list of number strings.
+
+        :param face: catalog index of the face
+        :type face: int
+        :param slot: position of the line on the face
+        :type slot: int
+        :return: bingo line
+        :rtype: list[str]
+        """
+        return [str(spot) for spot in self.catalog.paths[face, slot].tolist()]
+
+    def build_full_face(self, face: int) -> FullBingoFace:
+        """
+        Create a FullBingoFace containing the lines still available on a catalog face.
+
+        :param face: catalog index of the face
+        :type face: int
+        :return: the face with its remaining lines
+        :rtype: FullBingoFace
+        """
+        slots = self.usable_faces.live_slots(face)
+        full_face = FullBingoFace(self.catalog.verification(face), self.path_strings(face, slots[0]))
+        for slot in slots[1:]:
+            full_face.add_path(self.path_strings(face, slot))
+        return full_face
+
+    def catalog_index(self, face: FullBingoFace) -> int:
+        """
+        Find the catalog index of a FullBingoFace and record its lines as the ones still available on that face.
+
+        :param face: face to look up
+        :type face: FullBingoFace
+        :return: catalog index of the face
+        :rtype: int
+        """
+        index = int(np.searchsorted(self.catalog.ids, int(face.verification())))
+        if index == len(self.catalog) or self.catalog.ids[index] != int(face.verification()):
+            raise ValueError(f"Face {face.verification()} is not in the {self.catalog.source} catalog.")
+        lines = [[int(spot) for spot in path] for path in face.paths]
+        catalog_lines = self.catalog.paths[index].tolist()
+        self.usable_faces.set_slots(index, [slot for slot in range(int(self.catalog.path_counts[index]))
+                                            if catalog_lines[slot] in lines])
+        return index
+
     def shuffle_usable_faces(self) -> None:
         """
-        Shuffle the usable face list between 4 and 25 times.
+        Shuffle the usable face list. (This used to shuffle it between 4 and 25 times, but one
+        uniformly random permutation is every bit as random as twenty-five of them.)
         :return None
         :rtype: None
         """
-        shuffles = rn.randint(4, 25)
-        for x in range(shuffles):
-            rn.shuffle(self.usable_faces)
+        self.usable_faces.shuffle()
 
     def populate_path_replacements(self) -> None:
         """
@@ -130,35 +180,126 @@ class BingoFaceList(object):
                 path.append(f"{((index * 15) + value)}")
             self.path_replacements.append(path)
 
-    def paths_collision_free(self, combos: set[list[str]] | set[tuple[str]]) -> bool:
+    def paths_collision_free(self, combos: np.ndarray | set[tuple[str]]) -> bool:
         """
         Check if the passed bingo paths contain any collisions with previously used paths.
 
-        :param combos: set of all paths to be checked
-        :type combos: set[list[str]] or set[tuple[str]]
+        :param combos: path ids or set of all paths to be checked
+        :type combos: np.ndarray or set[tuple[str]]
         :return: True if no collisions are found; false if one is found.
         :rtype: bool
         """
-        # Cycle through the passed paths
-        for combo in combos:
-            # If a path is already present in the paths-taken set, return False.
-            if tuple(combo) in self.paths_taken:
-                return False
-        # Didn't find a collision, so return True.
-        return True
+        return not self.paths_taken.any_taken(self.path_ids(combos))
+
+    def add_combos_to_paths_taken(self, combos: np.ndarray | set[tuple[str]]) -> None:
+        """
+        Add the passed winning paths to the bingo paths taken.
+
+        :param combos: path ids or set of bingo paths to be added to the bingo paths taken
+        :type combos: np.ndarray or set[tuple[str]]
+        :return: None
+        :rtype: None
+        """
+        self.paths_taken.add(self.path_ids(combos))
+
+    @staticmethod
+    def path_ids(combos: np.ndarray | set[tuple[str]]) -> np.ndarray:
+        """
+        Return the integer path ids for the passed paths. Arrays of integers are assumed to be path ids already;
+        anything else is treated as a collection of five-number bingo paths and encoded.
+
+        :param combos: path ids or collection of bingo paths
+        :type combos: np.ndarray or set[tuple[str]]
+        :return: path ids
+        :rtype: np.ndarray
+        """
+        if isinstance(combos, np.ndarray) and combos.dtype.kind in 'iu' and combos.ndim == 1:
+            return combos
+        combos = list(combos)
+        if len(combos) == 0:
+            return np.empty(0, dtype=np.int64)
+        return encode_paths(combos)
+
+    def draw_path_pair(self, prune: bool = False) -> list[int] | list[None | str]:
+        """
+        Draw a face from the pool and take two of its lines. The face goes back into the pool if it still has more
+        than two lines left. This is the index-based version of get_two_unique_paths_with_verification, for callers
+        that look the lines up in the catalog themselves.
+
+        Every hold built from a line wins on that line itself (a free space matches any number in its column), so
+        once a line's own winning path is taken, the line can never be used in a hold again. When pruning is
+        turned on, those lines are dropped from the face before anything is drawn from it, and a face left with
+        fewer than two lines is discarded without any expansion work being wasted on it. The catalog's line ids
+        make this a single probe of the paths taken bitmap. (Either-ors can keep one line's number out of a
+        column, so they don't prune.)
+
+        :param prune: drop lines whose winning path is already taken
+        :type prune: bool
+        :return: [catalog index, slot1, slot2], or [None, error message] if the faces ran out
+        :rtype: list[int] | list[None | str]
+        """
+        while True:
+            face = self.usable_faces.pop()
+            if face is None:
+                return [None, "!!!!! ERROR: WE'VE RUN OUT OF BINGO FACES! !!!!!"]
+            if prune:
+                self.prune_taken_lines(face)
+            # If this face has fewer than two paths, it's of no use.
+            # Go on to the next one.
+            if self.usable_faces.paths_left(face) < 2:
+                self.d_discards += 1
+                continue
+            # Grab two random paths from the face
+            slot1 = self.usable_faces.take_path(face)
+            slot2 = self.usable_faces.take_path(face)
+            # Check the uniqueness of the spaces. This should never be true (the catalog compiler
+            # already throws out lines like this), but there are a lot of things that shouldn't be
+            # true about the master face list yet somehow are. If there are any matches, put the
+            # paths back and try again. I'm not deleting it outright because it could have other
+            # rows that work.
+            common = self.contains_common_item(self.path_strings(face, slot1), self.path_strings(face, slot2))
+            if common:
+                self.usable_faces.return_path(face, slot2)
+                self.usable_faces.return_path(face, slot1)
+            if self.usable_faces.paths_left(face) > 2:
+                self.usable_faces.push_front(face)
+            if not common:
+                return [face, slot1, slot2]
+
+    def return_path_pair(self, face: int, slot1: int, slot2: int) -> None:
+        """
+        Give back two lines taken by draw_path_pair when the candidate they made was rejected. If the face was
+        left out of the pool when they were drawn, it goes back in at the front (the far end from where faces are
+        drawn), so it won't come straight back around.
+
+        :param face: catalog index of the face
+        :type face: int
+        :param slot1: slot of the first line
+        :type slot1: int
+        :param slot2: slot of the second line
+        :type slot2: int
+        :return: None
+        :rtype: None
+        """
+        self.usable_faces.return_path(face, slot2)
+        self.usable_faces.return_path(face, slot1)
+        if face not in self.usable_faces:
+            self.usable_faces.push_front(face)
 
-    def add_combos_to_paths_taken(self, combos: set[tuple[str]]) -> None:
+    def prune_taken_lines(self, face: int) -> None:
         """
-        Add the passed winning paths to the bingo paths taken. This is kind
-        of excessive, but whatever.
+        Remove the lines of a face whose own winning path has already been taken.
 
-        :param combos: set of bingo paths to be added to the bingo paths taken
-        :type combos: set[list[str]]
+        :param face: catalog index of the face
+        :type face: int
         :return: None
         :rtype: None
         """
-        for combo in combos:
-            self.paths_taken.add(combo)
+        slots = self.usable_faces.live_slots(face)
+        taken = self.paths_taken.taken(self.catalog.line_ids[face, slots])
+        if taken.any():
+            self.usable_faces.set_slots(face, [slot for slot, gone in zip(slots, taken.tolist()) if not gone])
+            self.d_pruned += int(taken.sum())
 
     def get_two_unique_paths_with_verification(self) -> list[str | list[str]] | None:
         """
@@ -168,40 +309,11 @@ class BingoFaceList(object):
         :return: [verification, path1, path2]
         :rtype: list[str | list[str]] | None
         """
-        go_again = True
-        # Set these here so PyCharm will shut the hell up.
-        temp_face, temp_path1, temp_path2 = [None] * 3
-        while go_again:
-            # shuffle_usable_faces()
-            go_again = False
-            try:
-                temp_face = self.usable_faces.pop()
-            except IndexError:
-                return [None, "!!!!! ERROR: WE'VE RUN OUT OF BINGO FACES! !!!!!"]
-            # If this face has fewer than two paths, it's of no use.
-            # Go on to the next one.
-            if temp_face.number_of_paths() < 2:
-                go_again = True
-                self.d_discards += 1
-            else:
-                # We've got to shuffle them paths
-                temp_face.shuffle_paths()
-                # Grab the last two paths in the face's paths' list
-                temp_path1 = temp_face.paths.pop()
-                temp_path2 = temp_face.paths.pop()
-                # Check the uniqueness of the spaces. This should never be true, but there are a lot
-                # of things that shouldn't be true about the master face list yet somehow are. If there
-                # are any matches, reshuffle the faces array and try again. I'm not deleting it outright
-                # because it could have other rows that work.
-                if self.contains_common_item(temp_path1, temp_path2):
-                    temp_face.add_path(temp_path1)
-                    temp_face.add_path(temp_path2)
-                    temp_face.shuffle_paths()
-                    go_again = True
-                #
-                if temp_face.number_of_paths() > 2:
-                    self.usable_faces.insert(0, temp_face)
-        return [temp_face.verification(), temp_path1, temp_path2]
+        drawn = self.draw_path_pair()
+        if drawn[0] is None:
+            return drawn
+        face, slot1, slot2 = drawn
+        return [self.catalog.verification(face), self.path_strings(face, slot1), self.path_strings(face, slot2)]
 
     def create_verification_lists(self, pseudo_face: list[str | list[str]]) -> list[list[str]]:
         """
@@ -259,15 +371,13 @@ class BingoFaceList(object):
 
     def calculate_remaining_bingo_lines(self) -> int:
         """
-        Cycle through the usable faces, add the number of remaining bingo lines together, and return the total.
+        Return the total number of bingo lines left on the usable faces. (The pool keeps a running total, so this
+        no longer cycles through the faces.)
 
         :return: total number of remaining bingo lines
         :rtype: int
         """
-        remaining_lines = 0
-        for face in self.usable_faces:
-            remaining_lines += face.number_of_paths()
-        return remaining_lines
+        return self.usable_faces.remaining_paths()
 
     def number_of_paths_taken(self) -> int:
         """
@@ -278,6 +388,18 @@ class BingoFaceList(object):
         """
         return len(self.paths_taken)
 
+    def capacity(self) -> FaceListCapacity:
+        """
+        Return the face list's running counters. Every one of them is kept up to date as faces are drawn,
+        returned, and committed, so this is cheap enough to poll while faces are being generated.
+
+        :return: faces, lines, and line pairs left; paths taken; and faces or lines discarded, pruned, and rejected
+        :rtype: FaceListCapacity
+        """
+        return FaceListCapacity(len(self.usable_faces), self.usable_faces.remaining_paths(),
+                                self.usable_faces.pairs_left(), len(self.paths_taken), self.d_discards,
+                                self.d_pruned, self.d_rejects)
+
     def get_usable_faces_size(self) -> int:
         """
         Return the total number of usable faces that still contain bingo paths.
@@ -305,7 +427,7 @@ class BingoFaceList(object):
         :return: the first FullBingoFace object
         :rtype: FullBingoFace
         """
-        return None if len(self.usable_faces) == 0 else self.usable_faces.pop(0)
+        return None if len(self.usable_faces) == 0 else self.build_full_face(self.usable_faces.pop_front())
 
     def get_random_face(self) -> FullBingoFace:
         """
@@ -314,8 +436,7 @@ class BingoFaceList(object):
         :return: a random FullBingoFace object
         :rtype: FullBingoFace
         """
-        return None if len(self.usable_faces) == 0 \
-            else self.usable_faces.pop(rn.randint(0, self.get_usable_faces_size() - 1))
+        return None if len(self.usable_faces) == 0 else self.build_full_face(self.usable_faces.pop_random())
 
     def insert_face_randomly(self, face: FullBingoFace) -> None:
         """
@@ -327,8 +448,7 @@ class BingoFaceList(object):
         :rtype: None
         """
         if self.usable_faces is not None:
-            x = rn.randint(0, self.get_usable_faces_size() - 1)
-            self.usable_faces.insert(x, face)
+            self.usable_faces.insert_random(self.catalog_index(face))
 
     def append_face(self, face: FullBingoFace) -> None:
         """
@@ -340,7 +460,7 @@ class BingoFaceList(object):
         :rtype: None
         """
         if self.usable_faces is not None:
-            self.usable_faces.append(face)
+            self.usable_faces.push_back(self.catalog_index(face))
 
     def reset_paths_taken(self) -> None:
         """
@@ -401,13 +521,12 @@ class BingoFaceList(object):
             j = rn.randint(0, i)
             arr[i], arr[j] = arr[j], arr[i]
 
-    @staticmethod
-    def add_free_spaces(face: list[str | list[str]], frees: int, staggered=True) -> list[str | list[str]]:
+    def add_free_spaces(self, face: list[str | list[str]], frees: int, staggered=True) -> list[str | list[str]]:
         """
-        Insert the correct number of free spots into the passed face at random locations.
-        Also, stagger the free spaces when necessary: if there are two lines, the free
-        spaces apply to EITHER the top OR the bottom. The free spots are not connected to
-        one another. A two-free spot face with two lines would look something like this:\n
+        Insert the correct number of free spots into the passed face, in the columns the face list's placer
+        picks (the ones used least so far, ties broken at random). Also, stagger the free spaces when necessary:
+        if there are two lines, the free spaces apply to EITHER the top OR the bottom. The free spots are not
+        connected to one another. A two-free spot face with two lines would look something like this:\n
          [['1', '16', '31', '', '61'],\n
          ['2', '', '36', '54', '65']]\n
         whereas a nonstaggered, two-line, two-free-spot face would look something like:\n
@@ -424,29 +543,16 @@ class BingoFaceList(object):
         :return: pseudo-bingo face with free spaces added
         :rtype: list[str | list[str]]
         """
-        global spots_distribution
         free_marker = ''
-        # spots array represents the columns
-        # Shuffle the columns and use the first and second
-        # positions to randomize the placement of free spaces.
-        # rn.seed(int(time.time()))
-
-        # for i in range(rn.randint(2, 6)):
-        for _ in range(7):
-            rn.shuffle(spots_distribution)
-
-        spots_distribution.sort(key=lambda x: x[1], reverse=False)
+        # The placer hands back the least used columns and counts them as used.
+        columns = self.placer.columns(frees)
         # Figure out how many paths there are and act accordingly
         match len(face) - 1:
             case 1:
                 # A single path will be handled the same way, regardless of
                 # its staggered status.
-                # Add the desired number of free spaces
-                for j in range(frees):
-                    # Use the shuffled spots array to ascertain which space will
-                    # receive the free space marker
-                    face[1][spots_distribution[j][0]] = free_marker
-                    spots_distribution[j][1] += 1
+                for column in columns:
+                    face[1][column] = free_marker
             case 2:
                 # If the spots are staggered, treat the two lines separately.
                 # Otherwise, put free spaces in the same spots on both lines.
@@ -454,63 +560,24 @@ class BingoFaceList(object):
                     # If there are two paths, choose how to handle 1 or 2 free spouts.
                     match frees:
                         case 1:
-                            # For one free spot, pick a random row then set the first random column to empty.
-                            row = rn.randint(1, 2)
-                            face[row][spots_distribution[0][0]] = free_marker
-                            spots_distribution[0][1] += 1
+                            # For one free spot, pick a random row then set the column to empty.
+                            face[self.placer.coin() + 1][columns[0]] = free_marker
                         case 2:
-                            # For two spots, cycle through the rows and use the first two positions to assign empties.
+                            # For two spots, cycle through the rows and give each one a column.
                             for row in range(1, 3):
-                                face[row][spots_distribution[row - 1][0]] = free_marker
-                                spots_distribution[row - 1][1] += 1
+                                face[row][columns[row - 1]] = free_marker
                         case 3:
-                            starter = rn.randint(0, 1)
-                            for row in range(1, 4):
-                                face[starter + 1][spots_distribution[row - 1][0]] = free_marker
+                            # Alternate rows, starting with a random one.
+                            starter = self.placer.coin()
+                            for column in columns:
+                                face[starter + 1][column] = free_marker
                                 starter = 1 if starter == 0 else 0
                 else:
                     # For non-staggered free spaces, blank out the spots on both paths.
-                    for free in range(frees):
-                        face[1][spots_distribution[free][0]] = free_marker
-                        face[2][spots_distribution[free][0]] = free_marker
-                        spots_distribution[free][1] += 1
+                    for column in columns:
+                        face[1][column] = free_marker
+                        face[2][column] = free_marker
         return face
 
     def set_debug(self, bugging):
         self.debug = bugging
-
-    # def import_usable_faces_csv(self, extended: bool = False, reset_paths_taken: bool = False) -> None:
-    #     """
-    #     Import the usable bingo faces from a file and place them into a list. The data
-    #     includes the verification (face id) number and available bingo paths. Use the
-    #     csv library for code clarity.
-    #
-    #     :param extended: use extended (27,000) instead of the standard (9,000) face csv file
-    #     :type extended: bool
-    #     :param reset_paths_taken: Should the paths-taken set be cleared?
-    #     :type reset_paths_taken: bool
-    #     :return: None
-    #     :rtype: None
-    #     """
-    #     self.usable_faces = []
-    #     filename = 'usable9000.csv' if not extended else 'usable27000.csv'
-    #
-    #     with open(f'./ticketing/{filename}') as file:
-    #         reader = csv.reader(file)
-    #         temp_face = ''
-    #         previous_line_id = ''
-    #
-    #         for row in reader:
-    #             temp_id = row[0].split('.')[0].replace('"', '')  # Extract face id
-    #
-    #             if temp_id != previous_line_id:
-    #                 previous_line_id = temp_id
-    #                 if temp_face != '' and temp_face.number_of_paths() >= 2:
-    #                     temp_face.shuffle_paths()
-    #                     self.usable_faces.append(temp_face)
-    #                 temp_face = FullBingoFace(temp_id, row[1:])  # Pass remaining elements as bingo spots
-    #             else:
-    #                 temp_face.add_path(row[1:])
-    #
-    #     if reset_paths_taken:
-    #         self.paths_taken.clear()
@@ -0,0 +1,283 @@
+"""
+Feasibility planner for verified bingo hold mixes.
+
+Generating verified bingos can take minutes, and a mix that asks for too much only finds out when the faces run dry.
+This module predicts the outcome before anything is generated, in a few milliseconds, so the GUI can report it when
+the game's specifications are verified.
+
+The prediction is built from two budgets and one estimate:
+
+|  path budget:   every face uses up its winning paths (13,500 for a two-line hold with three free spaces, 3,375
+|                 for a one-line hold with three, 1,800, 240, and so on), and all of them share 15^5 = 759,375
+|  face supply:   every face uses up a pair of lines from the face catalog
+|  draw estimate: how many pairs must be drawn to find collision-free faces as the paths fill up
+
+The draw estimate assumes a face type's acceptance rate falls off as (1 - fill) ** rate, where fill is the share of
+the path space the job has used so far. Each type's rate is fitted so that it reproduces the number of faces of that
+type a fresh face list could make on its own (CAPACITY, measured with measure_capacity). Paths used by the other types
+in the mix only count for INTERFERENCE as much, since free-space sweeps pack into different parts of the path space
+than fixed lines do. The risk score is the estimated number of draws divided by the number of pairs in the catalog:
+below 1, the job should finish; above it, the faces will probably run out. Acceptance collapses so quickly near
+the end that a job's luck decides it well before 1, though, so the levels reported are set lower (see HIGH_RISK).
+"""
+import contextlib
+import io
+import math
+import random as rn
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+import numpy as np
+
+from .bingo_schedule import FACE_TYPES, FaceType, ScheduledJob, build_jobs, by_path_demand
+from .face_catalog import get_face_catalog
+from .path_ledger import PATH_SPACE
+
+# Faces of each type that a fresh face list can make before it runs dry, for the standard and extended catalogs.
+# Measured with measure_capacity (in steps of ten), taking the worst of the CAPACITY_SEEDS shuffles, since the
+# same type can come up a third short from one shuffle to the next. (The extended catalog's sloef1 and sloef0 rows
+# take hours to measure that way and are from a single shuffle.)
+CAPACITY = {
+    False: {'sloef2d2': 370, 'sloef2d1': 950, 'sloef1d2': 3670, 'sloef1d1': 7860, 'sloef0d2': 8990, 'sloef0d1': 8990,
+            'sloef0d3': 8990, 'nsd3': 30, 'nsd2': 70, 'nsd1': 390, 'nsd0': 2110, 'sd3': 20, 'sd2': 70, 'sd1': 390,
+            'sd0': 2110, 'nss3': 130, 'nss2': 1060, 'nss1': 8010, 'nss0': 8990, 'ss3': 130, 'ss2': 1060,
+            'ss1': 8010, 'ss0': 8990},
+    True: {'sloef2d2': 460, 'sloef2d1': 1040, 'sloef1d2': 4450, 'sloef1d1': 10800, 'sloef0d2': 26980, 'sloef0d1': 26980,
+           'sloef0d3': 26820, 'nsd3': 30, 'nsd2': 100, 'nsd1': 450, 'nsd0': 2980, 'sd3': 30, 'sd2': 100, 'sd1': 450,
+           'sd0': 2980, 'nss3': 140, 'nss2': 1170, 'nss1': 15170, 'nss0': 26980, 'ss3': 140, 'ss2': 1170,
+           'ss1': 15170, 'ss0': 26980},
+}
+CAPACITY_SEEDS = (1, 2, 3, 4, 5)
+# Share of the other types' paths that counts against a face type's fill.
+INTERFERENCE = 0.1
+# Risk scores at or above these levels are reported as moderate and high. Set against real four-permutation jobs of
+# each hold type at 50 - 100% of CAPACITY: every job that failed scored 0.8 or more, except for the three-free
+# single lines, which started failing now and then from about 0.25.
+MODERATE_RISK = 0.25
+HIGH_RISK = 0.8
+
+
+@dataclass
+class FeasibilityReport:
+    """Predicted outcome of a verified bingo job."""
+    feasible: bool
+    risk: float
+    path_budget: int
+    faces_needed: int
+    face_supply: int
+    expected_draws: float
+    budgets: list[tuple[str, int, int]] = field(default_factory=list)
+    problems: list[str] = field(default_factory=list)
+
+    @property
+    def path_space(self) -> int:
+        return PATH_SPACE
+
+    @property
+    def risk_level(self) -> str:
+        if not self.feasible or self.risk >= HIGH_RISK:
+            return 'HIGH'
+        return 'MODERATE' if self.risk >= MODERATE_RISK else 'LOW'
+
+    def summary(self) -> str:
+        """
+        Describe the prediction in a few lines of text for the GUI.
+
+        :return: summary of the report
+        :rtype: str
+        """
+        lines = ['Verified Bingo Feasibility:']
+        for description, faces, paths in self.budgets:
+            lines.append(f"  {faces:,} {description}: {paths:,} paths")
+        lines.append(f"Path Budget: {self.path_budget:,} of {self.path_space:,} "
+                     f"({self.path_budget / self.path_space:.1%})")
+        lines.append(f"Faces Needed: {self.faces_needed:,} of {self.face_supply:,} line pairs")
+        risk = 'n/a' if math.isinf(self.risk) else f"{self.risk:.2f}"
+        lines.append(f"Risk: {self.risk_level} ({risk})")
+        lines += [f"!!!!! {problem} !!!!!" for problem in self.problems]
+        return '\n'.join(lines)
+
+
+def face_supply(extended: bool) -> int:
+    """
+    Return the number of line pairs a fresh face list can hand out (faces give up their lines two at a time).
+
+    :param extended: use the extended catalog
+    :type extended: bool
+    :return: line pairs in the catalog
+    :rtype: int
+    """
+    return int((np.asarray(get_face_catalog(extended).path_counts) // 2).sum(dtype=np.int64))
+
+
+def draws_needed(faces: int, paths: int, rate: float, start: float = 0.0) -> float:
+    """
+    Estimate the number of pairs that must be drawn to make a run of faces, when the acceptance rate is
+    (1 - fill) ** rate and each accepted face adds its paths to the fill.
+
+    :param faces: number of faces to make
+    :type faces: int
+    :param paths: winning paths per face
+    :type paths: int
+    :param rate: how quickly acceptance falls off as the fill rises
+    :type rate: float
+    :param start: fill when the run begins
+    :type start: float
+    :return: estimated draws (infinite if the faces can't fit)
+    :rtype: float
+    """
+    fill = start + np.arange(faces) * (paths / PATH_SPACE)
+    if faces > 0 and fill[-1] >= 1:
+        return math.inf
+    with np.errstate(over='ignore'):
+        return float(np.sum(np.exp(-rate * np.log1p(-fill))))
+
+
+@lru_cache(maxsize=None)
+def decay_rates(extended: bool) -> dict[str, float]:
+    """
+    Fit each face type's acceptance rate so that making CAPACITY faces of that type, starting from an empty
+    ledger, uses up the catalog's line pairs. (This is a closed-form integral of draws_needed.)
+
+    :param extended: use the extended catalog
+    :type extended: bool
+    :return: decay rate for each face type
+    :rtype: dict[str, float]
+    """
+    supply = face_supply(extended)
+    capacity = CAPACITY[extended]
+    rates = {}
+    for face_type in FACE_TYPES:
+        # A type that made a face from every pair never slowed down at all.
+        if capacity[face_type.key] >= supply:
+            rates[face_type.key] = 0.0
+            continue
+        step = face_type.paths / PATH_SPACE
+        end = 1 - min(capacity[face_type.key] * step, 1 - 1e-9)
+
+        # The integral is (end ** (1 - rate) - 1) / (step * (rate - 1)), which overflows long before the fit is
+        # done, so work with its logarithm.
+        def log_draws(rate):
+            if abs(rate - 1) < 1e-9:
+                return math.log(-math.log(end) / step)
+            power = (1 - rate) * math.log(end)
+            grown = power + math.log1p(-math.exp(-power)) if power > 30 else math.log(abs(math.expm1(power)))
+            return grown - math.log(step * abs(rate - 1))
+
+        low, high = 1e-6, 1e4
+        for _ in range(100):
+            middle = math.sqrt(low * high)
+            if log_draws(middle) > math.log(supply):
+                high = middle
+            else:
+                low = middle
+        rates[face_type.key] = low
+    return rates
+
+
+def plan_bingo_jobs(jobs: list[ScheduledJob], permutations: int, reset: bool,
+                    extended: bool = False) -> FeasibilityReport:
+    """
+    Predict whether a list of scheduled bingo jobs can be generated.
+
+    :param jobs: face types and the number of faces each permutation needs
+    :type jobs: list[ScheduledJob]
+    :param permutations: number of permutations
+    :type permutations: int
+    :param reset: is the face list reset for each permutation?
+    :type reset: bool
+    :param extended: use the extended catalog
+    :type extended: bool
+    :return: the prediction
+    :rtype: FeasibilityReport
+    """
+    # With a reset, every permutation gets a fresh face list and ledger of its own, so only one of them needs to
+    # fit. Otherwise, all of them share the same ones.
+    sharing = 1 if reset or permutations == 1 else permutations
+    rates = decay_rates(extended)
+    supply = face_supply(extended)
+    budgets = []
+    draws = 0.0
+    others = 0.0
+    for job in by_path_demand(jobs):
+        face_type = job.face_type
+        faces = job.amount * sharing
+        budgets.append((face_type.description, faces, faces * face_type.paths))
+        draws += draws_needed(faces, face_type.paths, rates[face_type.key], INTERFERENCE * others)
+        others += faces * face_type.paths / PATH_SPACE
+    path_budget = sum(paths for _, _, paths in budgets)
+    faces_needed = sum(faces for _, faces, _ in budgets)
+
+    problems = []
+    if path_budget > PATH_SPACE:
+        problems.append(f"THE MIX NEEDS {path_budget:,} WINNING PATHS, BUT THERE ARE ONLY {PATH_SPACE:,}")
+    if faces_needed > supply:
+        problems.append(f"THE MIX NEEDS {faces_needed:,} FACES, BUT THE CATALOG ONLY HAS {supply:,} LINE PAIRS")
+    # Running out of paths or faces is certain failure. A high risk score is only a warning, since the estimate can
+    # be off and a lucky shuffle can still get there.
+    feasible = len(problems) == 0
+    risk = draws / supply if supply > 0 else math.inf
+    if feasible and risk >= HIGH_RISK:
+        problems.append("THE BINGO FACES WILL PROBABLY RUN OUT BEFORE THE JOB IS DONE")
+    return FeasibilityReport(feasible, risk, path_budget, faces_needed, supply, draws, budgets, problems)
+
+
+def plan_bingo_holds(hold_ticket, permutations: int, reset: bool) -> FeasibilityReport:
+    """
+    Predict whether the verified bingos for a HoldBingosTicket can be generated.
+
+    :param hold_ticket: hold specifications (dns_counts, ds_counts, sns_counts, ss_counts, either_ors)
+    :type hold_ticket: HoldBingosTicket
+    :param permutations: number of permutations
+    :type permutations: int
+    :param reset: is the face list reset for each permutation?
+    :type reset: bool
+    :return: the prediction
+    :rtype: FeasibilityReport
+    """
+    needs = [hold_ticket.dns_counts, hold_ticket.ds_counts, hold_ticket.sns_counts, hold_ticket.ss_counts,
+             hold_ticket.either_ors or [[0, 0, 0]]]
+    extended = hold_ticket.extended_csv == 'E' or hold_ticket.extended_csv is True
+    return plan_bingo_jobs(build_jobs(needs), permutations, reset, extended)
+
+
+def measure_capacity(face_type: FaceType, extended: bool = False, step: int = 10, seed: int = 1) -> int:
+    """
+    Count the faces of one type a fresh face list can make before it runs dry. This is how the CAPACITY table
+    is measured. (It runs the real generators, so it can take a minute or two for some types.)
+
+    :param face_type: face type to measure
+    :type face_type: FaceType
+    :param extended: use the extended catalog
+    :type extended: bool
+    :param step: number of faces requested at a time
+    :type step: int
+    :param seed: seed for the random number generator
+    :type seed: int
+    :return: number of faces made
+    :rtype: int
+    """
+    # Imported here because verified_bingo is the thing being measured, not something the planner needs.
+    from .bingo_face_list import BingoFaceList
+    from .verified_bingo import create_scheduled_faces
+
+    rn.seed(seed)
+    face_list = BingoFaceList(extended)
+    face_list.shuffle_usable_faces()
+    job = ScheduledJob(face_type, step, [step, face_type.frees, face_type.either_ors])
+    made = 0
+    with contextlib.redirect_stdout(io.StringIO()):
+        while True:
+            faces = create_scheduled_faces(face_list, job, 3)
+            if len(faces) > 0 and faces[0] is None:
+                return made
+            made += len(faces)
+
+
+if __name__ == '__main__':
+    # Re-measure the capacity table for the standard catalog (or the extended one with 'extended').
+    measure_extended = sys.argv[1:] == ['extended']
+    for measured in FACE_TYPES:
+        worst = min(measure_capacity(measured, measure_extended, seed=seed) for seed in CAPACITY_SEEDS)
+        print(f"'{measured.key}': {worst},", flush=True)
@@ -0,0 +1,137 @@
+"""
+The kinds of verified bingo faces the generators can create, and the order they get created in.
+
+Every hold ticket (one or two lines, staggered or not, zero to three free spaces) and every single-line either-or
+(zero to two free spaces, one to three either-or spots) is described by an entry in FACE_TYPES. The entries are
+listed in the order their faces appear in a finished permutation. The order they are *generated* in is up to an
+ordering strategy: the faces that produce the most winning paths are the hardest to place, so the default strategy
+starts with them while the face list is still wide open.
+
+An ordering strategy is any callable that takes the list of jobs (face types with their requested amounts) and
+returns them in the order they should be run, so trying a different order doesn't mean touching the generators.
+"""
+from collections.abc import Callable
+from dataclasses import dataclass
+
+COLUMNS = 5
+COLUMN_SIZE = 15
+FREE_WORDS = ['no free spaces', 'one free space', 'two free spaces', 'three free spaces']
+SPOT_WORDS = ['no either-or spots', 'one either-or spot', 'two either-or spots', 'three either-or spots']
+
+
+@dataclass(frozen=True)
+class FaceType:
+    """One kind of bingo face the generators know how to create."""
+    key: str
+    frees: int
+    lines: int = 1
+    staggered: bool = False
+    either_ors: int = 0
+
+    @property
+    def is_either_or(self) -> bool:
+        return self.either_ors > 0
+
+    @property
+    def paths(self) -> int:
+        """Number of winning paths a single face of this type produces."""
+        if self.is_either_or:
+            return (COLUMN_SIZE ** self.frees) * (2 ** self.either_ors)
+        return (COLUMN_SIZE ** self.frees) * (self.lines ** (COLUMNS - self.frees))
+
+    @property
+    def description(self) -> str:
+        """Plain-English name of the face type used in status messages."""
+        if self.is_either_or:
+            return f"single-line either-ors with {FREE_WORDS[self.frees]} and {SPOT_WORDS[self.either_ors]}"
+        return (f"{'staggered' if self.staggered else 'non-staggered'}, "
+                f"{'double' if self.lines == 2 else 'single'}-line holds with {FREE_WORDS[self.frees]}")
+
+
+@dataclass
+class ScheduledJob:
+    """A face type along with the number of faces each permutation needs."""
+    face_type: FaceType
+    amount: int
+    deets: list[int]
+
+
+def hold_types(lines: int, staggered: bool) -> list[FaceType]:
+    """
+    Return the hold face types for one line count and staggering, from three free spaces down to none.
+
+    :param lines: number of lines on the hold (1 or 2)
+    :type lines: int
+    :param staggered: are the free spaces staggered?
+    :type staggered: bool
+    :return: hold face types
+    :rtype: list[FaceType]
+    """
+    prefix = f"{'s' if staggered else 'ns'}{'d' if lines == 2 else 's'}"
+    # A double-line hold without free spaces has nothing to stagger. The generators have always made both
+    # versions as non-staggered faces, so keep doing that.
+    return [FaceType(f"{prefix}{frees}", frees, lines, staggered and (lines == 1 or frees > 0))
+            for frees in range(3, -1, -1)]
+
+
+# Either-ors come first in a finished permutation, followed by each group of holds (most free spaces first).
+EITHER_OR_TYPES = [FaceType(f"sloef{frees}d{spots}", frees, either_ors=spots)
+                   for frees, spots in [(2, 2), (2, 1), (1, 2), (1, 1), (0, 2), (0, 1), (0, 3)]]
+HOLD_GROUPS = [hold_types(2, False), hold_types(2, True), hold_types(1, False), hold_types(1, True)]
+FACE_TYPES = EITHER_OR_TYPES + [face_type for group in HOLD_GROUPS for face_type in group]
+
+
+def build_jobs(bingo_amts: list[list[int] | list[list[int]] | bool | str]) -> list[ScheduledJob]:
+    """
+    Turn the bingo requirements passed to the generators into a list of jobs, in FACE_TYPES order. Face types that
+    aren't needed are left out.
+
+    :param bingo_amts: number of faces needed for each hold group (indexed by free spaces) and the either-or specs
+    :type bingo_amts: list[list[int] | list[list[int]] | bool | str]
+    :return: jobs for every face type that is needed
+    :rtype: list[ScheduledJob]
+    """
+    # The first four entries are the non-staggered doubles, staggered doubles, non-staggered singles, and
+    # staggered singles. The fifth lists the either-ors as [amount, free spaces, either-or spots].
+    hold_amts = bingo_amts[:4]
+    either_ors = {}
+    if bingo_amts[4][0][0] != 0:
+        for sloe in bingo_amts[4]:
+            either_ors[f"sloef{sloe[1]}d{sloe[2]}"] = sloe
+
+    jobs = []
+    for face_type in EITHER_OR_TYPES:
+        if face_type.key in either_ors and either_ors[face_type.key][0] > 0:
+            jobs.append(ScheduledJob(face_type, either_ors[face_type.key][0], either_ors[face_type.key]))
+    for amts, group in zip(hold_amts, HOLD_GROUPS):
+        for face_type in group:
+            if amts[face_type.frees] > 0:
+                jobs.append(ScheduledJob(face_type, amts[face_type.frees], []))
+    return jobs
+
+
+def by_path_demand(jobs: list[ScheduledJob]) -> list[ScheduledJob]:
+    """
+    Order jobs by the number of winning paths each of their faces produces, most first. Ties keep FACE_TYPES order.
+
+    :param jobs: jobs to order
+    :type jobs: list[ScheduledJob]
+    :return: ordered jobs
+    :rtype: list[ScheduledJob]
+    """
+    return sorted(jobs, key=lambda job: -job.face_type.paths)
+
+
+def by_total_demand(jobs: list[ScheduledJob]) -> list[ScheduledJob]:
+    """
+    Order jobs by the total number of winning paths they need (paths per face times faces), most first.
+
+    :param jobs: jobs to order
+    :type jobs: list[ScheduledJob]
+    :return: ordered jobs
+    :rtype: list[ScheduledJob]
+    """
+    return sorted(jobs, key=lambda job: -job.face_type.paths * job.amount)
+
+
+OrderingStrategy = Callable[[list[ScheduledJob]], list[ScheduledJob]]
@@ -0,0 +1,152 @@
+"""
+Statistics for verified bingo runs.
+
+The face list keeps running counters for everything it does (faces drawn and rejected, faces discarded, lines
+pruned, paths taken; see BingoFaceList.capacity). Reading them before and after a face type is made for a
+permutation shows what that job cost:
+
+|  attempts:  candidate faces drawn (every one of them is either used or rejected)
+|  rejects:   candidates thrown out because their paths collided with paths already taken
+|  discards:  faces thrown out of the pool because they didn't have enough lines left
+|  pruned:    lines dropped because their own winning path was already taken
+|  paths:     winning paths added to the paths taken ledger
+|  seconds:   wall time
+
+A GenerationStats collects one TypeStats for every job a run does, so the face type that's holding a work order
+back (the slowest one, or the one throwing out the most candidates) is easy to pick out.
+"""
+from dataclasses import dataclass, field
+
+from .bingo_face_list import FaceListCapacity
+
+
+@dataclass
+class TypeStats:
+    """What it cost to make one permutation's faces of one type (or a total of them)."""
+    face_type: str
+    permutation: int | None
+    faces: int = 0
+    attempts: int = 0
+    rejects: int = 0
+    discards: int = 0
+    pruned: int = 0
+    paths: int = 0
+    seconds: float = 0.0
+
+    @property
+    def faces_per_second(self) -> float:
+        """Faces made per second of wall time."""
+        return self.faces / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def reject_rate(self) -> float:
+        """Share of the candidates drawn that were thrown out."""
+        return self.rejects / self.attempts if self.attempts > 0 else 0.0
+
+    def add(self, other: 'TypeStats') -> None:
+        """
+        Add another job's numbers to these.
+
+        :param other: statistics to add
+        :type other: TypeStats
+        :return: None
+        :rtype: None
+        """
+        self.faces += other.faces
+        self.attempts += other.attempts
+        self.rejects += other.rejects
+        self.discards += other.discards
+        self.pruned += other.pruned
+        self.paths += other.paths
+        self.seconds += other.seconds
+
+
+@dataclass
+class GenerationStats:
+    """Statistics for every job a verified bingo run did, in the order they finished."""
+    jobs: list[TypeStats] = field(default_factory=list)
+
+    def record(self, face_type: str, permutation: int, faces: int, before: FaceListCapacity,
+               after: FaceListCapacity, seconds: float) -> TypeStats:
+        """
+        Add a job, working out what it cost from the face list's counters before and after it ran.
+
+        :param face_type: key of the face type
+        :type face_type: str
+        :param permutation: index of the permutation
+        :type permutation: int
+        :param faces: number of faces the job made (0 if it failed)
+        :type faces: int
+        :param before: face list counters before the job
+        :type before: FaceListCapacity
+        :param after: face list counters after the job
+        :type after: FaceListCapacity
+        :param seconds: wall time
+        :type seconds: float
+        :return: the job's statistics
+        :rtype: TypeStats
+        """
+        rejects = after.rejects - before.rejects
+        job = TypeStats(face_type, permutation, faces, faces + rejects, rejects, after.discards - before.discards,
+                        after.pruned - before.pruned, after.paths_taken - before.paths_taken, seconds)
+        self.jobs.append(job)
+        return job
+
+    def extend(self, other: 'GenerationStats') -> None:
+        """
+        Add the jobs from another run (a worker process's permutation, for instance).
+
+        :param other: statistics to add
+        :type other: GenerationStats
+        :return: None
+        :rtype: None
+        """
+        self.jobs += other.jobs
+
+    def by_type(self) -> dict[str, TypeStats]:
+        """
+        Total the jobs for each face type, across every permutation.
+
+        :return: totals keyed by face type, in the order the types were first made
+        :rtype: dict[str, TypeStats]
+        """
+        totals = {}
+        for job in self.jobs:
+            totals.setdefault(job.face_type, TypeStats(job.face_type, None)).add(job)
+        return totals
+
+    def total(self) -> TypeStats:
+        """
+        Total every job in the run.
+
+        :return: totals
+        :rtype: TypeStats
+        """
+        total = TypeStats('all', None)
+        for job in self.jobs:
+            total.add(job)
+        return total
+
+    def bottleneck(self) -> TypeStats | None:
+        """
+        Return the face type that took up the most wall time (None if nothing has been recorded).
+
+        :return: totals for the slowest face type
+        :rtype: TypeStats | None
+        """
+        totals = self.by_type()
+        return max(totals.values(), key=lambda stats: stats.seconds) if totals else None
+
+    def summary(self) -> str:
+        """
+        Describe the run a face type per line, slowest type first.
+
+        :return: summary of the statistics
+        :rtype: str
+        """
+        lines = ['Verified Bingo Statistics:']
+        for stats in sorted(self.by_type().values(), key=lambda item: item.seconds, reverse=True) + [self.total()]:
+            lines.append(f"  {stats.face_type}: {stats.faces:,} faces from {stats.attempts:,} attempts "
+                         f"({stats.reject_rate:.1%} rejected), {stats.discards:,} discarded, {stats.paths:,} paths, "
+                         f"{stats.seconds:.2f}s ({stats.faces_per_second:,.0f} faces/sec)")
+        return '\n'.join(lines)
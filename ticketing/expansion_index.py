@@ -0,0 +1,204 @@
+"""
+Precomputed building blocks for expanding pseudo-faces into their winning path ids.
+
+Every winning path of a pseudo-face is a sum of one digit from each column (see path_ledger), so a face's paths split
+into two independent parts: the columns with a free space, which sweep through all fifteen of their digits, and the
+fixed columns, which take a digit from one of the face's lines. Neither part depends on which numbers are on the face:
+
+|  sweeps:     for each free-column pattern, every sum of free-column digits (15^frees ids)
+|  selectors:  for each free-column pattern and line count, every way of picking a line for each fixed column
+
+Both are stored once, as offsets into a shared array, so expanding a candidate comes down to adding the chosen lines'
+column values to a slice of the sweep array. The tables are written into the compiled face catalog next to the
+catalog's own line ids (see face_catalog).
+"""
+from itertools import product
+
+import numpy as np
+
+from .path_ledger import COLUMNS, COLUMN_SIZE, PLACE_VALUES
+
+# Free-column patterns are bitmasks with bit c set when column c holds a free space.
+PATTERNS = 1 << COLUMNS
+# No face has more than three free spaces, so larger patterns are left out of the tables.
+MAX_FREES = 3
+MAX_LINES = 2
+
+
+def free_count(pattern: int) -> int:
+    """
+    Return the number of free columns in a pattern.
+
+    :param pattern: free-column bitmask
+    :type pattern: int
+    :return: number of free columns
+    :rtype: int
+    """
+    return bin(pattern).count('1')
+
+
+def build_sweeps() -> tuple[np.ndarray, np.ndarray]:
+    """
+    Build the sweep table: for every pattern with MAX_FREES or fewer free columns, the path id contribution of every
+    combination of digits in those columns.
+
+    :return: offsets into the sweep ids (one more than the number of patterns) and the sweep ids
+    :rtype: tuple[np.ndarray, np.ndarray]
+    """
+    offsets = [0]
+    sweeps = []
+    for pattern in range(PATTERNS):
+        if free_count(pattern) <= MAX_FREES:
+            free = [column for column in range(COLUMNS) if pattern & (1 << column)]
+            sweeps += [sum(int(PLACE_VALUES[column]) * digit for column, digit in zip(free, digits))
+                       for digits in product(range(COLUMN_SIZE), repeat=len(free))]
+        offsets.append(len(sweeps))
+    return np.array(offsets, dtype=np.int32), np.array(sweeps, dtype=np.int32)
+
+
+def build_selectors() -> tuple[np.ndarray, np.ndarray]:
+    """
+    Build the selector table: for every line count and pattern, one row for each way of choosing which line supplies
+    the digit of each fixed column. Free columns always select line zero (their value is ignored).
+
+    :return: offsets into the selector rows (line counts x patterns + 1) and the selector rows (rows x 5)
+    :rtype: tuple[np.ndarray, np.ndarray]
+    """
+    offsets = np.zeros((MAX_LINES, PATTERNS + 1), dtype=np.int32)
+    rows = []
+    for lines in range(1, MAX_LINES + 1):
+        for pattern in range(PATTERNS):
+            offsets[lines - 1, pattern] = len(rows)
+            if free_count(pattern) <= MAX_FREES:
+                fixed = [column for column in range(COLUMNS) if not pattern & (1 << column)]
+                for choice in product(range(lines), repeat=len(fixed)):
+                    row = [0] * COLUMNS
+                    for column, line in zip(fixed, choice):
+                        row[column] = line
+                    rows.append(row)
+        offsets[lines - 1, PATTERNS] = len(rows)
+    return offsets, np.array(rows, dtype=np.int8).reshape(-1, COLUMNS)
+
+
+class ExpansionIndex(object):
+    """
+    Sweep and selector tables used to turn a batch of candidate faces into their winning path ids without building
+    any products.
+    """
+
+    def __init__(self, sweep_offsets: np.ndarray, sweep_ids: np.ndarray, selector_offsets: np.ndarray,
+                 selectors: np.ndarray):
+        """
+        :param sweep_offsets: start of each pattern's sweep in sweep_ids (patterns + 1)
+        :type sweep_offsets: np.ndarray
+        :param sweep_ids: path id contributions of the free columns for every pattern
+        :type sweep_ids: np.ndarray
+        :param selector_offsets: start of each line count and pattern's rows in selectors
+        :type selector_offsets: np.ndarray
+        :param selectors: line chosen for each column (rows x 5)
+        :type selectors: np.ndarray
+        """
+        self.sweep_offsets = sweep_offsets
+        self.sweep_ids = sweep_ids
+        self.selector_offsets = selector_offsets
+        self.selectors = selectors
+
+    @classmethod
+    def build(cls) -> 'ExpansionIndex':
+        """
+        Build a fresh set of tables.
+
+        :return: expansion index
+        :rtype: ExpansionIndex
+        """
+        return cls(*build_sweeps(), *build_selectors())
+
+    def sweep(self, pattern: int) -> np.ndarray:
+        """
+        Return the free-column contributions for a pattern.
+
+        :param pattern: free-column bitmask
+        :type pattern: int
+        :return: slice of the sweep ids
+        :rtype: np.ndarray
+        """
+        if free_count(pattern) > MAX_FREES:
+            raise ValueError(f"Faces can't have more than {MAX_FREES} free spaces.")
+        return self.sweep_ids[self.sweep_offsets[pattern]:self.sweep_offsets[pattern + 1]]
+
+    def selector(self, lines: int, pattern: int) -> np.ndarray:
+        """
+        Return the line choices for the fixed columns of a pattern.
+
+        :param lines: number of lines on the face (1 or 2)
+        :type lines: int
+        :param pattern: free-column bitmask
+        :type pattern: int
+        :return: slice of the selector rows
+        :rtype: np.ndarray
+        """
+        return self.selectors[self.selector_offsets[lines - 1, pattern]:self.selector_offsets[lines - 1, pattern + 1]]
+
+    def expand(self, line_ids: np.ndarray, patterns: np.ndarray) -> np.ndarray:
+        """
+        Expand a batch of candidates into their winning path ids. Every candidate must have the same number of
+        free columns, so they all produce the same number of paths.
+
+        :param line_ids: path ids of each candidate's lines (candidates x lines)
+        :type line_ids: np.ndarray
+        :param patterns: free-column bitmask of each candidate
+        :type patterns: np.ndarray
+        :return: path ids for each candidate (candidates x paths)
+        :rtype: np.ndarray
+        """
+        line_ids = np.asarray(line_ids, dtype=np.int64)
+        patterns = np.asarray(patterns, dtype=np.int64)
+        candidates, lines = line_ids.shape
+        if candidates == 0:
+            return np.empty((0, 0), dtype=np.int64)
+        frees = {free_count(int(pattern)) for pattern in np.unique(patterns)}
+        if len(frees) > 1:
+            raise ValueError("Every candidate in a batch must produce the same number of winning paths.")
+        # values[n, l, c] is the path id contribution of column c of candidate n's line l.
+        values = (line_ids[:, :, None] // PLACE_VALUES) % COLUMN_SIZE * PLACE_VALUES
+        columns = np.arange(COLUMNS)
+        path_ids = None
+        for pattern in np.unique(patterns).tolist():
+            rows = np.flatnonzero(patterns == pattern)
+            fixed = ((pattern >> columns) & 1) == 0
+            selector = self.selector(lines, pattern)
+            partial = (values[rows][:, selector, columns] * fixed).sum(axis=2)
+            block = (partial[:, :, None] + self.sweep(pattern)[None, None, :]).reshape(len(rows), -1)
+            if path_ids is None:
+                path_ids = np.empty((candidates, block.shape[1]), dtype=np.int64)
+            path_ids[rows] = block
+        return path_ids
+
+    def expand_either_or(self, line_ids: np.ndarray, doubles: int, frees: int) -> np.ndarray:
+        """
+        Expand a batch of single-line either-or candidates into their winning path ids, for one arrangement of
+        double and free spots. Each candidate is a pair of lines. A double column can be won with either line's
+        number, a free column with any of its fifteen, and the single columns take their number from the first and
+        second line in turn (left to right).
+
+        :param line_ids: path ids of each candidate's two lines (candidates x 2)
+        :type line_ids: np.ndarray
+        :param doubles: bitmask of the double columns
+        :type doubles: int
+        :param frees: bitmask of the free columns
+        :type frees: int
+        :return: path ids for each candidate (candidates x (2^doubles x 15^frees))
+        :rtype: np.ndarray
+        """
+        line_ids = np.asarray(line_ids, dtype=np.int64)
+        values = (line_ids[:, :, None] // PLACE_VALUES) % COLUMN_SIZE * PLACE_VALUES
+        double_columns = [column for column in range(COLUMNS) if doubles & (1 << column)]
+        single_columns = [column for column in range(COLUMNS) if not (doubles | frees) & (1 << column)]
+        partial = np.zeros((len(line_ids), 1), dtype=np.int64)
+        for position, column in enumerate(single_columns):
+            partial += values[:, position % 2, column, None]
+        if len(double_columns) > 0:
+            # Every way of picking one line's number for each double column.
+            choices = np.array(list(product(range(2), repeat=len(double_columns))))
+            partial = partial + values[:, choices, double_columns].sum(axis=2)
+        return (partial[:, :, None] + self.sweep(frees)[None, None, :]).reshape(len(line_ids), -1)
@@ -0,0 +1,423 @@
+"""
+Compiled, memory-mapped versions of the verified bingo face lists.
+
+The industry-standard face lists ship as csv files (usable9000.csv and usable27000.csv) where every row holds a
+face id, the line's position on that face, and the five numbers that make up the line. Parsing those files
+line-by-line every time a BingoFaceList is created is slow, so this module compiles each csv once into a small binary
+file that can be memory-mapped. The binary layout is a fixed-size header followed by these arrays:
+
+|  face ids:          int32[faces]
+|  path counts:       int8[faces]
+|  paths:             int8[faces, max_paths, 5] (bingo numbers 1 - 75, zero-padded when a face has fewer paths)
+|  line ids:          int32[faces, max_paths] (path id of every line, -1 for padding)
+|  sweep offsets:     int32[33]
+|  sweep ids:         int32[sweeps]
+|  selector offsets:  int32[2, 33]
+|  selectors:         int8[selector rows, 5]
+
+The last four make up the expansion index (see expansion_index), which lets a candidate face be expanded into its
+winning path ids from its line ids with a table lookup.
+
+Compile the catalogs from the command line with ``python -m ticketing.face_catalog``. The header records a digest of
+the csv a catalog was compiled from, and if a compiled file is missing, was written by an older version of this
+module, or no longer matches its csv (because the csv has been edited), load_face_catalog compiles it on the fly.
+Supersets written by face_generator have no csv, so their digest is left blank and never checked.
+
+Catalogs never change once they're loaded, so get_face_catalog keeps a single copy of each one for the whole process.
+Every BingoFaceList (one per permutation, one per job) shares it and only keeps its own face order and bookkeeping.
+"""
+import hashlib
+import os
+import struct
+import sys
+from functools import lru_cache
+from importlib import resources
+
+import numpy as np
+
+from .expansion_index import MAX_LINES, PATTERNS, ExpansionIndex
+from .path_ledger import encode_paths
+
+MAGIC = b'BINGOCAT'
+VERSION = 3
+# magic, version, max paths per face, face count, sweep ids, selector rows, source csv digest
+HEADER = struct.Struct('<8sHHIII16s')
+DIGEST_SIZE = 16
+NO_DIGEST = bytes(DIGEST_SIZE)
+MAX_PATHS = 4
+SPOTS = 5
+
+STANDARD_CSV = 'usable9000.csv'
+EXTENDED_CSV = 'usable27000.csv'
+
+
+class FaceCatalog(object):
+    """
+    Read-only collection of verified bingo faces. Each face is identified by its verification number and owns between
+    two and four winning bingo lines. The arrays may be backed by a memory-mapped file and are shared by every face
+    list in the process, so they are flagged read-only.
+    """
+
+    def __init__(self, ids: np.ndarray, path_counts: np.ndarray, paths: np.ndarray, source: str = '',
+                 line_ids: np.ndarray | None = None, expansion: ExpansionIndex | None = None):
+        """
+        :param ids: verification numbers for every face
+        :type ids: np.ndarray
+        :param path_counts: number of usable bingo lines on each face
+        :type path_counts: np.ndarray
+        :param paths: bingo lines for every face (faces x max paths x 5), padded with zeroes
+        :type paths: np.ndarray
+        :param source: file the catalog was loaded from
+        :type source: str
+        :param line_ids: path id of every line (built from the paths when it isn't passed)
+        :type line_ids: np.ndarray | None
+        :param expansion: tables for expanding candidates into path ids (built when they aren't passed)
+        :type expansion: ExpansionIndex | None
+        """
+        if line_ids is None:
+            line_ids = catalog_line_ids(path_counts, paths)
+        if expansion is None:
+            expansion = ExpansionIndex.build()
+        for array in (ids, path_counts, paths, line_ids, expansion.sweep_offsets, expansion.sweep_ids,
+                      expansion.selector_offsets, expansion.selectors):
+            array.flags.writeable = False
+        self.ids = ids
+        self.path_counts = path_counts
+        self.paths = paths
+        self.line_ids = line_ids
+        self.expansion = expansion
+        self.source = source
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def verification(self, index: int) -> str:
+        """
+        Return the verification number of the face at the passed index as a string, which is how
+        the rest of the bingo code expects to see it.
+
+        :param index: position of the face in the catalog
+        :type index: int
+        :return: verification number
+        :rtype: str
+        """
+        return str(int(self.ids[index]))
+
+    def face_paths(self, index: int) -> list[list[str]]:
+        """
+        Return the bingo lines for the face at the passed index as lists of number strings.
+
+        :param index: position of the face in the catalog
+        :type index: int
+        :return: bingo lines belonging to the face
+        :rtype: list[list[str]]
+        """
+        count = int(self.path_counts[index])
+        return [[str(spot) for spot in path] for path in self.paths[index, :count].tolist()]
+
+    def candidate_paths(self, faces: np.ndarray, slots: np.ndarray, patterns: np.ndarray) -> np.ndarray:
+        """
+        Look up the winning path ids of a batch of candidate faces. Each candidate is one or two lines of a catalog
+        face with free spaces in the columns flagged by its pattern.
+
+        :param faces: catalog index of each candidate's face
+        :type faces: np.ndarray
+        :param slots: slots of each candidate's lines (candidates x lines)
+        :type slots: np.ndarray
+        :param patterns: free-column bitmask of each candidate (bit c is set when column c has a free space)
+        :type patterns: np.ndarray
+        :return: path ids for each candidate (candidates x paths)
+        :rtype: np.ndarray
+        """
+        faces = np.asarray(faces, dtype=np.int64)
+        slots = np.asarray(slots, dtype=np.int64)
+        return self.expansion.expand(self.line_ids[faces[:, None], slots], patterns)
+
+    def total_paths(self) -> int:
+        """
+        Return the number of bingo lines contained in the catalog.
+
+        :return: total bingo lines
+        :rtype: int
+        """
+        return int(self.path_counts.sum(dtype=np.int64))
+
+
+def read_catalog_csv(csv_path: str) -> tuple[np.ndarray, np.ndarray, np.ndarray, dict[str, int]]:
+    """
+    Parse a usable-faces csv file into catalog arrays. Every line is validated (five numbers, each within the range of
+    its bingo column) and the list is cleaned up along the way: repeated lines, lines that reuse a number already used
+    in the same column of their face, lines that already appeared on an earlier face, and duplicate faces are all
+    dropped. Faces that end up with fewer than two lines are useless to the generators and are dropped as well.
+
+    :param csv_path: path to the usable-faces csv file
+    :type csv_path: str
+    :return: face ids, path counts, paths, and a dictionary counting what was thrown out
+    :rtype: tuple[np.ndarray, np.ndarray, np.ndarray, dict[str, int]]
+    """
+    faces = []
+    face_ids = {}
+    with open(csv_path, 'r') as file:
+        for line_number, line in enumerate(file, 1):
+            line = line.strip()
+            if line == '':
+                continue
+            row = line.split(',')
+            if len(row) != SPOTS + 1:
+                raise ValueError(f"{csv_path}, line {line_number}: expected {SPOTS + 1} fields, found {len(row)}.")
+            face_id = row[0].replace('"', '').split('.')[0]
+            try:
+                path = [int(spot) for spot in row[1:]]
+            except ValueError:
+                raise ValueError(f"{csv_path}, line {line_number}: bingo spots must be integers.") from None
+            for column, spot in enumerate(path):
+                if not (column * 15) < spot <= (column * 15) + 15:
+                    raise ValueError(f"{csv_path}, line {line_number}: {spot} does not belong in column "
+                                     f"{'BINGO'[column]}.")
+            # Lines for the same face are contiguous in the csv, but don't count on it.
+            if face_id not in face_ids:
+                face_ids[face_id] = len(faces)
+                faces.append([face_id, []])
+            faces[face_ids[face_id]][1].append(tuple(path))
+
+    dropped = {'duplicate lines': 0, 'column collisions': 0, 'duplicate faces': 0, 'short faces': 0}
+    lines_seen = set()
+    faces_seen = set()
+    ids, counts, paths = [], [], []
+    for face_id, face_paths in faces:
+        kept = []
+        for path in face_paths:
+            if path in lines_seen:
+                dropped['duplicate lines'] += 1
+                continue
+            # A face can't use the same number twice, so two of its lines can never share a spot in the same column.
+            if any(path[column] == other[column] for other in kept for column in range(SPOTS)):
+                dropped['column collisions'] += 1
+                continue
+            kept.append(path)
+        signature = frozenset(kept)
+        if signature in faces_seen:
+            dropped['duplicate faces'] += 1
+            continue
+        if len(kept) < 2:
+            dropped['short faces'] += 1
+            continue
+        faces_seen.add(signature)
+        lines_seen.update(kept)
+        ids.append(int(face_id))
+        counts.append(min(len(kept), MAX_PATHS))
+        padded = kept[:MAX_PATHS] + [(0,) * SPOTS] * (MAX_PATHS - len(kept))
+        paths.append(padded)
+
+    return (np.array(ids, dtype=np.int32), np.array(counts, dtype=np.int8),
+            np.array(paths, dtype=np.int8).reshape(len(ids), MAX_PATHS, SPOTS), dropped)
+
+
+def csv_digest(csv_path: str) -> bytes:
+    """
+    Return the digest a catalog compiled from a csv file records, so a stale catalog can be told from a current one.
+
+    :param csv_path: path to the usable-faces csv file
+    :type csv_path: str
+    :return: BLAKE2b digest of the file's contents
+    :rtype: bytes
+    """
+    with open(csv_path, 'rb') as file:
+        return hashlib.blake2b(file.read(), digest_size=DIGEST_SIZE).digest()
+
+
+def catalog_line_ids(path_counts: np.ndarray, paths: np.ndarray) -> np.ndarray:
+    """
+    Encode every line in the catalog as a path id, leaving -1 in the padding.
+
+    :param path_counts: number of bingo lines on each face
+    :type path_counts: np.ndarray
+    :param paths: bingo lines (faces x max paths x 5)
+    :type paths: np.ndarray
+    :return: path id of every line (faces x max paths)
+    :rtype: np.ndarray
+    """
+    padding = np.arange(paths.shape[1]) >= np.asarray(path_counts)[:, None]
+    line_ids = encode_paths(np.where(padding[:, :, None], np.arange(1, 76, 15), paths)).astype(np.int32)
+    line_ids[padding] = -1
+    return line_ids
+
+
+def write_catalog(destination: str, ids: np.ndarray, path_counts: np.ndarray, paths: np.ndarray,
+                  digest: bytes = NO_DIGEST) -> None:
+    """
+    Write catalog arrays to a compiled catalog file, along with the line ids and expansion index that are
+    precomputed from them. The file is written to a temporary name first and then moved into place, so a
+    reader never sees a half-written catalog.
+
+    :param destination: path of the compiled catalog file
+    :type destination: str
+    :param ids: verification numbers
+    :type ids: np.ndarray
+    :param path_counts: number of bingo lines on each face
+    :type path_counts: np.ndarray
+    :param paths: bingo lines (faces x max paths x 5)
+    :type paths: np.ndarray
+    :param digest: digest of the csv the catalog was compiled from (see csv_digest; blank when there isn't one)
+    :type digest: bytes
+    :return: None
+    :rtype: None
+    """
+    expansion = ExpansionIndex.build()
+    temp_name = f'{destination}.{os.getpid()}.tmp'
+    with open(temp_name, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, VERSION, MAX_PATHS, len(ids), len(expansion.sweep_ids),
+                               len(expansion.selectors), digest))
+        file.write(np.ascontiguousarray(ids, dtype='<i4').tobytes())
+        file.write(np.ascontiguousarray(path_counts, dtype=np.int8).tobytes())
+        file.write(np.ascontiguousarray(paths, dtype=np.int8).tobytes())
+        file.write(np.ascontiguousarray(catalog_line_ids(path_counts, paths), dtype='<i4').tobytes())
+        file.write(np.ascontiguousarray(expansion.sweep_offsets, dtype='<i4').tobytes())
+        file.write(np.ascontiguousarray(expansion.sweep_ids, dtype='<i4').tobytes())
+        file.write(np.ascontiguousarray(expansion.selector_offsets, dtype='<i4').tobytes())
+        file.write(np.ascontiguousarray(expansion.selectors, dtype=np.int8).tobytes())
+    os.replace(temp_name, destination)
+
+
+def compile_catalog(csv_path: str, destination: str | None = None) -> dict[str, int]:
+    """
+    Compile a usable-faces csv file into the binary catalog format. The compiled file is placed next to the csv
+    (with a '.bin' extension) unless a destination is given.
+
+    :param csv_path: path to the usable-faces csv file
+    :type csv_path: str
+    :param destination: path of the compiled catalog file
+    :type destination: str | None
+    :return: number of faces, number of paths, and counts of everything that was dropped
+    :rtype: dict[str, int]
+    """
+    if destination is None:
+        destination = compiled_name(csv_path)
+    digest = csv_digest(csv_path)
+    ids, path_counts, paths, dropped = read_catalog_csv(csv_path)
+    write_catalog(destination, ids, path_counts, paths, digest)
+    summary = {'faces': len(ids), 'paths': int(path_counts.sum(dtype=np.int64))}
+    summary.update(dropped)
+    return summary
+
+
+def open_catalog(catalog_path: str, csv_path: str | None = None) -> FaceCatalog:
+    """
+    Memory-map a compiled catalog file. If the csv it was compiled from is passed, the catalog has to match the csv
+    as it is now.
+
+    :param catalog_path: path of the compiled catalog file
+    :type catalog_path: str
+    :param csv_path: path to the csv the catalog was compiled from (None doesn't check)
+    :type csv_path: str | None
+    :return: catalog backed by the mapped file
+    :rtype: FaceCatalog
+    """
+    with open(catalog_path, 'rb') as file:
+        header = file.read(HEADER.size)
+    if len(header) != HEADER.size:
+        raise ValueError(f"{catalog_path} is not a compiled face catalog.")
+    magic, version, max_paths, faces, sweeps, selector_rows, digest = HEADER.unpack(header)
+    if magic != MAGIC:
+        raise ValueError(f"{catalog_path} is not a compiled face catalog.")
+    if version != VERSION:
+        raise ValueError(f"{catalog_path} was compiled with catalog version {version}; version {VERSION} is needed.")
+    if csv_path is not None and digest != csv_digest(csv_path):
+        raise ValueError(f"{catalog_path} is out of date; {csv_path} has changed since it was compiled.")
+    offset = HEADER.size
+    ids = np.memmap(catalog_path, dtype='<i4', mode='r', offset=offset, shape=(faces,))
+    offset += faces * 4
+    path_counts = np.memmap(catalog_path, dtype=np.int8, mode='r', offset=offset, shape=(faces,))
+    offset += faces
+    paths = np.memmap(catalog_path, dtype=np.int8, mode='r', offset=offset, shape=(faces, max_paths, SPOTS))
+    offset += faces * max_paths * SPOTS
+    line_ids = np.memmap(catalog_path, dtype='<i4', mode='r', offset=offset, shape=(faces, max_paths))
+    offset += faces * max_paths * 4
+    sweep_offsets = np.memmap(catalog_path, dtype='<i4', mode='r', offset=offset, shape=(PATTERNS + 1,))
+    offset += (PATTERNS + 1) * 4
+    sweep_ids = np.memmap(catalog_path, dtype='<i4', mode='r', offset=offset, shape=(sweeps,))
+    offset += sweeps * 4
+    selector_offsets = np.memmap(catalog_path, dtype='<i4', mode='r', offset=offset, shape=(MAX_LINES, PATTERNS + 1))
+    offset += MAX_LINES * (PATTERNS + 1) * 4
+    selectors = np.memmap(catalog_path, dtype=np.int8, mode='r', offset=offset, shape=(selector_rows, SPOTS))
+    expansion = ExpansionIndex(sweep_offsets, sweep_ids, selector_offsets, selectors)
+    return FaceCatalog(ids, path_counts, paths, catalog_path, line_ids, expansion)
+
+
+def compiled_name(csv_path: str) -> str:
+    """
+    Return the name of the compiled catalog that belongs to a csv file.
+
+    :param csv_path: path to the usable-faces csv file
+    :type csv_path: str
+    :return: path of the compiled catalog file
+    :rtype: str
+    """
+    return f'{os.path.splitext(csv_path)[0]}.bin'
+
+
+def load_face_catalog(extended: bool = False) -> FaceCatalog:
+    """
+    Load the standard (9,000) or extended (27,000) face catalog from the package. The compiled file is
+    memory-mapped when it exists and matches the csv. Otherwise, it is compiled from the csv first. If the
+    package folder can't be written to, the csv is parsed straight into memory instead.
+
+    :param extended: load the extended catalog instead of the standard one
+    :type extended: bool
+    :return: the requested face catalog
+    :rtype: FaceCatalog
+    """
+    filename = EXTENDED_CSV if extended else STANDARD_CSV
+    with resources.as_file(resources.files('ticketing').joinpath(filename)) as csv_path:
+        csv_path = str(csv_path)
+        catalog_path = compiled_name(csv_path)
+        try:
+            return open_catalog(catalog_path, csv_path)
+        except (OSError, ValueError):
+            pass
+        try:
+            compile_catalog(csv_path, catalog_path)
+            return open_catalog(catalog_path)
+        except OSError:
+            ids, path_counts, paths, _ = read_catalog_csv(csv_path)
+            return FaceCatalog(ids, path_counts, paths, csv_path)
+
+
+@lru_cache(maxsize=None)
+def get_face_catalog(extended: bool = False) -> FaceCatalog:
+    """
+    Return the shared copy of the standard or extended face catalog, loading it the first time it's asked for.
+    The same catalog is handed out for the rest of the session (across create_game calls from the GUI).
+
+    :param extended: return the extended catalog instead of the standard one
+    :type extended: bool
+    :return: the shared face catalog
+    :rtype: FaceCatalog
+    """
+    return load_face_catalog(extended)
+
+
+@lru_cache(maxsize=None)
+def get_catalog_file(catalog_path: str) -> FaceCatalog:
+    """
+    Return the shared copy of a compiled catalog file that isn't one of the packaged ones (a superset written by
+    face_generator, for instance), memory-mapping it the first time it's asked for.
+
+    :param catalog_path: path of the compiled catalog file
+    :type catalog_path: str
+    :return: the shared face catalog
+    :rtype: FaceCatalog
+    """
+    return open_catalog(catalog_path)
+
+
+if __name__ == '__main__':
+    # Compile both of the packaged catalogs, or whichever csv files are passed on the command line.
+    targets = sys.argv[1:]
+    if len(targets) == 0:
+        for name in [STANDARD_CSV, EXTENDED_CSV]:
+            with resources.as_file(resources.files('ticketing').joinpath(name)) as packaged:
+                targets.append(str(packaged))
+    for target in targets:
+        results = compile_catalog(target)
+        print(f"{target} -> {compiled_name(target)}: {results}")
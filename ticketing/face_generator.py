@@ -0,0 +1,129 @@
+"""
+Additional verified faces for jobs that need more than the packaged catalogs hold.
+
+The face lists top out at 9,000 (standard) and 27,000 (extended) faces, and a big job with a lot of permutations can
+use them up. This module deals new 75-ball cards the same way the lists were made: five different numbers from each
+column's fifteen, with the free space in the middle of the N column. A card's usable lines are its four full rows
+(the middle row and both diagonals run through the free space), one number from each column, which is exactly the
+shape of a catalog face.
+
+New faces are checked against everything that's already in use. A line that's on a catalog face (or on a face
+generated earlier in the same run) is dropped, and a face that's left with fewer than two lines is skipped, the
+same rules read_catalog_csv applies to the csv files. Verification numbers carry on from the highest one in the
+catalog. The cards come from a seeded generator, so the same catalog, count, and seed always make the same faces.
+
+The result is written as a compiled catalog holding the packaged faces followed by the new ones (a superset), which
+BingoFaceList and the verified bingo generators can load in place of the packaged catalog:
+
+|  python -m ticketing.face_generator 5000 supersets/standard-plus-5000.bin
+|  python -m ticketing.face_generator 20000 supersets/extended-plus-20000.bin extended 7
+"""
+import sys
+
+import numpy as np
+
+from .face_catalog import MAX_PATHS, SPOTS, FaceCatalog, get_face_catalog, write_catalog
+from .path_ledger import COLUMN_SIZE, COLUMN_OFFSETS, encode_paths
+
+# Rows of a card that make usable lines (the middle row holds the free space).
+LINE_ROWS = [0, 1, 3, 4]
+# Seed used when none is passed.
+DEFAULT_SEED = 75
+# Cards dealt at a time (more than are needed, since a few faces are thrown out).
+DEAL_BATCH = 4096
+
+
+def deal_cards(rng: np.random.Generator, amount: int) -> np.ndarray:
+    """
+    Deal 75-ball bingo cards and return their usable lines.
+
+    :param rng: random number generator to deal from
+    :type rng: np.random.Generator
+    :param amount: number of cards
+    :type amount: int
+    :return: bingo numbers of each card's usable lines (cards x lines x 5)
+    :rtype: np.ndarray
+    """
+    # Shuffle the fifteen positions of every column and keep the first five (one for each row).
+    positions = rng.permuted(np.tile(np.arange(COLUMN_SIZE), (amount, SPOTS, 1)), axis=2)[:, :, :SPOTS]
+    cards = positions + COLUMN_OFFSETS[None, :, None]
+    return cards[:, :, LINE_ROWS].transpose(0, 2, 1).astype(np.int8)
+
+
+def generate_faces(catalog: FaceCatalog, amount: int,
+                   seed: int = DEFAULT_SEED) -> tuple[np.ndarray, np.ndarray, np.ndarray, dict[str, int]]:
+    """
+    Generate faces that don't share a line with the catalog or with each other.
+
+    :param catalog: catalog the new faces have to stay clear of
+    :type catalog: FaceCatalog
+    :param amount: number of faces needed
+    :type amount: int
+    :param seed: seed for the card dealer
+    :type seed: int
+    :return: verification numbers, line counts, and lines of the new faces (in catalog form), and a dictionary
+             counting what was thrown out
+    :rtype: tuple[np.ndarray, np.ndarray, np.ndarray, dict[str, int]]
+    """
+    if amount < 0:
+        raise ValueError(f"Can't generate {amount} faces.")
+    rng = np.random.default_rng(seed)
+    taken = set(np.asarray(catalog.line_ids)[np.asarray(catalog.line_ids) >= 0].tolist())
+    dropped = {'duplicate lines': 0, 'short faces': 0}
+    counts, paths = [], []
+    while len(paths) < amount:
+        lines = deal_cards(rng, DEAL_BATCH)
+        line_ids = encode_paths(lines).tolist()
+        for card, card_ids in zip(lines, line_ids):
+            kept = [row for row, line_id in enumerate(card_ids) if line_id not in taken]
+            dropped['duplicate lines'] += len(card_ids) - len(kept)
+            if len(kept) < 2:
+                dropped['short faces'] += 1
+                continue
+            taken.update(card_ids[row] for row in kept)
+            counts.append(len(kept))
+            padded = np.zeros((MAX_PATHS, SPOTS), dtype=np.int8)
+            padded[:len(kept)] = card[kept]
+            paths.append(padded)
+            if len(paths) == amount:
+                break
+    first_id = int(np.max(catalog.ids)) + 1 if len(catalog) > 0 else 1
+    ids = np.arange(first_id, first_id + amount, dtype=np.int32)
+    return (ids, np.array(counts, dtype=np.int8),
+            np.array(paths, dtype=np.int8).reshape(amount, MAX_PATHS, SPOTS), dropped)
+
+
+def write_superset(destination: str, amount: int, extended: bool = False,
+                   seed: int = DEFAULT_SEED) -> dict[str, int]:
+    """
+    Write a compiled catalog holding the packaged standard or extended faces followed by newly generated ones.
+
+    :param destination: path of the compiled catalog file
+    :type destination: str
+    :param amount: number of faces to add
+    :type amount: int
+    :param extended: start from the extended catalog instead of the standard one
+    :type extended: bool
+    :param seed: seed for the card dealer
+    :type seed: int
+    :return: number of faces in the superset, how many were added, the first new verification number, and counts
+             of everything that was thrown out
+    :rtype: dict[str, int]
+    """
+    catalog = get_face_catalog(extended)
+    ids, path_counts, paths, dropped = generate_faces(catalog, amount, seed)
+    write_catalog(destination, np.concatenate([catalog.ids, ids]),
+                  np.concatenate([catalog.path_counts, path_counts]), np.concatenate([catalog.paths, paths]))
+    summary = {'faces': len(catalog) + amount, 'added': amount, 'first id': int(ids[0]) if amount > 0 else 0}
+    summary.update(dropped)
+    return summary
+
+
+if __name__ == '__main__':
+    # python -m ticketing.face_generator <faces to add> <destination> [extended] [seed]
+    if len(sys.argv) < 3:
+        print("usage: python -m ticketing.face_generator <faces to add> <destination> [extended] [seed]")
+        sys.exit(1)
+    results = write_superset(sys.argv[2], int(sys.argv[1]), len(sys.argv) > 3 and sys.argv[3] == 'extended',
+                             int(sys.argv[4]) if len(sys.argv) > 4 else DEFAULT_SEED)
+    print(f"{sys.argv[2]}: {results}")
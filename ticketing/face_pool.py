@@ -0,0 +1,344 @@
+import random as rn
+
+import numpy as np
+
+
+class FacePool(object):
+    """
+    This class holds the order in which catalog faces are handed out, along with the lines still available on each
+    face. The faces live in a circular buffer, so drawing from either end, returning a face to either end, and
+    pulling or inserting a face at a random position are all constant-time operations (random positions use a swap
+    with the back of the pool). The lines on each face are tracked as slot numbers: the first 'remaining' entries of a
+    face's row in 'slots' are the lines it still has, and taking a line swaps it out of that section.
+
+    The pool also keeps running totals of the lines and line pairs left on the faces it holds. They're updated
+    whenever a face enters or leaves the pool or a pooled face's lines change, so asking for them never means
+    walking the faces.
+    """
+
+    def __init__(self, path_counts: np.ndarray, faces: np.ndarray | None = None):
+        """
+        :param path_counts: number of lines on every catalog face
+        :type path_counts: np.ndarray
+        :param faces: catalog indexes to start the pool with, in order (defaults to every face)
+        :type faces: np.ndarray | None
+        """
+        path_counts = np.asarray(path_counts)
+        capacity = len(path_counts)
+        self.buffer = np.zeros(max(capacity, 1), dtype=np.int32)
+        self.head = 0
+        self.size = 0
+        width = int(path_counts.max()) if capacity > 0 else 0
+        self.slots = np.tile(np.arange(width, dtype=np.int8), (capacity, 1))
+        self.remaining = path_counts.astype(np.int8, copy=True)
+        if faces is None:
+            faces = np.arange(capacity, dtype=np.int32)
+        faces = np.asarray(faces, dtype=np.int32)
+        self.buffer[:len(faces)] = faces
+        self.size = len(faces)
+        self.pooled = np.zeros(capacity, dtype=bool)
+        self._tally(faces)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __contains__(self, face: int) -> bool:
+        return bool(self.pooled[face])
+
+    def _tally(self, faces: np.ndarray) -> None:
+        """
+        Start the running totals over from the passed faces (the whole contents of the pool).
+
+        :param faces: catalog indexes of the faces in the pool
+        :type faces: np.ndarray
+        :return: None
+        :rtype: None
+        """
+        self.pooled[:] = False
+        self.pooled[faces] = True
+        self.lines = int(self.remaining[faces].sum(dtype=np.int64))
+        self.pairs = int((self.remaining[faces] // 2).sum(dtype=np.int64))
+
+    def _enter(self, face: int) -> None:
+        """
+        Add a face's lines to the running totals as it goes into the pool.
+
+        :param face: catalog index of the face
+        :type face: int
+        :return: None
+        :rtype: None
+        """
+        count = int(self.remaining[face])
+        self.pooled[face] = True
+        self.lines += count
+        self.pairs += count // 2
+
+    def _leave(self, face: int) -> None:
+        """
+        Take a face's lines out of the running totals as it comes out of the pool.
+
+        :param face: catalog index of the face
+        :type face: int
+        :return: None
+        :rtype: None
+        """
+        count = int(self.remaining[face])
+        self.pooled[face] = False
+        self.lines -= count
+        self.pairs -= count // 2
+
+    def _recount(self, face: int, count: int) -> None:
+        """
+        Change the number of lines left on a face, keeping the running totals in step if the face is in the pool.
+
+        :param face: catalog index of the face
+        :type face: int
+        :param count: new number of lines left
+        :type count: int
+        :return: None
+        :rtype: None
+        """
+        if self.pooled[face]:
+            old = int(self.remaining[face])
+            self.lines += count - old
+            self.pairs += count // 2 - old // 2
+        self.remaining[face] = count
+
+    def _position(self, offset: int) -> int:
+        """
+        Convert an offset from the front of the pool into an index of the circular buffer.
+
+        :param offset: offset from the front of the pool
+        :type offset: int
+        :return: buffer index
+        :rtype: int
+        """
+        return (self.head + offset) % len(self.buffer)
+
+    def restore(self, faces: np.ndarray, slots: np.ndarray, remaining: np.ndarray) -> None:
+        """
+        Put the pool back the way it was when a checkpoint was taken: the faces in it, in order, and the lines
+        left on every face.
+
+        :param faces: catalog indexes of the faces in the pool, from front to back
+        :type faces: np.ndarray
+        :param slots: line slots of every face (see the class description)
+        :type slots: np.ndarray
+        :param remaining: number of lines left on every face
+        :type remaining: np.ndarray
+        :return: None
+        :rtype: None
+        """
+        faces = np.asarray(faces, dtype=np.int32)
+        if slots.shape != self.slots.shape or remaining.shape != self.remaining.shape:
+            raise ValueError("The saved face pool doesn't match the face catalog.")
+        self.slots[:] = slots
+        self.remaining[:] = remaining
+        self.buffer[:len(faces)] = faces
+        self.head = 0
+        self.size = len(faces)
+        self._tally(faces)
+
+    def faces(self) -> np.ndarray:
+        """
+        Return the catalog indexes of the faces in the pool, from front to back.
+
+        :return: faces in pool order
+        :rtype: np.ndarray
+        """
+        return np.roll(self.buffer, -self.head)[:self.size]
+
+    def pop(self) -> int | None:
+        """
+        Remove the face at the back of the pool and return it.
+
+        :return: catalog index of the face, or None if the pool is empty
+        :rtype: int | None
+        """
+        if self.size == 0:
+            return None
+        self.size -= 1
+        face = int(self.buffer[self._position(self.size)])
+        self._leave(face)
+        return face
+
+    def pop_front(self) -> int | None:
+        """
+        Remove the face at the front of the pool and return it.
+
+        :return: catalog index of the face, or None if the pool is empty
+        :rtype: int | None
+        """
+        if self.size == 0:
+            return None
+        face = int(self.buffer[self.head])
+        self.head = self._position(1)
+        self.size -= 1
+        self._leave(face)
+        return face
+
+    def push_back(self, face: int) -> None:
+        """
+        Add a face to the back of the pool (it will be the next one drawn by pop).
+
+        :param face: catalog index of the face
+        :type face: int
+        :return: None
+        :rtype: None
+        """
+        if self.size == len(self.buffer):
+            raise OverflowError("The face pool is already holding every face in the catalog.")
+        self.buffer[self._position(self.size)] = face
+        self.size += 1
+        self._enter(face)
+
+    def push_front(self, face: int) -> None:
+        """
+        Add a face to the front of the pool (it will be the last one drawn by pop).
+
+        :param face: catalog index of the face
+        :type face: int
+        :return: None
+        :rtype: None
+        """
+        if self.size == len(self.buffer):
+            raise OverflowError("The face pool is already holding every face in the catalog.")
+        self.head = self._position(-1)
+        self.buffer[self.head] = face
+        self.size += 1
+        self._enter(face)
+
+    def pop_random(self) -> int | None:
+        """
+        Remove a face from a random position in the pool and return it. The face at the back of the pool
+        takes its place.
+
+        :return: catalog index of the face, or None if the pool is empty
+        :rtype: int | None
+        """
+        if self.size == 0:
+            return None
+        position = self._position(rn.randint(0, self.size - 1))
+        back = self._position(self.size - 1)
+        face = int(self.buffer[position])
+        self.buffer[position] = self.buffer[back]
+        self.size -= 1
+        self._leave(face)
+        return face
+
+    def insert_random(self, face: int) -> None:
+        """
+        Insert a face at a random position in the pool. The face that was there moves to the back.
+
+        :param face: catalog index of the face
+        :type face: int
+        :return: None
+        :rtype: None
+        """
+        self.push_back(face)
+        position = self._position(rn.randint(0, self.size - 1))
+        back = self._position(self.size - 1)
+        self.buffer[back], self.buffer[position] = self.buffer[position], self.buffer[back]
+
+    def shuffle(self) -> None:
+        """
+        Shuffle the faces in the pool.
+
+        :return: None
+        :rtype: None
+        """
+        mixer = np.random.default_rng(rn.getrandbits(64))
+        self.buffer[:self.size] = mixer.permutation(self.faces())
+        self.head = 0
+
+    def paths_left(self, face: int) -> int:
+        """
+        Return the number of lines still available on a face.
+
+        :param face: catalog index of the face
+        :type face: int
+        :return: number of lines left
+        :rtype: int
+        """
+        return int(self.remaining[face])
+
+    def live_slots(self, face: int) -> list[int]:
+        """
+        Return the slots of the lines still available on a face.
+
+        :param face: catalog index of the face
+        :type face: int
+        :return: line slots
+        :rtype: list[int]
+        """
+        return self.slots[face, :self.remaining[face]].tolist()
+
+    def set_slots(self, face: int, slots: list[int]) -> None:
+        """
+        Replace the lines available on a face with the passed slots.
+
+        :param face: catalog index of the face
+        :type face: int
+        :param slots: line slots that are available
+        :type slots: list[int]
+        :return: None
+        :rtype: None
+        """
+        others = [slot for slot in range(self.slots.shape[1]) if slot not in slots]
+        self.slots[face] = slots + others
+        self._recount(face, len(slots))
+
+    def take_path(self, face: int) -> int:
+        """
+        Remove a random line from a face and return its slot.
+
+        :param face: catalog index of the face
+        :type face: int
+        :return: slot of the line taken
+        :rtype: int
+        """
+        last = int(self.remaining[face]) - 1
+        pick = rn.randint(0, last)
+        row = self.slots[face]
+        slot = int(row[pick])
+        row[pick] = row[last]
+        row[last] = slot
+        self._recount(face, last)
+        return slot
+
+    def return_path(self, face: int, slot: int) -> None:
+        """
+        Give a line back to a face. The slot must be one that was previously taken from the face.
+
+        :param face: catalog index of the face
+        :type face: int
+        :param slot: slot of the line being returned
+        :type slot: int
+        :return: None
+        :rtype: None
+        """
+        count = int(self.remaining[face])
+        row = self.slots[face]
+        position = int(np.flatnonzero(row[count:] == slot)[0]) + count
+        row[position] = row[count]
+        row[count] = slot
+        self._recount(face, count + 1)
+
+    def remaining_paths(self) -> int:
+        """
+        Return the total number of lines left on the faces in the pool.
+
+        :return: lines left in the pool
+        :rtype: int
+        """
+        return self.lines
+
+    def pairs_left(self) -> int:
+        """
+        Return the number of line pairs that can still be drawn from the faces in the pool. (Faces hand out
+        their lines two at a time, so an odd line left over is never used.)
+
+        :return: line pairs left in the pool
+        :rtype: int
+        """
+        return self.pairs
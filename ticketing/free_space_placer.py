@@ -0,0 +1,102 @@
+"""
+Balanced placement of free spaces on pseudo-bingo faces.
+
+Free spaces are spread across the five columns so that no column ends up with many more of them than the others: each
+face puts its free spaces in the columns that have been used the least so far, and ties between equally used columns
+are broken at random. Every generation context (a BingoFaceList) owns its own placer, with its own usage counts and its
+own random number generator, so two generators in the same process (or a worker process and the main one) never
+disturb each other's placements.
+
+A generator that may end up moving a face's free spaces somewhere else (or throwing the face away) settles the
+counts afterwards: release() takes back the columns it was given, and commit() counts the ones actually used.
+"""
+import random as rn
+
+COLUMNS = 5
+
+
+class FreeSpacePlacer(object):
+    """
+    Picks the columns that receive free spaces, keeping a count of how often each column has been used.
+    """
+
+    def __init__(self, seed: int | None = None):
+        """
+        :param seed: seed for the placer's random number generator (None draws one from the random module, so a
+                     seeded job still places its free spaces the same way every time)
+        :type seed: int | None
+        """
+        self.counts = [0] * COLUMNS
+        self.random = rn.Random(rn.getrandbits(64) if seed is None else seed)
+
+    def columns(self, frees: int) -> list[int]:
+        """
+        Choose the columns for a face's free spaces (the least used columns, with ties broken at random) and count
+        them as used.
+
+        :param frees: number of free spaces
+        :type frees: int
+        :return: columns that get a free space, least used first
+        :rtype: list[int]
+        """
+        keys = [(count, self.random.random()) for count in self.counts]
+        chosen = sorted(range(COLUMNS), key=keys.__getitem__)[:frees]
+        for column in chosen:
+            self.counts[column] += 1
+        return chosen
+
+    def commit(self, columns: list[int]) -> None:
+        """
+        Count columns as used by a face's free spaces.
+
+        :param columns: columns holding a free space
+        :type columns: list[int]
+        :return: None
+        :rtype: None
+        """
+        for column in columns:
+            self.counts[column] += 1
+
+    def release(self, columns: list[int]) -> None:
+        """
+        Take back columns handed out by columns() that didn't end up being used.
+
+        :param columns: columns to stop counting
+        :type columns: list[int]
+        :return: None
+        :rtype: None
+        """
+        for column in columns:
+            self.counts[column] -= 1
+
+    def coin(self) -> int:
+        """
+        Flip a coin with the placer's random number generator (used to pick which line of a staggered face starts).
+
+        :return: 0 or 1
+        :rtype: int
+        """
+        return self.random.getrandbits(1)
+
+    def state(self) -> list:
+        """
+        Return everything needed to put the placer back the way it is now (for checkpoints).
+
+        :return: usage counts and random state
+        :rtype: list
+        """
+        version, internal, gauss = self.random.getstate()
+        return [list(self.counts), [version, list(internal), gauss]]
+
+    def restore(self, state: list) -> None:
+        """
+        Put the placer back the way it was when state() was called.
+
+        :param state: usage counts and random state
+        :type state: list
+        :return: None
+        :rtype: None
+        """
+        counts, (version, internal, gauss) = state
+        self.counts = list(counts)
+        self.random.setstate((version, tuple(internal), gauss))
@@ -18,6 +18,7 @@ from ticketing.universal_ticket import UniversalTicket as uTick
 from ticketing import image_generator as ig
 from ticketing import game_info_gui as gi
 from ticketing import ticket_io as tio
+from ticketing.progress import NO_PROGRESS, Progress
 
 import random as rn
 import itertools as it
@@ -196,7 +197,8 @@ def create_downline_image_lists(amt: int, bpt: int) -> list[list[str]] | None:
 def create_hold_tickets(bb_options: list[int], bool_options: list[bool | str],
                         sup_holds: list[int | list[list[str | int]]],
                         tkt: int | str, addl_bb_imgs: list[gi.AddImages], addl_sup_imgs: list[gi.AddImages],
-                        permits: int, first: bool) -> list[list[uTick]] | None | str:
+                        permits: int, first: bool,
+                        progress: Progress = NO_PROGRESS) -> list[list[uTick]] | None | str:
     """
     Create bingo ball and supplemental hold tickets.
 
@@ -216,6 +218,8 @@ def create_hold_tickets(bb_options: list[int], bool_options: list[bool | str],
     :type permits: int
     :param first: Does the first ticket need to set the csv fields?
     :type first: bool
+    :param progress: where to report how many bingo ball permutations have been made
+    :type progress: Progress
     :return: list of hold tickets
     :rtype: list[uTick] | None | str
     """
@@ -226,7 +230,7 @@ def create_hold_tickets(bb_options: list[int], bool_options: list[bool | str],
     # If there are needed bingo ball type holds, create them.
     if bb_amt > 0:
         perms = create_bingo_ball_tickets(bb_amt, bpt, spt, downs, permits, first, 0, fill_pool,
-                                          addl_bb_imgs, tkt, shazams, base, sortie)
+                                          addl_bb_imgs, tkt, shazams, base, sortie, progress)
         first = False
     # If there are supplemental holds needed, create those.
     if sup_holds[0] > 0:
@@ -307,7 +311,8 @@ def create_single_image_holds(suppers: list[list[str | int]], addl_imgs: list[gi
 
 
 def create_bingo_ball_tickets(bb_amt, bpt, spt, downs, permits: int, first, nums, nw_pool,
-                              addl_bb_imgs, tkt, shazams: int, basic: str, sortie: bool = True):
+                              addl_bb_imgs, tkt, shazams: int, basic: str, sortie: bool = True,
+                              progress: Progress = NO_PROGRESS):
     """
     Create a list of bingo-ball-type hold-tickets (either random or downline).
 
@@ -337,6 +342,8 @@ def create_bingo_ball_tickets(bb_amt, bpt, spt, downs, permits: int, first, nums
     :type basic: str
     :param sortie: sort bingo balls in ascending order?
     :type sortie: bool
+    :param progress: where to report how many permutations have been made
+    :type progress: Progress
     :return: list of lists of hold tickets
     :rtype: list[list[uTick]]
     """
@@ -350,7 +357,7 @@ def create_bingo_ball_tickets(bb_amt, bpt, spt, downs, permits: int, first, nums
         bangles = [create_downline_image_lists(bb_amt, bpt)]
     else:
         # bangles = ig.create_bingo_ball_image_list(bb_amt, bpt, 'hold')
-        bangles = ig.create_bingo_ball_image_permutations(bb_amt, bpt, permits, 'hold', sortie, suffix)
+        bangles = ig.create_bingo_ball_image_permutations(bb_amt, bpt, permits, 'hold', sortie, suffix, progress)
     for index, bingos in enumerate(bangles):
         # Shuffle the ticket position list, then take a slice of the list equal to the
         # number of Shazams needed. Sort the list and use it to flag which tickets
@@ -483,7 +490,7 @@ def extract_ticket_types(game_specs):
     return [game_specs[1].pop(0), game_specs[2].pop(0), game_specs[3].pop(0), game_specs[4].pop(0)]
 
 
-def create_game(game_specs: list):
+def create_game(game_specs: list, progress: Progress = NO_PROGRESS):
     """
     Initializes and generates a bingo-ball style work order based on specifications from a gui-based form. This
     function supports different types of tickets including pick and instant winners, shaded or imaged holds, and
@@ -498,6 +505,8 @@ def create_game(game_specs: list):
                        - names_specs: Contains party and file name information.
                        - output_folder: The folder where output files are stored.
     :type game_specs: tuple
+    :param progress: where the long-running generators report how far along they are
+    :type progress: Progress
     :return: A status message indicating that all items have been successfully written to the files.
     :rtype: str
     """
@@ -561,7 +570,7 @@ def create_game(game_specs: list):
             else:
                 tkt_no = 1
         hold_specs.extend([tkt_no, addl_hold, addl_inst, perms, first_timer])
-        holds = create_hold_tickets(*hold_specs)
+        holds = create_hold_tickets(*hold_specs, progress=progress)
         if isinstance(holds, str) or holds is None:
             return holds
         first_timer = False
@@ -14,6 +14,9 @@ from ticketing.bingo_ticket import BingoTicket as bTick
 from ticketing import verified_bingo as vb
 from ticketing import image_generator as ig
 from ticketing import ticket_io as tio
+from ticketing.bingo_stats import GenerationStats
+from ticketing.ledger_store import LedgerStore
+from ticketing.progress import NO_PROGRESS, Progress
 
 # NEW IMPORTS
 from ticketing.ticket_models import (
@@ -28,10 +31,17 @@ suffix = ''
 
 def create_hold_tickets(hold_ticket: HoldBingosTicket,
                         csv_rows: int, addl_imgs: gi.AddImages,
-                        permits: int, perm_reset: bool = False) -> list[list[bTick]] | None:
+                        permits: int, perm_reset: bool = False,
+                        progress: Progress = NO_PROGRESS, store: LedgerStore | None = None,
+                        reservation: str | None = None,
+                        stats: GenerationStats | None = None) -> list[list[bTick]] | None:
     """
     Create the various either/or bingo tickets required by the game.
     Refactored to accept HoldBingosTicket object.
+    Progress making the bingo faces is reported to progress.
+    If a ledger store is passed, the game's paths are kept apart from every other game in the store and reserved
+    under the reservation name (the permutations are kept apart too, since that takes the no-reset generator).
+    What making the faces cost is added to stats, if it's passed.
     """
     # Extract lists from the object
     needs = [
@@ -49,13 +59,14 @@ def create_hold_tickets(hold_ticket: HoldBingosTicket,
     is_extended = hold_ticket.extended_csv == 'E' or hold_ticket.extended_csv is True
 
     # If there is only one permutation or the list can be reset...
-    if perm_reset or permits == 1:
+    if store is None and (perm_reset or permits == 1):
         versions = vb.create_all_bingo_permutations_with_reset(
-            needs, permits, csv_rows, is_extended, True
+            needs, permits, csv_rows, is_extended, True, progress=progress, stats=stats
         )
     else:
         versions = vb.create_all_bingo_permutations_without_reset(
-            needs, permits, csv_rows, is_extended, True
+            needs, permits, csv_rows, is_extended, True, store=store, reservation=reservation, progress=progress,
+            stats=stats
         )
 
     if versions[0] is None:
@@ -239,10 +250,11 @@ def create_nonwinning_ticket(nw_ticket: NonWinnerImagesTicket, addl_imgs: gi.Add
     return permies
 
 
-def create_game(data_bundle):
+def create_game(data_bundle, progress: Progress = NO_PROGRESS):
     """
     Main Entry Point.
     Refactored to accept list of Data Objects.
+    Progress making the bingo faces is reported to progress.
     """
     global suffix
 
@@ -283,13 +295,24 @@ def create_game(data_bundle):
     cd_tier = inst_specs.cd_tier
     bingrows = hold_specs.columns_needed
 
+    # Games played together share a ledger store, kept in the folder named in the game info.
+    store = None
+    if game_info.ledger_folder:
+        is_extended = hold_specs.extended_csv == 'E' or hold_specs.extended_csv is True
+        store = LedgerStore(game_info.ledger_folder, is_extended)
+
     # 3. Create Hold Tickets (Bingos)
+    stats = GenerationStats()
     permits = create_hold_tickets(
-        hold_specs, bingrows, hold_addls, perms, perm_reset=reset_perms
+        hold_specs, bingrows, hold_addls, perms, perm_reset=reset_perms, progress=progress,
+        store=store, reservation=game_info.reservation or None, stats=stats
     )
 
     if permits is None:
         return "Error creating Bingo Permutations (Check VerifiedBingo logic)."
+    # The generators report a problem (a reservation name that's taken, faces running out) as [None, message].
+    if permits[0] is None:
+        return permits[1]
 
     # 4. Create Instant Winners (Append to Permutations)
     if inst_specs.total_quantity > 0:
@@ -325,4 +348,4 @@ def create_game(data_bundle):
             part_name, file_name, cds, cd_tier, output_folder
         )
 
-    return "Successfully created Bingo game files."
+    return f"Successfully created Bingo game files.\n\n{stats.summary()}"
@@ -10,6 +10,7 @@ from ticketing.universal_ticket import UniversalTicket as uTick
 from ticketing import image_generator as ig
 from ticketing import game_info_gui as gi  # Note: renamed from game_info_gui if you consolidated
 from ticketing import ticket_io as tio
+from ticketing.progress import NO_PROGRESS, Progress
 
 # Import the models so we can type hint and access fields
 from ticketing.ticket_models import (
@@ -182,7 +183,7 @@ def calculate_image_padding(images_per_ticket: int):
     return nw_addl, insta_addl, pick_addl, hold_addl
 
 
-def create_game(data_bundle):
+def create_game(data_bundle, progress: Progress = NO_PROGRESS):
     """
     Main Entry Point.
     Refactored to accept a list of Data Objects.
@@ -19,6 +19,7 @@ import random as rn
 from ticketing import game_info_gui as gi
 from ticketing import image_generator as ig
 from ticketing import number_generator as ng
+from ticketing.progress import NO_PROGRESS, Progress
 
 DEBUG = True
 
@@ -80,7 +81,7 @@ def check_column_lengths(sizes: list[int], numbers: list[list[int | str]]):
     return True
 
 
-def create_game(game_specs):
+def create_game(game_specs, progress: Progress = NO_PROGRESS):
     """
     Initializes and generates a bingo-ball style work order based on specifications from a gui-based form. This
     function supports different types of tickets including pick and instant winners, shaded or imaged holds, and
@@ -95,6 +96,9 @@ def create_game(game_specs):
                        - names_specs: Contains party and file name information.
                        - output_folder: The folder where output files are stored.
     :type game_specs: tuple
+    :param progress: where the long-running generators report how far along they are (none of this
+                     game's generators report any yet)
+    :type progress: Progress
     :return: A status message indicating that all items have been successfully written to the files.
     :rtype: str
     """
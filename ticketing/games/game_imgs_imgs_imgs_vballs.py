@@ -20,6 +20,9 @@ from ticketing.universal_ticket import UniversalTicket as uTick
 from ticketing import verified_bingo as vb
 from ticketing import image_generator as ig
 from ticketing import ticket_io as tio
+from ticketing.bingo_stats import GenerationStats
+from ticketing.ledger_store import LedgerStore
+from ticketing.progress import NO_PROGRESS, Progress
 
 DEBUG = True
 
@@ -30,7 +33,10 @@ suffix = ''
 def create_hold_tickets(non_twos: list[int], stag_twos: list[int], non_ones: list[int],
                         stag_ones: list[int], one_eeyores: list[list[int]], zeroes: bool,
                         free_type: str, v_size: str, csv_rows: int, addl_imgs: gi.AddImages,
-                        permits: int, perm_reset: bool = False) -> list[list[uTick]] | None:
+                        permits: int, perm_reset: bool = False,
+                        progress: Progress = NO_PROGRESS, store: LedgerStore | None = None,
+                        reservation: str | None = None,
+                        stats: GenerationStats | None = None) -> list[list[uTick]] | None:
     """
     Create the various either/or bingo tickets required by the game. The lists consist of the number and type
     of bingo faces, and the index of each element reflects the number of free spaces required. The exception is
@@ -62,6 +68,14 @@ def create_hold_tickets(non_twos: list[int], stag_twos: list[int], non_ones: lis
     :type permits: int
     :param perm_reset: Should the bingo list be reset for each permutation?
     :type perm_reset: bool
+    :param progress: where to report how many bingo faces have been made
+    :type progress: Progress
+    :param store: ledger store shared by games that are played together (keeps the permutations apart too)
+    :type store: LedgerStore | None
+    :param reservation: name to reserve the game's paths under in the store
+    :type reservation: str | None
+    :param stats: statistics to add the cost of making the bingo faces to (None doesn't keep any)
+    :type stats: GenerationStats | None
     :return: list of bingo tickets with various number combinations
     :rtype: list[list[BingoTicket]]
     """
@@ -70,13 +84,17 @@ def create_hold_tickets(non_twos: list[int], stag_twos: list[int], non_ones: lis
     # Create the bingo path equivalents to the required bingo ball images. If there is only
     # one permutation or the list can be reset for each one, call the creation method with reset
     # (refers to the usable faces list). Otherwise, call the method without a list reset. This
-    # is required for ticketing_games that have the possibility of perms being played simultaneously.
-    if perm_reset or permits == 1:
-        versions = vb.create_all_bingo_permutations_with_reset(needs, permits, csv_rows, v_size != 'S', True)
+    # is required for ticketing_games that have the possibility of perms being played simultaneously
+    # (and for games sharing a ledger store, which only the no-reset method can use).
+    if store is None and (perm_reset or permits == 1):
+        versions = vb.create_all_bingo_permutations_with_reset(needs, permits, csv_rows, v_size != 'S', True,
+                                                               progress=progress, stats=stats)
         if versions[0] is None:
             return versions
     else:
-        versions = vb.create_all_bingo_permutations_without_reset(needs, permits, csv_rows, v_size != 'S', True)
+        versions = vb.create_all_bingo_permutations_without_reset(needs, permits, csv_rows, v_size != 'S', True,
+                                                                  store=store, reservation=reservation,
+                                                                  progress=progress, stats=stats)
         if versions[0] is None:
             return versions
     # This will be the standard base for verified bingo ball tickets.
@@ -292,7 +310,8 @@ def extract_ticket_types(game_specs):
     return [game_specs[1].pop(0), game_specs[2].pop(0), game_specs[3].pop(0), game_specs[4].pop(0)]
 
 
-def create_game(game_specs: list):
+def create_game(game_specs: list, progress: Progress = NO_PROGRESS, store: LedgerStore | None = None,
+                reservation: str | None = None):
     """
     Initializes and generates a bingo-ball style work order based on specifications from a gui-based form. This
     function supports different types of tickets, including pick and instant winners; shaded or imaged holds; and
@@ -307,7 +326,13 @@ def create_game(game_specs: list):
                        - names_specs: Contains party and file name information.
                        - output_folder: The folder where output files are stored.
     :type game_specs: tuple
-    :return: A status message indicating that all items have been successfully written to the files.
+    :param progress: where the long-running generators report how far along they are
+    :type progress: Progress
+    :param store: ledger store shared with other games that are played alongside this one
+    :type store: LedgerStore | None
+    :param reservation: name to reserve this game's winning paths under in the store
+    :type reservation: str | None
+    :return: The statistics for making the bingo faces (or an error message if they couldn't be made).
     :rtype: str
     """
     global nw_type, insta_type, pick_type, hold_type, suffix
@@ -332,7 +357,11 @@ def create_game(game_specs: list):
     # whether the bingo list can be reset) and then create the hold tickets. No need
     # to check quantities--we wouldn't be here if we weren't using this hold type.
     hold_specs.extend([hold_addls[1], perms, reset_perms])
-    permits = create_hold_tickets(*hold_specs)
+    stats = GenerationStats()
+    permits = create_hold_tickets(*hold_specs, progress=progress, store=store, reservation=reservation, stats=stats)
+    # The generators report a problem (a reservation name that's taken, faces running out) as [None, message].
+    if permits[0] is None:
+        return permits[1]
 
     # If there are any instant winners needed, append the necessary data to
     # the instant specs list and call the creation method.
@@ -365,6 +394,7 @@ def create_game(game_specs: list):
         tio.write_cd_positions_to_xml_file(part_name, file_name, cds, cd_tier, ups, output_folder)
 
     print('whatevs')
+    return stats.summary()
 
 
 if __name__ == '__main__':
@@ -20,6 +20,7 @@ from ticketing import number_generator as ng
 from ticketing import image_generator as ig
 from ticketing import game_info_gui as gi
 from ticketing import ticket_io as tio
+from ticketing.progress import NO_PROGRESS, Progress
 
 DEBUG = True
 nw_type, insta_type, pick_type, hold_type = '', '', '', ''
@@ -36,15 +37,11 @@ def create_nonwinner_numbers(amt: int, spots: int, first: int, last: int, suffix
     imgs = ig.add_additional_image_slots(addl_imgs, [''])
 
     ticks = []
-    nw_pool = []
     basic = '' if base == '' else f'{base}{img_suffix}'
     suffixes.pop(0)
+    nw_pool = ng.create_nonwinner_number_pool(first, last, suffixes)
     while len(ticks) < amt:
-        if len(nw_pool) < spots:
-            nw_pool = ng.create_number_pools_from_suffix_list(first, last, suffixes, True)
-        numbs = []
-        for _ in range(spots):
-            numbs.append(nw_pool.pop(0))
+        numbs = nw_pool.take(spots)
         tick = uTick(basic, imgs, numbs, 1, 1, is_first)
         is_first = False
         ticks.append(tick)
@@ -156,7 +153,7 @@ def extract_ticket_types(game_specs):
     return [game_specs[1].pop(0), game_specs[2].pop(0), game_specs[3].pop(0), game_specs[4].pop(0)]
 
 
-def create_game(game_specs):
+def create_game(game_specs, progress: Progress = NO_PROGRESS):
     global nw_type, insta_type, pick_type, hold_type, img_suffix
     first_time = True
     permutations = []
@@ -19,6 +19,7 @@ from ticketing.universal_ticket import UniversalTicket as uTick
 import ticketing.image_generator as ig
 import ticketing.number_generator as ng
 import ticketing.ticket_io as tio
+from ticketing.progress import NO_PROGRESS, Progress
 
 import random as rn
 import itertools as it
@@ -121,7 +122,8 @@ def create_instant_winners(amt: list[list[int | bool]], cd_tier: int, tkt: int |
 def create_hold_tickets(bb_options: list[int], bool_options: list[bool | str],
                         sup_holds: list[int | list[list[str | int]]],
                         tkt: int | str, addl_bb_imgs: list[gi.AddImages], addl_sup_imgs: list[gi.AddImages],
-                        permits: int, nummies: int, first: bool) -> list[list[uTick]] | None | str:
+                        permits: int, nummies: int, first: bool,
+                        progress: Progress = NO_PROGRESS) -> list[list[uTick]] | None | str:
     """
     Create bingo ball and supplemental hold tickets.
 
@@ -143,6 +145,8 @@ def create_hold_tickets(bb_options: list[int], bool_options: list[bool | str],
     :type nummies: int
     :param first: Does the first ticket need to set the csv fields?
     :type first: bool
+    :param progress: where to report how many bingo ball permutations have been made
+    :type progress: Progress
     :return: list of hold tickets
     :rtype: list[uTick] | None | str
     """
@@ -153,7 +157,7 @@ def create_hold_tickets(bb_options: list[int], bool_options: list[bool | str],
     # If there are needed bingo ball type holds, create them.
     if bb_amt > 0:
         perms = create_bingo_ball_tickets(bb_amt, bpt, spt, downs, permits, first, nummies, fill_pool,
-                                          addl_bb_imgs, tkt, shazams, base, sortie)
+                                          addl_bb_imgs, tkt, shazams, base, sortie, progress)
         first = False
     # If there are supplemental holds needed, create those.
     if sup_holds[0] > 0:
@@ -234,7 +238,8 @@ def create_bb_match_image_holds(suppers: list[list[int | str]], addl_imgs: list[
 
 
 def create_bingo_ball_tickets(bb_amt, bpt, spt, downs, permits: int, first, nums, nw_pool,
-                              addl_bb_imgs, tkt, shazams: int, basic: str, sortie: bool = True):
+                              addl_bb_imgs, tkt, shazams: int, basic: str, sortie: bool = True,
+                              progress: Progress = NO_PROGRESS):
     """
     Create a list of bingo-ball-type hold-tickets (either random or downline).
 
@@ -264,6 +269,8 @@ def create_bingo_ball_tickets(bb_amt, bpt, spt, downs, permits: int, first, nums
     :type basic: str
     :param sortie: sort bingo balls in ascending order?
     :type sortie: bool
+    :param progress: where to report how many permutations have been made
+    :type progress: Progress
     :return: list of lists of hold tickets
     :rtype: list[list[uTick]]
     """
@@ -277,7 +284,7 @@ def create_bingo_ball_tickets(bb_amt, bpt, spt, downs, permits: int, first, nums
         bangles = [create_downline_image_lists(bb_amt, bpt)]
     else:
         # bangles = ig.create_bingo_ball_image_list(bb_amt, bpt, 'hold')
-        bangles = ig.create_bingo_ball_image_permutations(bb_amt, bpt, permits, 'hold', sortie, suffix)
+        bangles = ig.create_bingo_ball_image_permutations(bb_amt, bpt, permits, 'hold', sortie, suffix, progress)
     for index, bingos in enumerate(bangles):
         # Shuffle the ticket position list, then take a slice of the list equal to the
         # number of Shazams needed. Sort the list and use it to flag which tickets
@@ -404,19 +411,13 @@ def create_nonwinner_numbered_tickets(amt: int, spots: int, first: int, last: in
     # Add any additional images slots necessary to properly format the csv.
     for addl_img in addl_imgs:
         imgs = ig.add_additional_image_slots(addl_img, imgs)
-    # Create a list for the tickets and loop until there are the required amount.
+    # Create a list for the tickets and loop until there are the required amount. The pool
+    # replenishes its own supply of integers whenever it runs out.
     ticks = []
-    nw_pool = []
+    nw_pool = ng.create_nonwinner_number_pool(first, last, exclusions)
     while len(ticks) < amt:
-        # If there aren't enough available integers to create a new ticket, replenish
-        # the supply of integers.
-        if len(nw_pool) < spots:
-            nw_pool = ng.create_number_pools_from_suffix_list(first, last, exclusions, True)
-        # Create a list to hold the integers, then pop off the next one until
-        # there are enough to satisfy the requirements.
-        numbs = []
-        for _ in range(spots):
-            numbs.append(nw_pool.pop(0))
+        # Take the integers for this ticket off the pool.
+        numbs = nw_pool.take(spots)
         # Add any additional number slots necessary to properly format the csv.
         for _ in range(addl_nums):
             numbs.append('')
@@ -427,7 +428,7 @@ def create_nonwinner_numbered_tickets(amt: int, spots: int, first: int, last: in
     return ticks
 
 
-def create_game(game_specs: list):
+def create_game(game_specs: list, progress: Progress = NO_PROGRESS):
     """
     Initializes and generates a bingo-ball style work order based on specifications from a gui-based form. This
     function supports different types of tickets including pick and instant winners, shaded or imaged holds, and
@@ -442,6 +443,8 @@ def create_game(game_specs: list):
                        - names_specs: Contains party and file name information.
                        - output_folder: The folder where output files are stored.
     :type game_specs: tuple
+    :param progress: where the long-running generators report how far along they are
+    :type progress: Progress
     :return: A status message indicating that all items have been successfully written to the files.
     :rtype: str
     """
@@ -506,7 +509,7 @@ def create_game(game_specs: list):
             else:
                 tkt_no = 1
         hold_specs.extend([tkt_no, addl_hold, addl_inst, perms, numbies, first_timer])
-        holds = create_hold_tickets(*hold_specs)
+        holds = create_hold_tickets(*hold_specs, progress=progress)
         if isinstance(holds, str) or holds is None:
             return holds
         first_timer = False
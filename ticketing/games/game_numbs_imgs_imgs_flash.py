@@ -3,6 +3,8 @@ from ticketing.universal_ticket import UniversalTicket as uTick
 
 from ticketing import number_generator as ng
 from ticketing import game_info_gui as gi
+from ticketing.number_pool import NumberPool
+from ticketing.progress import NO_PROGRESS, Progress
 
 
 nw_type, insta_type, pick_type, hold_type = '', '', '', ''
@@ -13,19 +15,14 @@ DEBUG = True
 def create_numbered_nonwinner_tickets(amt: int, spots: int, first: int, last: int, prefixes: str,
                                       add_imgs: list[gi.AddImages], is_first: bool = True):
     ticks = []
-    nw_pool = []
     imgs = ['']
     pres = prefixes.split(',')
     if pres[0] == '':
         pres = ['00']
+    # Only the nonwinners are used here, so the winners never need to be tagged.
+    nw_pool = NumberPool(lambda: ng.build_number_pools(first, last, pres, first, last)[1])
     while len(ticks) < amt:
-        if len(nw_pool) < spots:
-            # Adding 'RED' to provide a DesignMerge tag. It won't be used, but it's needed.
-            wins, nw_pool = ng.create_number_pools(first, last, pres, first, last,
-                                                   'RED', False)
-        nums = []
-        for _ in range(spots):
-            nums.append(nw_pool.pop(0))
+        nums = nw_pool.take(spots)
         tick = uTick('', imgs, nums, 1, 1, is_first)
         ticks.append(tick)
         is_first = False
@@ -36,7 +33,7 @@ def extract_ticket_types(game_specs):
     return [game_specs[1].pop(0), game_specs[2].pop(0), game_specs[3].pop(0), game_specs[4].pop(0)]
 
 
-def create_game(game_specs):
+def create_game(game_specs, progress: Progress = NO_PROGRESS):
     global nw_type, insta_type, pick_type, hold_type, suffix
     if DEBUG:
         print(game_specs)
@@ -5,6 +5,8 @@ from ticketing import number_generator as ng
 from ticketing import image_generator as ig
 from ticketing import game_info_gui as gi
 from ticketing import ticket_io as tio
+from ticketing.number_pool import NumberPool
+from ticketing.progress import NO_PROGRESS, Progress
 
 import random as rn
 
@@ -14,7 +16,7 @@ img_suffix = ''
 
 
 def create_nonwinner_numbered_tickets(amt: int, spots: int, first: int, last: int, suffixes: str, base: str,
-                                      nw_pool: list[str], addl_imgs: gi.AddImages, addl_nums: int,
+                                      nw_pool: NumberPool | None, addl_imgs: gi.AddImages, addl_nums: int,
                                       is_first: bool = False):
     """
     Create a list of nonwinner tickets, each comprised of a specified number of numbered integers. Add
@@ -31,7 +33,8 @@ def create_nonwinner_numbered_tickets(amt: int, spots: int, first: int, last: in
     :type suffixes: str
     :param base: The base image name.
     :type base: str
-    :param nw_pool:
+    :param nw_pool: The pool to take the integers from (None creates one from the range and suffixes).
+    :type nw_pool: NumberPool | None
     :param addl_imgs:
     :param addl_nums:
     :param is_first:
@@ -50,18 +53,14 @@ def create_nonwinner_numbered_tickets(amt: int, spots: int, first: int, last: in
         base = f'{base}{img_suffix}'
     # Add any additional images slots necessary to properly format the csv.
     imgs = ig.add_additional_image_slots(addl_imgs, [base])
+    # The pool replenishes its own supply of integers whenever it runs out.
+    if nw_pool is None:
+        nw_pool = ng.create_nonwinner_number_pool(first, last, exclusions)
     # Create a list for the tickets and loop until there are the required amount.
     ticks = []
     while len(ticks) < amt:
-        # If there aren't enough available integers to create a new ticket, replenish
-        # the supply of integers.
-        if len(nw_pool) < spots:
-            nw_pool = ng.create_number_pools_from_suffix_list(first, last, exclusions, True)
-        # Create a list to hold the integers, then pop off the next one until
-        # there are enough to satisfy the requirements.
-        numbs = []
-        for _ in range(spots):
-            numbs.append(nw_pool.pop(0))
+        # Take the integers for this ticket off the pool.
+        numbs = nw_pool.take(spots)
         # Add any additional number slots necessary to properly format the csv.
         for _ in range(addl_nums):
             numbs.append('')
@@ -158,7 +157,7 @@ def extract_ticket_types(game_specs):
     return [game_specs[1].pop(0), game_specs[2].pop(0), game_specs[3].pop(0), game_specs[4].pop(0)]
 
 
-def create_game(game_specs):
+def create_game(game_specs, progress: Progress = NO_PROGRESS):
     global nw_type, insta_type, pick_type, hold_type, img_suffix
     if DEBUG:
         print('\nGame Specs:\n')
@@ -175,7 +174,7 @@ def create_game(game_specs):
     ups, permies, sheets, capacities, reset, subflats, schisms = sheet_specs
     partname = name_specs[0]
     filename = name_specs[1]
-    nons_pool = []
+    nons_pool = None
     nw_addl_imgs = gi.AddImages.NoneAdded
     inst_addl_imgs = gi.AddImages.NoneAdded
     pick_addl_imgs = gi.AddImages.NoneAdded
@@ -1,11 +1,13 @@
 import copy
-import re
 
 from ticketing.universal_ticket import UniversalTicket as uTick
 from ticketing import number_generator as ng
 from ticketing import image_generator as ig
 from ticketing import game_info_gui as gi
 from ticketing import ticket_io as tio
+from ticketing.number_pool import NumberPool
+from ticketing.tagged_number import NumberTag, TaggedNumber
+from ticketing.progress import NO_PROGRESS, Progress
 # from helpers import extract_ticket_types
 
 import random as rn
@@ -48,7 +50,7 @@ def create_instant_winner_image_tickets(amt_list: list[list[int | bool]],
 
 
 def create_instant_winner_shaded_tickets(shades: list[list[str | int | bool]], first: int, last: int,
-                                         spots: int, cd_tier: int, exclusions: str, nw_pool: list[str],
+                                         spots: int, cd_tier: int, exclusions: str, nw_pool: NumberPool | None,
                                          addl_imgs: gi.AddImages, num_slots: int, is_first: bool):
     ticks = []
     exclusions = exclusions.split(',')
@@ -80,7 +82,7 @@ def create_hold_shaded_tickets(shades: list[list[str | int | bool]], first: int,
                                num_slots: int, is_first: bool = False):
     global suffix
     ticks = []
-    nw_pool = []
+    nw_pool = None
     addl_nums = num_slots - spots
     exclusions = exclusions.split(',')
     for hold in shades:
@@ -114,28 +116,24 @@ def create_hold_shaded_tickets(shades: list[list[str | int | bool]], first: int,
 def create_shaded_ticket(addl_nums, color, exclusions, first, full, imgs, is_first,
                          last, nw_pool, shade, spots, pi: bool = False):
     global suffix
-    if len(nw_pool) < spots - 1:
-        nw_pool = ng.create_number_pools_from_suffix_list(first, last, exclusions, True)
-    numbs = []
-    if full:
-        numbs.append(f'<@{color}FONT>{shade}')
-    else:
-        numbs.append(f'{shade[:-2]}<@{color}FONT>{shade[-2:]}')
-    for _ in range(spots - 1):
-        numbs.append(nw_pool.pop(0))
+    # The first shaded ticket of a game creates the pool, and everything after it shares it.
+    if nw_pool is None:
+        nw_pool = ng.create_nonwinner_number_pool(first, last, exclusions)
+    # The shaded number keeps its tag to itself until the ticket is written out (zero-filled to the
+    # width it was given in).
+    numbs = [TaggedNumber(int(shade), NumberTag(f'{color}FONT', full), len(shade))]
+    numbs += nw_pool.take(spots - 1)
     for _ in range(rn.randint(5, 11)):
         rn.shuffle(numbs)
     for _ in range(addl_nums):
         numbs.append('')
-    match = r'FONT'
-    index = 0
     base_images = copy.deepcopy(imgs)
     # If there is a 'plus image', find which spot the shaded number is at and
     # add a hold image for that space. (See 31891, Stars for reference).
     if pi:
         offset = -len(suffix)
         for i in range(len(numbs)):
-            if re.search(match, numbs[i]):
+            if isinstance(numbs[i], TaggedNumber):
                 base_images[0] = f'{base_images[0][:offset]}-{str(i + 1).zfill(2)}{base_images[0][offset:]}'
                 break
     tick = uTick('', base_images, numbs, 1, 1, is_first)
@@ -167,7 +165,8 @@ def parse_shaded_list(hold):
 
 
 def create_nonwinner_numbers(amt: int, spots: int, first: int, last: int, exclusions: str, base: str,
-                             nw_pool: list[str], addl_imgs: gi.AddImages, num_slots: int, is_first: bool = False):
+                             nw_pool: NumberPool | None, addl_imgs: gi.AddImages, num_slots: int,
+                             is_first: bool = False):
     global suffix
     if exclusions == '':
         exclusions = ['00']
@@ -178,12 +177,10 @@ def create_nonwinner_numbers(amt: int, spots: int, first: int, last: int, exclus
     addl_nums = num_slots - spots
     imgs = ig.add_additional_image_slots(addl_imgs, [base])
     ticks = []
+    if nw_pool is None:
+        nw_pool = ng.create_nonwinner_number_pool(first, last, exclusions)
     while len(ticks) < amt:
-        if len(nw_pool) < spots:
-            nw_pool = ng.create_number_pools_from_suffix_list(first, last, exclusions, True)
-        numbs = []
-        for _ in range(spots):
-            numbs.append(nw_pool.pop(0))
+        numbs = nw_pool.take(spots)
         for _ in range(addl_nums):
             numbs.append('')
         tick = uTick('', imgs, numbs, 1, 1, is_first)
@@ -212,7 +209,7 @@ def extract_ticket_types(game_specs):
     return [game_specs[1].pop(0), game_specs[2].pop(0), game_specs[3].pop(0), game_specs[4].pop(0)]
 
 
-def create_game(game_specs):
+def create_game(game_specs, progress: Progress = NO_PROGRESS):
     global nw_type, insta_type, pick_type, hold_type, suffix
     print(game_specs)
     first_time = True
@@ -229,7 +226,7 @@ def create_game(game_specs):
     filename = name_specs[1]
 
     tickets = []
-    nons_pool = []
+    nons_pool = None
     ceedee_tier = 0
 
     num_count = get_total_number_spots(nw_specs, insta_specs, pick_specs, hold_specs)
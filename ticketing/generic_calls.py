@@ -2,6 +2,7 @@ from ticketing import ticket_io as tio
 from ticketing import game_info_gui as gi
 from ticketing import image_generator as ig
 from ticketing import number_generator as ng
+from ticketing.progress import NO_PROGRESS, Progress
 
 from ticketing.universal_ticket import UniversalTicket
 
@@ -24,9 +25,9 @@ def create_instant_winners(amt: list[int], cd_tier, subs, tkt, addl_imgs, nummie
     return ticks
 
 
-def create_hold_tickets(amt, spots, tkt):
+def create_hold_tickets(amt, spots, tkt, progress: Progress = NO_PROGRESS):
     ticks = []
-    lines = ng.create_unique_bingo_lines(amt, spots, False, False, False)
+    lines = ng.create_unique_bingo_lines(amt, spots, False, False, False, progress=progress)
     imgs = ['base01.ai', '', '', '']
     for line in lines:
         ticks.append(UniversalTicket(tkt, imgs, line))
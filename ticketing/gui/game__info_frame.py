@@ -2,6 +2,7 @@ import tkinter as tk
 import ttkbootstrap as ttk
 
 from ticketing import game_info_gui as gi
+from ticketing.ledger_store import check_reservation_name
 
 from .helpers import create_label_and_field
 from .ticketing__frame import TicketingFrame
@@ -95,6 +96,19 @@ class GameInfoFrame(TicketingFrame):
         ai_button.grid(row=3, column=1, padx=10, pady=5)
         pdf_button.grid(row=3, column=2, padx=10, pady=5)
 
+        # Ledger Folder: A text-entry box holding the folder of the ledger store shared by verified bingo games that
+        #                are played together. Blank means the game doesn't use a store.
+        #                Default: ''
+        label, input_field = create_label_and_field("Ledger Folder", ttk.Entry(self, width=20), 4, 0,
+                                                    self, input_span=2)
+        self.populate_data_collections(input_field, label)
+
+        # Reservation: A text-entry box holding the name this game's winning paths are reserved under in the store.
+        #              Default: ''
+        label, input_field = create_label_and_field("Reservation", ttk.Entry(self, width=12), 4, 3,
+                                                    self)
+        self.populate_data_collections(input_field, label)
+
     def validate_data(self) -> list[str]:
         """
         Validates the entered game information.
@@ -122,6 +136,21 @@ class GameInfoFrame(TicketingFrame):
                 if not self.data_dictionary[label_text].isdigit() or int(self.data_dictionary[label_text]) < 0:
                     messages.append(f"Game Information: '{label_text}' must contain a non-negative integer.")
 
+        # A ledger store needs a name to reserve the game's paths under, and the name has to be usable as a file
+        # name. Catch a bad one now rather than after the faces have been made.
+        ledger_folder = self.data_dictionary["Ledger Folder"].strip()
+        reservation = self.data_dictionary["Reservation"].strip()
+        if ledger_folder and not reservation:
+            messages.append("Game Information: A Reservation name is needed to use a Ledger Folder.")
+        elif reservation and not ledger_folder:
+            messages.append("Game Information: A Reservation needs a Ledger Folder to be kept in.")
+        elif reservation:
+            try:
+                check_reservation_name(reservation)
+            except ValueError:
+                messages.append(f"Game Information: Reservation '{reservation}' can only contain letters, numbers, "
+                                f"dots, dashes, and underscores.")
+
         # If there's already an error, return the errors so the user can fix them. There's no point
         # in continuing if these basic values aren't correct.
         if len(messages) > 0:
@@ -227,13 +256,16 @@ class GameInfoFrame(TicketingFrame):
             reset_pool=self.data_dictionary["Reset"],
             subflats=int(self.data_dictionary["Subflats"]),
             schisms=int(self.data_dictionary["Schisms"]),
-            image_suffix=self.data_dictionary["Suffix"]
+            image_suffix=self.data_dictionary["Suffix"],
+            ledger_folder=self.data_dictionary["Ledger Folder"].strip(),
+            reservation=self.data_dictionary["Reservation"].strip()
         )
 
     def create_defaults(self):
         """
         Initializes the `defaults` dictionary with default values for each field.
         """
-        self.defaults = {"Window Structure": '', "Reset": '!selected', "Schisms": '0', "Subflats": '0'}
+        self.defaults = {"Window Structure": '', "Reset": '!selected', "Schisms": '0', "Subflats": '0',
+                         "Ledger Folder": '', "Reservation": ''}
         for key in ['Ups', 'Permutations', 'Sheets']:
             self.defaults[key] = '1'
@@ -6,6 +6,8 @@ from ticketing.ticket_models import GameInfo, Ticket, NamesData
 
 from ticketing import game_info_gui as gi
 from ticketing.game_registry import get_game_creator
+from ticketing.bingo_planner import plan_bingo_holds
+from ticketing.progress import Progress, ProgressEvent
 
 from .result_message_box import ResultMessageBox
 
@@ -42,6 +44,7 @@ pick_type = ""
 hold_type = ""
 
 output_folder = ''
+status_label: Optional[ttk.Label] = None
 DEBUG = False
 
 
@@ -58,7 +61,7 @@ def create_gui():
 
     :return: None
     """
-    global gui_frames, gui_frame_labels
+    global gui_frames, gui_frame_labels, status_label
     root = ttk.Window(themename="superhero")
     root.title("Multi-Purpose CSV Generator")
     # Configure default styles to increase font size globally
@@ -78,6 +81,10 @@ def create_gui():
     submit_button = ttk.Button(root, text="Submit", command=lambda: submit_data(root) if validate_data(root) else None)
     submit_button.grid(row=7, column=0, columnspan=2, pady=10)
 
+    # Status line for the progress of the generators while a game is being created.
+    status_label = ttk.Label(root, text='')
+    status_label.grid(row=8, column=0, columnspan=2, pady=(0, 10))
+
     root.mainloop()
 
 
@@ -241,7 +248,8 @@ def submit_data(root):
             hold_specs,
             name_specs,
             output_folder
-        ])
+        ], progress=Progress(lambda event: show_progress(root, event)))
+        show_progress(root, None)
         final_message = f"{verification_output}\n\n{'-' * 30}\n\n{creation_output}"
         ResultMessageBox(root, "Results", str(final_message))
     except Exception as e:
@@ -251,6 +259,27 @@ def submit_data(root):
         ResultMessageBox(root, "Execution Error", f"An error occurred during generation:\n{str(e)}")
 
 
+def show_progress(root, event: ProgressEvent | None) -> None:
+    """
+    Show a generator's progress on the status line. The window is redrawn right away, since the generators
+    run on the GUI thread and it wouldn't get a chance to otherwise.
+
+    :param root: The root tkinter window.
+    :type root: tkinter.Tk
+    :param event: The latest progress event (None clears the status line).
+    :type event: ProgressEvent | None
+    :return: None
+    """
+    if status_label is None:
+        return
+    if event is None:
+        status_label.configure(text='')
+    else:
+        status_label.configure(text=f"{event.stage}: {event.done:,} of {event.total:,} "
+                                    f"({event.fraction:.0%}, {event.rejects:,} rejected)")
+    root.update_idletasks()
+
+
 def print_initial_data_gathering(gamey_data, holding_type, insta_type, now_type, picky_type):
     """
     Prints initial data gathering information including details about nonwinners,
@@ -302,6 +331,13 @@ def verify_all_specifications():
         True
     )
 
+    # --- 3. VERIFIED BINGO FEASIBILITY ---
+    # Bingo holds can run out of faces long after generation starts, so predict that up front.
+    if isinstance(hold_specs, HoldBingosTicket):
+        report = plan_bingo_holds(hold_specs, game_specs.permutations, game_specs.reset_pool)
+        result = f"{result}---------------------------\n{report.summary()}\n"
+        proceed = proceed and report.feasible
+
     print(result)
     print(proceed)
     return proceed, result
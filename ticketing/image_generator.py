@@ -3,6 +3,7 @@ import random as rn
 from itertools import cycle, permutations, combinations
 from ticketing.game_info_gui import AddImages
 from .number_generator import create_bingo_positions
+from .progress import NO_PROGRESS, Progress
 
 
 def create_tiered_image_list(amt_list: list[int], prefix: str, add_subimages: bool,
@@ -220,19 +221,37 @@ def create_image_lists_from_pool_perms(first: int, last: int, prefix: str, amt:
     return images_lists
 
 
-def create_bingo_ball_image_permutations(amt: int, bpt: int, permits: int, prefix: str,
-                                         sortie: bool, coda: str = '.ai') -> list[list[list[str]]]:
+def create_bingo_ball_image_permutations(amt: int, bpt: int, permits: int, prefix: str, sortie: bool,
+                                         coda: str = '.ai', progress: Progress = NO_PROGRESS) -> list[list[list[str]]]:
+    """
+    Create permutations of bingo ball image lists, none of which repeats a combination of balls used by another.
+
+    :param amt: number of tickets in each permutation
+    :type amt: int
+    :param bpt: number of bingo balls per ticket
+    :type bpt: int
+    :param permits: number of permutations needed
+    :type permits: int
+    :param prefix: image name prefix
+    :type prefix: str
+    :param sortie: sort each ticket's balls in ascending order?
+    :type sortie: bool
+    :param coda: image file extension
+    :type coda: str
+    :param progress: where to report how many permutations have been made (and how many attempts were thrown out)
+    :type progress: Progress
+    :return: list of permutations, each a list of image lists
+    :rtype: list[list[list[str]]]
+    """
     perms = []
     tookens = set()
     attempts = 0
     while len(perms) < permits:
         attempts += 1
         perm, tookens = create_single_bingo_ball_perm(amt, bpt, prefix, sortie, tookens, coda)
-        if attempts % 500 == 0:
-            print(f'Attempted {attempts} permutations...')
         if perm is not None:
             perms.append(perm)
-    print(f'Created {len(perms)} permutations after {attempts} attempts.')
+        progress.report('Bingo ball permutations', len(perms), permits, attempts - len(perms))
     return perms
 
 
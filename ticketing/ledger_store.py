@@ -0,0 +1,251 @@
+"""
+Persistent winning-path ledgers for games that are played together.
+
+Within a single call to create_all_bingo_permutations_without_reset, every permutation's winning paths are kept apart
+by the face list's paths taken ledger. That ledger disappears when the job does, though, so games generated in
+separate jobs for the same venue could share paths. A LedgerStore keeps the paths on disk instead:
+
+|  <catalog>-<encoding>.ledger:    header followed by a bitmap with one bit for every possible path (the union of
+|                                  every reservation), memory-mapped and updated in place
+|  <catalog>-<encoding>.d/*.npy:   one packed bitmap for each named reservation (a job, or a part of one)
+|  <catalog>-<encoding>.lock:      lock file held while the store is being changed
+
+A job takes a snapshot of the union before it starts, so its lookups run against an ordinary in-memory PathLedger
+and are just as fast as they always were. When it's done, it reserves the paths it added under a name. The
+reservation happens under the lock and is checked against the union as it is *then*, so two jobs that ran at the
+same time can't both claim the same path. Releasing a reservation removes its file and rebuilds the union from the
+ones that are left (the reservation files are the record of what's taken; the union is just a fast copy of them).
+"""
+import os
+import re
+import struct
+import time
+
+import numpy as np
+
+from .path_ledger import PATH_SPACE, PathLedger
+
+MAGIC = b'BINGOLDG'
+VERSION = 1
+# magic, version, path space (padded so the bitmap starts on a 16 byte boundary)
+HEADER = struct.Struct('<8sHI2x')
+# Paths are encoded in base 15, one digit per column (see path_ledger).
+ENCODING = 'base15'
+BITMAP_BYTES = (PATH_SPACE + 7) // 8
+# Seconds to wait for another job to let go of the lock.
+LOCK_TIMEOUT = 30.0
+LOCK_POLL = 0.05
+RESERVATION_NAME = re.compile(r'^[A-Za-z0-9][A-Za-z0-9._-]*$')
+
+
+def check_reservation_name(name: str) -> None:
+    """
+    Make sure a name can be used for a reservation (it becomes part of a file name), so a job can find out before
+    it starts rather than when it's trying to save its paths.
+
+    :param name: reservation name (letters, numbers, dots, dashes, and underscores)
+    :type name: str
+    :return: None
+    :rtype: None
+    """
+    if not RESERVATION_NAME.match(name):
+        raise ValueError(f"'{name}' can't be used as a reservation name.")
+
+
+class LedgerStore(object):
+    """
+    On-disk record of the winning paths reserved by every job in a group of games that are played together.
+    """
+
+    def __init__(self, directory: str, extended: bool = False):
+        """
+        :param directory: folder the store's files live in (created if it doesn't exist)
+        :type directory: str
+        :param extended: does the store belong to the extended catalog?
+        :type extended: bool
+        """
+        os.makedirs(directory, exist_ok=True)
+        stem = os.path.join(directory, f"{'extended' if extended else 'standard'}-{ENCODING}")
+        self.path = f'{stem}.ledger'
+        self.reservation_folder = f'{stem}.d'
+        self.lock_path = f'{stem}.lock'
+        os.makedirs(self.reservation_folder, exist_ok=True)
+        if not os.path.exists(self.path):
+            with self.locked():
+                if not os.path.exists(self.path):
+                    # Write the empty ledger to the side and swap it in, so nobody ever maps half a file.
+                    temp_name = f'{self.path}.{os.getpid()}.tmp'
+                    with open(temp_name, 'wb') as handle:
+                        handle.write(HEADER.pack(MAGIC, VERSION, PATH_SPACE))
+                        handle.write(bytes(BITMAP_BYTES))
+                    os.replace(temp_name, self.path)
+        # Make sure whatever is there is a ledger this version can use.
+        self._map()
+
+    def _map(self, writable: bool = False) -> np.memmap:
+        """
+        Check the ledger file's header and memory-map its bitmap. (The map isn't kept around between calls, so
+        nothing holds the file open while another job is working with it.)
+
+        :param writable: map the bitmap for writing (the lock must be held)
+        :type writable: bool
+        :return: view of the union bitmap
+        :rtype: np.memmap
+        """
+        with open(self.path, 'rb') as handle:
+            magic, version, space = HEADER.unpack(handle.read(HEADER.size))
+        if magic != MAGIC or version != VERSION or space != PATH_SPACE:
+            raise ValueError(f"{self.path} isn't a version {VERSION} path ledger for {PATH_SPACE} paths.")
+        return np.memmap(self.path, dtype=np.uint8, mode='r+' if writable else 'r', offset=HEADER.size,
+                         shape=(BITMAP_BYTES,))
+
+    def _reservation_path(self, name: str) -> str:
+        """
+        Return the file a reservation is kept in.
+
+        :param name: reservation name (letters, numbers, dots, dashes, and underscores)
+        :type name: str
+        :return: reservation file
+        :rtype: str
+        """
+        check_reservation_name(name)
+        return os.path.join(self.reservation_folder, f'{name}.npy')
+
+    def locked(self) -> '_StoreLock':
+        """
+        Return a context manager that holds the store's lock file.
+
+        :return: lock
+        :rtype: _StoreLock
+        """
+        return _StoreLock(self.lock_path)
+
+    def snapshot(self) -> PathLedger:
+        """
+        Return an in-memory ledger holding every path that's reserved right now.
+
+        :return: paths taken by every reservation
+        :rtype: PathLedger
+        """
+        return PathLedger(self._map())
+
+    def reservations(self) -> list[str]:
+        """
+        Return the names of the reservations in the store.
+
+        :return: reservation names
+        :rtype: list[str]
+        """
+        return sorted(entry[:-4] for entry in os.listdir(self.reservation_folder) if entry.endswith('.npy'))
+
+    def reserved(self, name: str) -> PathLedger:
+        """
+        Return the paths held by a reservation.
+
+        :param name: reservation name
+        :type name: str
+        :return: paths in the reservation
+        :rtype: PathLedger
+        """
+        return PathLedger(np.load(self._reservation_path(name)))
+
+    def reserve(self, name: str, paths: PathLedger, base: PathLedger | None = None) -> int:
+        """
+        Reserve paths under a name. If base is passed, only the paths that aren't in it are reserved (pass the
+        snapshot a job started from, along with its final ledger, to reserve just the paths the job added).
+
+        :param name: reservation name (must not already be in use)
+        :type name: str
+        :param paths: paths to reserve
+        :type paths: PathLedger
+        :param base: paths to leave out
+        :type base: PathLedger | None
+        :return: number of paths reserved
+        :rtype: int
+        """
+        bits = paths.bits if base is None else paths.bits & ~base.bits
+        reservation_path = self._reservation_path(name)
+        with self.locked():
+            if os.path.exists(reservation_path):
+                raise ValueError(f"There is already a reservation named '{name}'.")
+            union = self._map(writable=True)
+            collisions = int(np.unpackbits(union & bits).sum(dtype=np.int64))
+            if collisions > 0:
+                raise ValueError(f"{collisions} of the paths for '{name}' have already been reserved by another job.")
+            # The reservation file goes first: if something goes wrong before the union is written, rebuild()
+            # brings the union back in line with the reservations.
+            temp_name = f'{reservation_path}.{os.getpid()}.tmp'
+            with open(temp_name, 'wb') as handle:
+                np.save(handle, bits)
+            os.replace(temp_name, reservation_path)
+            union |= bits
+            union.flush()
+        return int(np.unpackbits(bits).sum(dtype=np.int64))
+
+    def release(self, name: str) -> None:
+        """
+        Give up a reservation's paths so later jobs can use them again.
+
+        :param name: reservation name
+        :type name: str
+        :return: None
+        :rtype: None
+        """
+        reservation_path = self._reservation_path(name)
+        with self.locked():
+            if not os.path.exists(reservation_path):
+                raise ValueError(f"There is no reservation named '{name}'.")
+            os.remove(reservation_path)
+            self._rebuild()
+
+    def rebuild(self) -> None:
+        """
+        Rebuild the union from the reservation files.
+
+        :return: None
+        :rtype: None
+        """
+        with self.locked():
+            self._rebuild()
+
+    def _rebuild(self) -> None:
+        """
+        Rebuild the union from the reservation files (the lock must be held).
+
+        :return: None
+        :rtype: None
+        """
+        bits = np.zeros(BITMAP_BYTES, dtype=np.uint8)
+        for name in self.reservations():
+            bits |= np.load(self._reservation_path(name))
+        union = self._map(writable=True)
+        union[:] = bits
+        union.flush()
+
+
+class _StoreLock(object):
+    """
+    Exclusive lock on a store, held by creating its lock file. Creating a file that must not already exist is
+    atomic on every platform, so only one process can hold it at a time.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def __enter__(self) -> '_StoreLock':
+        deadline = time.monotonic() + LOCK_TIMEOUT
+        while True:
+            try:
+                handle = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Gave up waiting for {self.path}. If no other job is using the store, "
+                                       f"delete the file and try again.")
+                time.sleep(LOCK_POLL)
+                continue
+            os.write(handle, str(os.getpid()).encode('ascii'))
+            os.close(handle)
+            return self
+
+    def __exit__(self, *exc) -> None:
+        os.remove(self.path)
@@ -1,11 +1,234 @@
 import random as rn
 import copy
 import itertools as itty
+from functools import lru_cache
 from typing import List, Tuple
 
+import numpy as np
+
+from .number_pool import NumberPool, as_number_pool
+from .progress import NO_PROGRESS, Progress
+from .range_sampler import RangeSampler
+from .tagged_number import NumberTag, TaggedNumber
+
+# Number pools are built a whole range at a time with NumPy. A number's "suffix" is its last two characters, which is
+# n % 100 (zero-filled) for anything from 10 up, but just the one digit for 0 - 9. Every suffix gets a key in a lookup
+# table: 0 - 99 for the two-digit endings and 100 - 109 for the single digits.
+SUFFIX_KEYS = 110
+SINGLE_DIGIT_KEYS = 100
+# Nonwinner ranges holding more numbers than this are sampled lazily (see range_sampler) rather than listed.
+SAMPLED_RANGE = 1 << 20
+# Filtered nonwinner ranges kept for reuse across refills, tickets, and jobs (the least recently used ones go first).
+FILTERED_RANGE_CACHE = 8
+
+
+def suffix_key(suffix: str, padded: bool = False) -> int | None:
+    """
+    Return the lookup table key of a suffix string, or None if no number can end with it.
+
+    :param suffix: one or two digit suffix
+    :type suffix: str
+    :param padded: are the numbers zero-filled to two digits (so a one-digit suffix never matches)?
+    :type padded: bool
+    :return: lookup table key
+    :rtype: int | None
+    """
+    if not (suffix.isascii() and suffix.isdigit()):
+        return None
+    if len(suffix) == 2:
+        return int(suffix)
+    if len(suffix) == 1 and not padded:
+        return SINGLE_DIGIT_KEYS + int(suffix)
+    return None
+
+
+def suffix_keys(numbers: np.ndarray, padded: bool = False) -> np.ndarray:
+    """
+    Return the lookup table key of every number's suffix.
+
+    :param numbers: non-negative integers
+    :type numbers: np.ndarray
+    :param padded: are the numbers zero-filled to two digits?
+    :type padded: bool
+    :return: lookup table keys
+    :rtype: np.ndarray
+    """
+    keys = numbers % 100
+    if padded:
+        return keys
+    return np.where(numbers < 10, numbers + SINGLE_DIGIT_KEYS, keys)
+
+
+def suffix_table(suffixes: list[str], padded: bool = False) -> np.ndarray:
+    """
+    Build a lookup table holding the position of each suffix in the list (-1 for the keys that aren't in it). When a
+    suffix is listed more than once, its first position is the one that's kept.
+
+    :param suffixes: suffix strings
+    :type suffixes: list[str]
+    :param padded: are the numbers zero-filled to two digits?
+    :type padded: bool
+    :return: suffix positions, indexed by key
+    :rtype: np.ndarray
+    """
+    table = np.full(SUFFIX_KEYS, -1, dtype=np.int16)
+    for index in reversed(range(len(suffixes))):
+        key = suffix_key(suffixes[index], padded)
+        if key is not None:
+            table[key] = index
+    return table
+
+
+def repdigit_mask(numbers: np.ndarray) -> np.ndarray:
+    """
+    Flag the numbers whose digits are all the same (which includes every single-digit number).
+
+    :param numbers: non-negative integers
+    :type numbers: np.ndarray
+    :return: True where all the digits are the same
+    :rtype: np.ndarray
+    """
+    if len(numbers) == 0:
+        return np.zeros(0, dtype=bool)
+    # There are only nine of them for each length, so list them all and look the numbers up.
+    repunits = [(10 ** length - 1) // 9 for length in range(1, len(str(int(numbers.max()))) + 1)]
+    return np.isin(numbers, [0] + [digit * repunit for repunit in repunits for digit in range(1, 10)])
+
+
+def shuffle_numbers(numbers: np.ndarray) -> np.ndarray:
+    """
+    Return the numbers in random order (seeded from the random module, so a seeded job shuffles the same way).
+
+    :param numbers: numbers to shuffle
+    :type numbers: np.ndarray
+    :return: shuffled copy
+    :rtype: np.ndarray
+    """
+    return np.random.default_rng(rn.getrandbits(64)).permutation(numbers)
+
+
+def build_number_pools(first_number: int, last_number: int, winner_suffix: list[str], smallest_nw: int,
+                       biggest_winner: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Split the numbers between first_number and last_number into winners and nonwinners (see create_number_pools).
+    The winners are left in order and untagged (see tagged_number).
+
+    :param first_number: lowest number in pool
+    :type first_number: int
+    :param last_number: the highest number in pool
+    :type last_number: int
+    :param winner_suffix: number endings to set aside for winning tickets
+    :type winner_suffix: list[str]
+    :param smallest_nw: lowest nonwinning number
+    :type smallest_nw: int
+    :param biggest_winner: the highest possible winning number
+    :type biggest_winner: int
+    :return: winning numbers and shuffled nonwinning numbers
+    :rtype: tuple[np.ndarray, np.ndarray]
+    """
+    numbers = np.arange(first_number, last_number + 1, dtype=np.int64)
+    suffixed = suffix_table(winner_suffix)[suffix_keys(numbers)] >= 0
+    # Numbers with a winning suffix above the biggest winner are thrown out altogether, so nobody mistakes them
+    # for winners.
+    winners = numbers[suffixed & (numbers <= biggest_winner)]
+    nonwinners = numbers[~suffixed & (numbers >= smallest_nw)]
+    return winners, shuffle_numbers(nonwinners)
+
+
+def build_nonwinner_pool(first_nw: int, last_nw: int, flags: list[str], mixed: bool = True) -> np.ndarray:
+    """
+    Return the numbers between first_nw and last_nw that don't end with one of the flagged suffixes (or with '00')
+    and don't have all the same digits (see create_number_pools_from_suffix_list). The filtered range is cached
+    (see filtered_range), so building the same pool again only costs a shuffle. Ranges too big to be sampled from a
+    listed pool are filtered every time instead of being cached.
+
+    :param first_nw: first nonwinning number
+    :type first_nw: int
+    :param last_nw: last nonwinning number
+    :type last_nw: int
+    :param flags: suffixes to be thrown out
+    :type flags: list[str]
+    :param mixed: does the pool need to be shuffled
+    :type mixed: bool
+    :return: nonwinning numbers
+    :rtype: np.ndarray
+    """
+    flags = frozenset(flags).union(['00'])
+    if last_nw - first_nw + 1 > SAMPLED_RANGE:
+        nonwinners = filtered_range.__wrapped__(first_nw, last_nw, flags)
+    else:
+        nonwinners = filtered_range(first_nw, last_nw, flags)
+    return shuffle_numbers(nonwinners) if mixed else nonwinners.copy()
+
+
+@lru_cache(maxsize=FILTERED_RANGE_CACHE)
+def filtered_range(first_nw: int, last_nw: int, flags: frozenset[str]) -> np.ndarray:
+    """
+    Return the numbers between first_nw and last_nw that pass nonwinner_mask, filtering the range the first time
+    it's asked for. Refilling a pool only needs a reshuffle of the shared (read-only) copy after that.
+
+    :param first_nw: first nonwinning number
+    :type first_nw: int
+    :param last_nw: last nonwinning number
+    :type last_nw: int
+    :param flags: suffixes to be thrown out
+    :type flags: frozenset[str]
+    :return: nonwinning numbers, in order
+    :rtype: np.ndarray
+    """
+    numbers = np.arange(first_nw, last_nw + 1, dtype=np.int64)
+    nonwinners = numbers[nonwinner_mask(numbers, list(flags))]
+    nonwinners.flags.writeable = False
+    return nonwinners
+
+
+def nonwinner_mask(numbers: np.ndarray, flags: list[str]) -> np.ndarray:
+    """
+    Flag the numbers that can be used as nonwinners: the ones that don't end with one of the flagged suffixes (or
+    with '00') and don't have all the same digits.
+
+    :param numbers: non-negative integers
+    :type numbers: np.ndarray
+    :param flags: suffixes to be thrown out
+    :type flags: list[str]
+    :return: True where the number can be used
+    :rtype: np.ndarray
+    """
+    flagged = suffix_table(list(flags) + ['00'])[suffix_keys(numbers)] >= 0
+    return ~flagged & ~repdigit_mask(numbers)
+
+
+def build_multi_suffixed_pools(first_number: int, last_number: int, suffixes: dict[str, list[str | int | bool]],
+                               smallest_nw: int, biggest_nw: int) -> tuple[list[np.ndarray], np.ndarray]:
+    """
+    Split the numbers between first_number and last_number into a list of winners for each suffix and a list of
+    nonwinners (see create_multi_suffixed_number_pools). Everything is left in order and untagged.
+
+    :param first_number: lowest number in pool
+    :type first_number: int
+    :param last_number: the highest number in pool
+    :type last_number: int
+    :param suffixes: dictionary containing suffixes and their first and last winners
+    :type suffixes: dict[str, list[str | int| bool]]
+    :param smallest_nw: lowest nonwinning number
+    :type smallest_nw: int
+    :param biggest_nw: highest nonwinning number
+    :type biggest_nw: int
+    :return: winning numbers for each suffix (in dictionary order) and nonwinning numbers
+    :rtype: tuple[list[np.ndarray], np.ndarray]
+    """
+    numbers = np.arange(first_number, last_number + 1, dtype=np.int64)
+    # The numbers are treated as zero-filled to two digits here, so '07' matches 7 as well as 107.
+    positions = suffix_table(list(suffixes.keys()), True)[suffix_keys(numbers, True)]
+    winners = [numbers[(positions == index) & (numbers >= details[0]) & (numbers <= details[1])]
+               for index, details in enumerate(suffixes.values())]
+    nonwinners = numbers[(positions < 0) & (numbers >= smallest_nw) & (numbers <= biggest_nw)]
+    return winners, nonwinners
+
 
 def create_number_pools(first_number: int, last_number: int, winner_suffix: list[str], smallest_nw: int,
-                        biggest_winner: int, dm_tag_name: str, color_all_letters=False) -> list[list[str] | list[int]]:
+                        biggest_winner: int, dm_tag_name: str,
+                        color_all_letters=False) -> list[list[TaggedNumber] | list[str]]:
     """
     Create a pool of numbers between p_first and p_last. Place the results in two lists
     (winners and nonwinners) and return them to the caller. Winners are determined by
@@ -15,6 +238,9 @@ def create_number_pools(first_number: int, last_number: int, winner_suffix: list
     each discrete string's associated numbers placed in their own lists. All other numbers
     containing the strings are discarded to avoid confusion.
 
+    The pools themselves come from build_number_pools. The winners keep their DM tag alongside them as
+    TaggedNumbers, which aren't formatted until their tickets are written out.
+
     :param first_number: lowest number in pool
     :type first_number: int
     :param last_number: the highest number in pool
@@ -30,50 +256,22 @@ def create_number_pools(first_number: int, last_number: int, winner_suffix: list
     :param color_all_letters: are all digits in a winner to be changed to a new font or just the suffix?
     :type color_all_letters: bool
     :return: two lists: one for winners and another for nonwinners, i.e. [winners, nonwinners]
-    :rtype: list[list[str] | list[int]]
+    :rtype: list[list[TaggedNumber] | list[str]]
     """
     print(f"Creating number pools with the range {first_number} - {last_number}, with the suffix(es)"
           f" {winner_suffix} below {biggest_winner} being set aside for the winners, and {smallest_nw}"
           f" as the smallest possible nonwinner.")
-    # Create winning and losing number lists
-    win_numbers = []
-    nw_numbers = []
-    # Cycle through the numbers from the lowest to the highest to be used
-    for i in range(first_number, last_number + 1):
-        # Convert each to a string for easy comparison goodness
-        num = str(i)
-        # If the last two numerals match the passed suffix, check if it should be added to the winner list
-        if num[len(num) - 2:len(num)] in winner_suffix:
-            # We only care about winners up to the biggest value. If this falls below the threshold, add it
-            # to the winner list. Otherwise, discard it. We don't want any values that match the suffix
-            # to become part of the nonwinner list and create confusion with end users.
-            if i <= biggest_winner:
-                # If we need to use the DM tag to change the entire string, place it at the front
-                # of the string. Otherwise, insert the tag the suffix and the rest of the string.
-                num = num.zfill(3)
-                if color_all_letters:
-                    num = f'<@{dm_tag_name}>{num}'
-                else:
-                    num = num[:len(num) - 2] + f'<@{dm_tag_name}>' + num[len(num) - 2:]
-                win_numbers.append(num)
-        # If this nonwinning number is greater than or equal to the lower limit, add it to the list of nonwinners
-        # JUST MADE THIS REJECT TWO-DIGIT NUMBERS--CHECK THIS IF YOU WANT TO INCLUDE THEM
-        # elif i >= smallest_nw and i > 100:
-        elif i >= smallest_nw and i >= 0:
-            nw_numbers.append(num)
-    # Shuffle both lists 5 to 10 times
-    for _ in range(rn.randint(5, 10)):
-        # rn.shuffle(win_numbers)
-        rn.shuffle(nw_numbers)
-    # return [list[str], list[int]]
-    return [win_numbers, nw_numbers]
+    winners, nonwinners = build_number_pools(first_number, last_number, winner_suffix, smallest_nw, biggest_winner)
+    # Winners are zero-filled to three digits, with the DM tag in front of the whole number or just its suffix.
+    tag = NumberTag(dm_tag_name, color_all_letters)
+    return [[TaggedNumber(number, tag, 3) for number in winners.tolist()], nonwinners.astype(str).tolist()]
 
 
 def create_number_pools_from_suffix_list(first_nw: int, last_nw: int, flags: list[str], mixed: bool = True):
     """
     Create a list of numbers to be used as nonwinners for shaded (or other number) ticketing_games between the
     first and last values. Throw out any numbers that contain significant suffixes or where all the
-    digits are the same.
+    digits are the same (see build_nonwinner_pool).
 
     :param first_nw: first nonwinning number
     :type first_nw: int
@@ -86,39 +284,9 @@ def create_number_pools_from_suffix_list(first_nw: int, last_nw: int, flags: lis
     :return: a list of nonwinning integers
     :rtype: list[int]
     """
-    nw_numbers = []
-
-    def all_same_digits(numero):
-        """
-        Sub function to determine if all the digits in a given number are the same.
-
-        :param numero: the number to check
-        :type numero: int
-        :return: true if all the digits are the same, false otherwise
-        :rtype: bool
-        """
-        str_num = str(numero)
-        return all(digit == str_num[0] for digit in str_num)
-
-    # We'd rather not have any double zeroes at the end of any nonwinning integer,
-    # so add it to the list of suffixes if it's not already there.
-    if '00' not in flags:
-        flags.append('00')
-
-    # Cycle through the range of numbers between the first and last integers.
-    # Add them to the list if they aren't reserved.
-    for num in range(first_nw, last_nw + 1):
-        # Check if the number has a reserved suffix or its digits
-        # are all the same. If so, skip this one.
-        if str(num)[-2:] in flags or all_same_digits(num):
-            continue
-        else:
-            nw_numbers.append(str(num))
-    # Shuffle the numbers if necessary.
-    if mixed:
-        for _ in range(rn.randint(5, 10)):
-            rn.shuffle(nw_numbers)
-    return nw_numbers
+    # We'd rather not have any double zeroes at the end of any nonwinning integer, but build_nonwinner_pool
+    # takes care of that without touching the caller's list.
+    return build_nonwinner_pool(first_nw, last_nw, flags, mixed).astype(str).tolist()
 
 
 def create_ten_column_spread(first_number: int, last_number: int, fill_size: int,
@@ -220,7 +388,7 @@ def create_number_pools_multi(first_number: int, last_number: int, winner_suffix
 
 
 def create_multi_suffixed_number_pools(first_number: int, last_number: int, suffixes: dict[str, list[str | int | bool]],
-                                       smallest_nw: int, biggest_nw: int) -> list[list[str] | list[int]]:
+                                       smallest_nw: int, biggest_nw: int) -> list[list[list[TaggedNumber]] | list[str]]:
     """
     Create a pool of numbers between first_number and last_number and add them to winning and nonwinning lists.
     The nonwinners will fall between smallest_nw and biggest_nw, excluding integers that contain any of the
@@ -239,43 +407,42 @@ def create_multi_suffixed_number_pools(first_number: int, last_number: int, suff
     :param biggest_nw: highest nonwinning number
     :type biggest_nw: int
     :return: two lists: one for winners and another for nonwinners, i.e. [winners, nonwinners]
-    :rtype: list[list[str] | list[int]]
+    :rtype: list[list[list[TaggedNumber]] | list[str]]
     """
-    # Create a list containing zfilled (2) strings of every integer between first_number and last_number.
-    big_pool = list(str(item).zfill(2) for item in range(first_number, last_number + 1))
-    # Create a list of the suffixes
     endings = list(suffixes.keys())
     print(f"Creating number pools within the range {first_number} - {last_number}. The suffix(es)"
           f" {suffixes} are being placed in their own list(s) for the winners, and the nonwinners"
           f" will contain the remaining numbers between {smallest_nw} and {biggest_nw}.")
-    # Create lists to contain the winning and nonwinning numbers
-    nw_numbers = []
-    win_numbers = []
-    for _ in range(len(endings)):
-        win_numbers.append([])
-    # Cycle through the range of integers and add them to the appropriate list.
-    for i in big_pool:
-        # Check if the final two digits of this integer are in the list of suffixes.
-        if i[len(i) - 2:len(i)] in endings:
-            # Get the position of this suffix in the list of suffixes and use it to add this suffix
-            # to the correct winner's list if it falls within the first and last parameter.
-            index = endings.index(i[len(i) - 2:len(i)])
-            bottom = suffixes[i[len(i) - 2:len(i)]][0]
-            top = suffixes[i[len(i) - 2:len(i)]][1]
-            # Add the string to the appropriate list
-            if bottom <= int(i) <= top:
-                if suffixes[i[len(i) - 2:len(i)]][3]:
-                    num = f'<@{suffixes[i[len(i) - 2:len(i)]][2]}>{i}'
-                else:
-                    num = i[:len(i) - 2] + f'<@{suffixes[i[len(i) - 2:len(i)]][2]}>' + i[len(i) - 2:]
-                win_numbers[index].append(num)
-        else:
-            if smallest_nw <= int(i) <= biggest_nw:
-                nw_numbers.append(i)
-    return [win_numbers, nw_numbers]
+    winners, nonwinners = build_multi_suffixed_pools(first_number, last_number, suffixes, smallest_nw, biggest_nw)
+    # Everything is zero-filled to two digits, and each suffix's winners get its DM tag (in front of the whole number
+    # or just the suffix, depending on its placement flag).
+    tags = [NumberTag(suffixes[ending][2], bool(suffixes[ending][3])) for ending in endings]
+    win_numbers = [[TaggedNumber(number, tag, 2) for number in wins.tolist()] for tag, wins in zip(tags, winners)]
+    return [win_numbers, [str(number).zfill(2) for number in nonwinners.tolist()]]
 
 
-def create_nonwinner_number_tickets(amt: int, spots: int, nw_pool: list[str]) -> list[list[str]]:
+def create_nonwinner_number_pool(first_nw: int, last_nw: int, flags: list[str]) -> NumberPool:
+    """
+    Create a pool of nonwinning numbers between the first and last values that refills itself from
+    build_nonwinner_pool (so it never holds a flagged suffix, a '00', or a number with all the same digits).
+    Ranges bigger than SAMPLED_RANGE are never listed: the pool takes them a batch at a time from a RangeSampler.
+
+    :param first_nw: first nonwinning number
+    :type first_nw: int
+    :param last_nw: last nonwinning number
+    :type last_nw: int
+    :param flags: a list of suffixes to be thrown out
+    :type flags: list[str]
+    :return: a self-refilling pool of nonwinning numbers
+    :rtype: NumberPool
+    """
+    flags = list(flags)
+    if last_nw - first_nw + 1 > SAMPLED_RANGE:
+        return NumberPool(RangeSampler(first_nw, last_nw, lambda numbers: nonwinner_mask(numbers, flags)))
+    return NumberPool(lambda: build_nonwinner_pool(first_nw, last_nw, flags, True))
+
+
+def create_nonwinner_number_tickets(amt: int, spots: int, nw_pool: NumberPool | list[str]) -> list[list[str]]:
     """
     Create a list of lists containing nonwinning number combinations of a specified length
     from an existing pool of numbers.
@@ -285,63 +452,60 @@ def create_nonwinner_number_tickets(amt: int, spots: int, nw_pool: list[str]) ->
     :param spots: number of integers in each list
     :type spots: int
     :param nw_pool: pool of numbers used to create the lists
-    :type nw_pool: list[str]
+    :type nw_pool: NumberPool | list[str]
     :return: list of lists containing nonwinning number combinations
     :rtype: list[list[str]]
     """
-    # Create the top-level list to contain number lists
-    nw_tickets = []
-    # Repeat for the number of tickets needed
-    for _ in range(amt):
-        # List to hold nonwinners
-        nw_tick = []
-        # Add the number of nonwinners needed per ticket
-        for _ in range(spots):
-            nw_tick.append(nw_pool.pop(0))
-        # add the ticket to the top-level list
-        nw_tickets.append(nw_tick)
-    return nw_tickets
+    nw_pool = as_number_pool(nw_pool)
+    # Take the number of nonwinners needed for each ticket
+    tickets = [nw_pool.take(spots) for _ in range(amt)]
+    # A list that was passed in loses the numbers that were used, as it always has.
+    nw_pool.settle()
+    return tickets
 
 
-def create_numbered_holds(win_numbs, nw_numbs, spots):
+def create_numbered_holds(win_numbs: NumberPool | list[str], nw_numbs: NumberPool | list[str], spots: int):
     """
     Create a list of lists containing a winning number plus an indeterminate number of nonwinning numbers.
 
-    :param win_numbs: list of winning numbers
-    :type win_numbs: list[str]
-    :param nw_numbs: list of nonwinning numbers
-    :type nw_numbs: list[str]
+    :param win_numbs: winning numbers (every one of them gets a ticket)
+    :type win_numbs: NumberPool | list[str]
+    :param nw_numbs: nonwinning numbers
+    :type nw_numbs: NumberPool | list[str]
     :param spots: number of numbers per ticket
     :type spots: int
     :return: A list of lists containing a winning number and filler nonwinning numbers
     :rtype: list[list[str]]
     """
+    win_numbs = as_number_pool(win_numbs)
+    nw_numbs = as_number_pool(nw_numbs)
     winners = []
-    # Cycle through the list of winning numbers
+    # Cycle through the winning numbers
     while len(win_numbs) != 0:
-        # Pop off the winning number in the first position of the list
-        # and use it to create a new list.
-        numbs = [win_numbs.pop(0)]
-        # Append nonwinning numbers until the ticket contains the required number.
-        for _ in range(spots - 1):
-            numbs.append(nw_numbs.pop(0))
+        # Take the next winning number and fill the rest of the ticket with nonwinning numbers.
+        numbs = win_numbs.take(1)
+        numbs += nw_numbs.take(spots - 1, numbs)
         # Shuffle 'em up.
         for _ in range(rn.randint(5, 10)):
             rn.shuffle(numbs)
         # Add the list to the list of winners
         winners.append(numbs)
+    # Lists that were passed in lose the numbers that were used, as they always have.
+    win_numbs.settle()
+    nw_numbs.settle()
     return winners
 
 
-def create_varied_numbered_holds(win_numbs: list[str], nw_numbs: list[str], spots: int, win_amts: list[int]):
+def create_varied_numbered_holds(win_numbs: NumberPool | list[str], nw_numbs: NumberPool | list[str], spots: int,
+                                 win_amts: list[int]):
     """
     Create a list of hold tickets that contain varying numbers of winners. The amounts are
     passed in a list that functions like the free spot lists in other hold tickets.
 
-    :param win_numbs: list of winning numbers
-    :type win_numbs: list[str]
-    :param nw_numbs: list of nonwinning numbers
-    :type nw_numbs: list[str]
+    :param win_numbs: winning numbers
+    :type win_numbs: NumberPool | list[str]
+    :param nw_numbs: nonwinning numbers
+    :type nw_numbs: NumberPool | list[str]
     :param spots: number of spots on each ticket
     :type spots: int
     :param win_amts: list where the indexes indicate the number of winning spots and the value is the number of tickets
@@ -349,47 +513,40 @@ def create_varied_numbered_holds(win_numbs: list[str], nw_numbs: list[str], spot
     :return: A list of lists containing winning numbers and filler nonwinning numbers
     :rtype: list[list[str]]
     """
+    win_numbs = as_number_pool(win_numbs)
+    nw_numbs = as_number_pool(nw_numbs)
     winners = []
     for index, amt in enumerate(win_amts):
         for _ in range(amt):
-            tick = []
-            for _ in range(index + 1):
-                tick.append(win_numbs.pop(0))
-            for _ in range(spots - len(tick)):
-                tick.append(nw_numbs.pop(0))
+            tick = win_numbs.take(index + 1)
+            tick += nw_numbs.take(spots - len(tick), tick)
             for _ in range(rn.randint(5, 10)):
                 rn.shuffle(tick)
             winners.append(tick)
+    # Lists that were passed in lose the numbers that were used, as they always have.
+    win_numbs.settle()
+    nw_numbs.settle()
     return winners
 
 
-def create_numbered_holds_multi(win_numbs: list[list[str]], nw_numbs: list[str], spots):
+def create_numbered_holds_multi(win_numbs: list[NumberPool | list[str]], nw_numbs: NumberPool | list[str], spots):
     """
     Create a list of lists containing a winning number plus an indeterminate number of
     nonwinning numbers. The sublists contain all the numbers associated with a particular
     suffix. The returned list contains all the tickets generated for each sublist.
 
-    :param win_numbs: list of lists containing winning numbers
-    :type win_numbs: list[list[str]]
-    :param nw_numbs: list of nonwinning numbers
-    :type nw_numbs: list[str]
+    :param win_numbs: winning numbers for each suffix
+    :type win_numbs: list[NumberPool | list[str]]
+    :param nw_numbs: nonwinning numbers
+    :type nw_numbs: NumberPool | list[str]
     :param spots: number of spots per ticket
     :type spots: int
     :return: A list of lists containing a winning number and filler nonwinning numbers
     :rtype: list[list[str]]
     """
-    winners = []
-    for wins in win_numbs:
-        win = []
-        while len(wins) != 0:
-            numbs = [wins.pop(0)]
-            for _ in range(spots - 1):
-                numbs.append(nw_numbs.pop(0))
-            for _ in range(rn.randint(5, 10)):
-                rn.shuffle(numbs)
-            win.append(numbs)
-        winners.append(win)
-    return winners
+    nw_numbs = as_number_pool(nw_numbs)
+    # Each suffix's winners get their own list of tickets, all sharing the same nonwinners.
+    return [create_numbered_holds(wins, nw_numbs, spots) for wins in win_numbs]
 
 
 def create_basic_number_pool(first: int, last: int) -> list[str]:
@@ -419,18 +576,16 @@ def create_winning_pools(pools: list[str], suffixes: list[list[str | int | bool]
 
 
 def create_winning_number_pool(pool: list[str], first: int, last: int, suffix: str,
-                               tag: str, all_numbers: bool) -> list[str]:
-    # Create a list to hold the winning numbers
+                               tag: str, all_numbers: bool) -> list[TaggedNumber]:
+    # Create a list to hold the winning numbers. They all share the same tag, which
+    # isn't written into them until their tickets are.
     winners = []
+    number_tag = NumberTag(tag, all_numbers)
     for index in reversed(range(len(pool))):
         if pool[index][len(pool[index]) - 2:len(pool[index])] == suffix:
             whiner = pool.pop(index)
             if first <= int(whiner) <= last:
-                if all_numbers:
-                    whiner = f'<@{tag}>{whiner}'
-                else:
-                    whiner = whiner[:len(whiner) - 2] + f'<@{tag}>' + whiner[len(whiner) - 2:]
-                winners.append(whiner)
+                winners.append(TaggedNumber(int(whiner), number_tag, len(whiner)))
     return winners
 
 
@@ -676,7 +831,8 @@ def check_winning_bingo_paths(bingos: list[list[str | int]], taken: set) -> [boo
 
 
 def create_unique_bingo_line_permutations(q_perms: int, amt: int, spots: int, zeroes: bool, letters: bool,
-                                          hyphen: bool) -> list[list[list[str | int]]]:
+                                          hyphen: bool,
+                                          progress: Progress = NO_PROGRESS) -> list[list[list[str | int]]]:
     """
     Create a list of list of lists containing unique bingo paths that have the required number of spots
     and any decoration the numbers need: leading zeroes, column letters, and hyphens.
@@ -693,20 +849,29 @@ def create_unique_bingo_line_permutations(q_perms: int, amt: int, spots: int, ze
     :type letters: bool
     :param hyphen: Is a hyphen needed between the letters and numbers (only relevant when 'letters' is True).
     :type hyphen: bool
+    :param progress: where to report how many perms have been made (and how many attempts were thrown out), along
+                     with the lines of the perm being made
+    :type progress: Progress
     :return: a list of lists containing lists of bingo paths
     :rtype: list[list[list[str | int]]]
     """
     taken = set()
     perms = []
+    rejects = 0
     while len(perms) < q_perms:
-        potential = create_unique_bingo_lines(amt, spots, zeroes, letters, hyphen, taken)
+        potential = create_unique_bingo_lines(amt, spots, zeroes, letters, hyphen, taken, progress,
+                                              f'Bingo lines (permutation {len(perms) + 1} of {q_perms})')
         if potential is not None:
             perms.append(potential)
+        else:
+            rejects += 1
+        progress.report('Bingo line permutations', len(perms), q_perms, rejects)
     return perms
 
 
-def create_unique_bingo_lines(amt: int, spots: int, zeroes: bool, letters: bool,
-                              hyphen: bool, taken=None) -> list[list[str | int]] | None:
+def create_unique_bingo_lines(amt: int, spots: int, zeroes: bool, letters: bool, hyphen: bool, taken=None,
+                              progress: Progress = NO_PROGRESS,
+                              stage: str = 'Bingo lines') -> list[list[str | int]] | None:
     """
     Create a list of unique bingo paths containing the number required and any
     decoration the numbers need: leading zeroes, column letters, and hyphens.
@@ -723,7 +888,11 @@ def create_unique_bingo_lines(amt: int, spots: int, zeroes: bool, letters: bool,
     :type hyphen: bool
     :param taken: set of tuples containing previously taken bingo paths
     :type taken: set[tuple[str | int]]
-    :return: a list of lists containing bingo lines
+    :param progress: where to report how many lines have been made
+    :type progress: Progress
+    :param stage: name the progress is reported under
+    :type stage: str
+    :return: a list of lists containing bingo lines (None if one of them was already taken)
     :rtype: list[list[str | int]]
     """
     bingos = []
@@ -751,9 +920,10 @@ def create_unique_bingo_lines(amt: int, spots: int, zeroes: bool, letters: bool,
         if tuple(numbs) not in paths_taken:
             paths_taken.add(tuple(numbs))
             bingos.append(numbs)
+            progress.report(stage, len(bingos), amt)
         else:
-            # Apparently we're bailing if this
-            print(f'Rejected: {numbs}')
+            # Apparently we're bailing if this happens (the caller counts it as a reject and tries again).
+            progress.report(stage, len(bingos), amt, 1)
             return None
         for _ in range(rn.randint(2, 4)):
             rn.shuffle(numbers)
@@ -0,0 +1,138 @@
+"""
+Pools of numbers that tickets draw from.
+
+The number generators used to keep their pools in lists and take numbers off the front with pop(0), which moves
+everything left behind it every time and makes working through a pool quadratic. A NumberPool keeps its numbers in
+an array and reads them with a cursor instead:
+
+|  take(count):   the next count numbers (as strings, or TaggedNumbers for winners, ready for a ticket)
+|  refill():      replace the numbers with a new batch from the pool's source
+|  len(pool):     how many numbers are left before the next refill
+|  settle():      remove the numbers taken so far from the list the pool was made from
+
+A pool with a source refills itself when it runs dry, even partway through a ticket. The numbers a ticket already
+has are skipped in the new batch, so no ticket ever shows the same number twice. A pool without a source (one made
+from a list of numbers) raises a ValueError instead.
+
+A pool made from a list reads a copy of it, but the list is still used up the way pop(0) used it up: settle() deletes
+the numbers the pool has handed out from the front of the list, all at once. The generators that accept lists
+settle their pools before they return, so a caller can pass the same list to one generator after another.
+
+Pools are ordinary objects, so a game can hand the same one to its winner and nonwinner generators and they'll work
+through it together, without repeating each other's numbers until it refills.
+"""
+from typing import Callable, Iterable, Sequence
+
+import numpy as np
+
+from .tagged_number import TaggedNumber
+
+NumberSource = Callable[[], np.ndarray | Sequence[int | str | TaggedNumber]]
+
+
+class NumberPool(object):
+    """
+    Numbers read in order with a cursor, refilled from a source when they run out.
+    """
+
+    def __init__(self, source: NumberSource | None = None,
+                 numbers: np.ndarray | Sequence[int | str | TaggedNumber] | None = None):
+        """
+        :param source: function returning a new batch of numbers, already shuffled (None never refills)
+        :type source: NumberSource | None
+        :param numbers: numbers to start with (None fills the pool from the source the first time it's used)
+        :type numbers: np.ndarray | Sequence[int | str | TaggedNumber] | None
+        """
+        self.source = source
+        # The list the numbers came from, if they came from one (see settle).
+        self.origin = numbers if isinstance(numbers, list) else None
+        self.numbers = np.asarray([] if numbers is None else numbers)
+        self.cursor = 0
+        self.refills = 0
+
+    def __len__(self) -> int:
+        return len(self.numbers) - self.cursor
+
+    def refill(self) -> None:
+        """
+        Replace the pool's numbers with a new batch from its source.
+
+        :return: None
+        :rtype: None
+        """
+        if self.source is None:
+            raise ValueError("The number pool has run out and has nothing to refill it from.")
+        self.settle()
+        self.origin = None
+        self.numbers = np.asarray(self.source())
+        self.cursor = 0
+        self.refills += 1
+
+    def take(self, count: int, exclude: Iterable[str | TaggedNumber] = ()) -> list[str | TaggedNumber]:
+        """
+        Take the next numbers from the pool, refilling it if it runs out. None of the numbers repeat each other or
+        any of the excluded numbers. Tagged numbers are handed over as they are, to be formatted with the ticket.
+
+        :param count: number of numbers needed
+        :type count: int
+        :param exclude: numbers that are already on the ticket
+        :type exclude: Iterable[str | TaggedNumber]
+        :return: the numbers, as strings (or TaggedNumbers)
+        :rtype: list[str | TaggedNumber]
+        """
+        taken = []
+        skip = set(exclude)
+        # Number taken when the pool was last refilled (None until it has been).
+        since_refill = None
+        while len(taken) < count:
+            if self.cursor >= len(self.numbers):
+                # A whole fresh batch has gone by without adding anything to the ticket, so another one won't either.
+                if since_refill == len(taken):
+                    raise ValueError(f"The number pool can't supply {count} different numbers.")
+                self.refill()
+                since_refill = len(taken)
+                continue
+            chunk = self.numbers[self.cursor:self.cursor + count - len(taken)]
+            self.cursor += len(chunk)
+            for number in chunk.tolist():
+                if not isinstance(number, TaggedNumber):
+                    number = str(number)
+                if number not in skip:
+                    taken.append(number)
+                    skip.add(number)
+        return taken
+
+    def pop(self) -> str | TaggedNumber:
+        """
+        Take the next number from the pool.
+
+        :return: the number, as a string (or a TaggedNumber)
+        :rtype: str | TaggedNumber
+        """
+        return self.take(1)[0]
+
+    def settle(self) -> None:
+        """
+        Delete the numbers taken so far from the front of the list the pool was made from, so the list ends up the
+        way it would have if they had been popped off it one at a time. (Pools not made from a list are left alone.)
+
+        :return: None
+        :rtype: None
+        """
+        if self.origin is not None and self.cursor > 0:
+            del self.origin[:self.cursor]
+            self.numbers = self.numbers[self.cursor:]
+            self.cursor = 0
+
+
+def as_number_pool(numbers: NumberPool | Sequence[int | str | TaggedNumber]) -> NumberPool:
+    """
+    Return the numbers as a NumberPool (a list becomes a pool that can't refill, and settle() removes the numbers
+    it has handed out from the list).
+
+    :param numbers: pool or list of numbers
+    :type numbers: NumberPool | Sequence[int | str | TaggedNumber]
+    :return: number pool
+    :rtype: NumberPool
+    """
+    return numbers if isinstance(numbers, NumberPool) else NumberPool(numbers=numbers)
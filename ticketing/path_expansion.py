@@ -0,0 +1,232 @@
+"""
+Batched expansion of pseudo-bingo faces into every winning path they can produce.
+
+A pseudo-face is one or two bingo lines with some of the spots replaced by free spaces. Any column containing a free
+space can be won with all fifteen of that column's numbers, while every other column can be won with the number(s)
+printed in it. The winning paths are the product of those choices. Instead of building that product one face at a
+time with itertools, this module works on an entire batch of candidate faces and returns their path ids
+(see path_ledger) as one NumPy array, so the whole batch can be checked against the ledger in a single pass.
+
+The expansion and scoring of a batch can also be spread across threads with a ParallelEvaluator. It's a plain
+parallel map: each thread expands a slice of the batch and scores it against the ledger, and the calling thread
+waits for every slice before select_candidates accepts anything, so nothing changes the ledger while it's being
+read. NumPy does the heavy lifting with the GIL released, which lets the expansion-heavy hold types (13,500 and
+3,375 paths a face) use more than one core. On a single core the threads only add overhead, so leave it out there.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+import numpy as np
+
+from .path_ledger import COLUMNS, COLUMN_SIZE, COLUMN_OFFSETS, PLACE_VALUES, PathLedger
+
+# Upper limit on the number of path ids expanded at once (keeps a batch's working arrays to a few MB).
+EXPANSION_LIMIT = 1 << 20
+
+
+def paths_per_face(lines: int, frees: int) -> int:
+    """
+    Return the number of winning paths produced by a face with the passed number of lines and free columns.
+
+    :param lines: number of lines on the face (1 or 2)
+    :type lines: int
+    :param frees: number of columns containing a free space
+    :type frees: int
+    :return: number of winning paths
+    :rtype: int
+    """
+    return (COLUMN_SIZE ** frees) * (lines ** (COLUMNS - frees))
+
+
+def batch_size(lines: int, frees: int, wanted: int, variants: int = 1, paths: int | None = None) -> int:
+    """
+    Return how many candidates of a given shape can be expanded together without exceeding EXPANSION_LIMIT.
+    Each candidate may be expanded in several variants (different placements of its free spaces), and all of
+    them count against the limit.
+
+    :param lines: number of lines on each face
+    :type lines: int
+    :param frees: number of free columns on each face
+    :type frees: int
+    :param wanted: number of candidates that are actually needed
+    :type wanted: int
+    :param variants: number of variants expanded for each candidate
+    :type variants: int
+    :param paths: winning paths in each variant (defaults to paths_per_face; either-ors produce fewer)
+    :type paths: int | None
+    :return: number of candidates to expand in one batch
+    :rtype: int
+    """
+    if paths is None:
+        paths = paths_per_face(lines, frees)
+    return max(1, min(wanted, EXPANSION_LIMIT // (paths * variants)))
+
+
+def expand_candidates(lines: np.ndarray, free_masks: np.ndarray) -> np.ndarray:
+    """
+    Expand a batch of candidate faces into their winning path ids. Every candidate in the batch must produce the
+    same number of paths (the same number of lines and free columns), which is always the case for a batch of one
+    hold type.
+
+    :param lines: bingo numbers for each candidate (candidates x lines x 5); values under a free space are ignored
+    :type lines: np.ndarray
+    :param free_masks: True wherever a candidate has a free space (same shape as lines)
+    :type free_masks: np.ndarray
+    :return: path ids for each candidate (candidates x paths)
+    :rtype: np.ndarray
+    """
+    lines = np.asarray(lines, dtype=np.int64)
+    free_masks = np.asarray(free_masks, dtype=bool)
+    candidates, line_count = lines.shape[0], lines.shape[1]
+    if candidates == 0:
+        return np.empty((0, 0), dtype=np.int64)
+    # A column with a free space on any line can be won with any of its fifteen numbers.
+    free_columns = free_masks.any(axis=1)
+    radices = np.where(free_columns, COLUMN_SIZE, line_count)
+    sizes = radices.prod(axis=1)
+    if np.any(sizes != sizes[0]):
+        raise ValueError("Every candidate in a batch must produce the same number of winning paths.")
+    # choices[n, c] lists the digits column c can take on candidate n, already scaled by the column's place value.
+    choices = np.broadcast_to(np.arange(COLUMN_SIZE), (candidates, COLUMNS, COLUMN_SIZE)).copy()
+    digits = np.clip(lines - COLUMN_OFFSETS, 0, COLUMN_SIZE - 1).transpose(0, 2, 1)
+    fixed = ~free_columns
+    choices[:, :, :line_count] = np.where(fixed[:, :, None], digits, choices[:, :, :line_count])
+    choices *= PLACE_VALUES[None, :, None]
+    # Count through every combination with a mixed-radix counter: the digit for column c of combination k is
+    # (k // strides[c]) % radices[c]. Candidates with their free spaces in the same columns share a counter, so
+    # work through them a pattern at a time and build their path ids one column at a time.
+    combos = np.arange(int(sizes[0]), dtype=np.int64)
+    path_ids = np.empty((candidates, len(combos)), dtype=np.int64)
+    patterns, members = np.unique(radices, axis=0, return_inverse=True)
+    for pattern, pattern_radices in enumerate(patterns):
+        rows = np.flatnonzero(members.ravel() == pattern)
+        strides = np.cumprod(np.concatenate([[1], pattern_radices[:-1]]))
+        block = np.zeros((len(rows), len(combos)), dtype=np.int64)
+        for column in range(COLUMNS):
+            picks = (combos // strides[column]) % pattern_radices[column]
+            block += choices[rows, column][:, picks]
+        path_ids[rows] = block
+    return path_ids
+
+
+def conflict_counts(ledger: PathLedger, path_ids: np.ndarray) -> np.ndarray:
+    """
+    Score each candidate by the number of its winning paths that are already taken. Only a candidate with a score of
+    zero can be used, but the scores also show which variants of a face come closest.
+
+    :param ledger: paths already taken
+    :type ledger: PathLedger
+    :param path_ids: path ids for each candidate (candidates x paths)
+    :type path_ids: np.ndarray
+    :return: number of taken paths for each candidate
+    :rtype: np.ndarray
+    """
+    return ledger.taken(path_ids).sum(axis=1)
+
+
+def select_candidates(ledger: PathLedger, path_ids: np.ndarray, wanted: int,
+                      groups: np.ndarray | None = None, conflicts: np.ndarray | None = None) -> list[int]:
+    """
+    Choose up to 'wanted' candidates whose winning paths are all still available and add their paths to the ledger.
+    Candidates can be grouped (the variants of one face share a group) and at most one candidate is taken from each
+    group. Every candidate is scored against the ledger in one pass first, and each group is ranked from the fewest
+    conflicts to the most, so a group's zero-conflict variants are tried before anything else. The survivors are
+    re-checked one at a time as they're accepted, since two candidates in the same batch can share paths.
+
+    Scores already worked out against the ledger as it is now (by a ParallelEvaluator) can be passed in instead.
+
+    :param ledger: paths already taken
+    :type ledger: PathLedger
+    :param path_ids: path ids for each candidate (candidates x paths)
+    :type path_ids: np.ndarray
+    :param wanted: maximum number of candidates to accept
+    :type wanted: int
+    :param groups: group number of each candidate (defaults to every candidate being in a group of its own)
+    :type groups: np.ndarray | None
+    :param conflicts: scores for each candidate against the ledger (None scores them here)
+    :type conflicts: np.ndarray | None
+    :return: indexes of the accepted candidates, in group order
+    :rtype: list[int]
+    """
+    accepted = []
+    if len(path_ids) == 0 or wanted <= 0:
+        return accepted
+    if groups is None:
+        groups = np.arange(len(path_ids))
+    if conflicts is None:
+        conflicts = conflict_counts(ledger, path_ids)
+    # Sort by group, then by conflicts within a group (ties keep their batch order).
+    ranked = np.lexsort((np.arange(len(path_ids)), conflicts, groups))
+    used = set()
+    for index in ranked.tolist():
+        if len(accepted) == wanted:
+            break
+        group = int(groups[index])
+        if group in used or conflicts[index] > 0:
+            continue
+        if len(accepted) > 0 and ledger.any_taken(path_ids[index]):
+            continue
+        ledger.add(path_ids[index])
+        accepted.append(index)
+        used.add(group)
+    return accepted
+
+
+class ParallelEvaluator(object):
+    """
+    Pool of threads that expand and score slices of a candidate batch at the same time. The threads only read the
+    catalog and the ledger, and evaluate() doesn't return until they're all done; everything that changes the face
+    list or the ledger stays on the calling thread.
+    """
+
+    def __init__(self, workers: int):
+        """
+        :param workers: number of threads
+        :type workers: int
+        """
+        self.workers = workers
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+
+    def __enter__(self) -> 'ParallelEvaluator':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Shut the threads down.
+
+        :return: None
+        :rtype: None
+        """
+        self.executor.shutdown()
+
+    def evaluate(self, expand: Callable[[int, int], np.ndarray], candidates: int, variants: int,
+                 ledger: PathLedger) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Expand a batch of candidates and score every variant against the ledger, a slice of the batch per thread.
+
+        :param expand: function returning the path ids for candidates [start, stop) (one row per variant)
+        :type expand: Callable[[int, int], np.ndarray]
+        :param candidates: number of candidates in the batch
+        :type candidates: int
+        :param variants: number of variants (rows) for each candidate
+        :type variants: int
+        :param ledger: paths already taken
+        :type ledger: PathLedger
+        :return: path ids (candidates * variants x paths) and the number of them already taken
+        :rtype: tuple[np.ndarray, np.ndarray]
+        """
+        bounds = np.linspace(0, candidates, min(self.workers, candidates) + 1).astype(int).tolist()
+
+        def evaluate_slice(start: int, stop: int) -> tuple[np.ndarray, np.ndarray]:
+            path_ids = expand(start, stop)
+            return path_ids, conflict_counts(ledger, path_ids)
+
+        futures = [self.executor.submit(evaluate_slice, start, stop) for start, stop in zip(bounds, bounds[1:])]
+        results = [future.result() for future in futures]
+        if len(results) == 1:
+            return results[0]
+        return (np.concatenate([path_ids for path_ids, _ in results]),
+                np.concatenate([conflicts for _, conflicts in results]))
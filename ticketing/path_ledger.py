@@ -0,0 +1,125 @@
+"""
+Integer encoding for winning bingo paths and a packed bitmap that records which ones are taken.
+
+A winning path is five bingo numbers, one from each column. Within its column, a number can only be one of fifteen
+values, so a path can be written as five base-15 digits:
+
+|  path id = d(B) + 15 * d(I) + 225 * d(N) + 3375 * d(G) + 50625 * d(O)
+
+where d(column) is the number's position within its column (0 - 14). That gives 15^5 = 759,375 possible paths, and a
+bit for each of them fits into less than 100 KB.
+"""
+import numpy as np
+
+COLUMNS = 5
+COLUMN_SIZE = 15
+PATH_SPACE = COLUMN_SIZE ** COLUMNS
+PLACE_VALUES = COLUMN_SIZE ** np.arange(COLUMNS, dtype=np.int64)
+COLUMN_OFFSETS = np.arange(COLUMNS, dtype=np.int64) * COLUMN_SIZE + 1
+
+
+def encode_paths(paths) -> np.ndarray:
+    """
+    Convert bingo paths (anything shaped [..., 5] holding bingo numbers as ints or strings) into path ids.
+
+    :param paths: bingo paths to encode
+    :type paths: np.ndarray | list[list[str | int]] | list[tuple[str | int]]
+    :return: path ids, with the last dimension of the input removed
+    :rtype: np.ndarray
+    """
+    numbers = np.asarray(paths)
+    if numbers.dtype.kind not in 'iu':
+        numbers = numbers.astype(np.int64)
+    return (numbers.astype(np.int64) - COLUMN_OFFSETS) @ PLACE_VALUES
+
+
+def decode_paths(ids) -> np.ndarray:
+    """
+    Convert path ids back into bingo numbers.
+
+    :param ids: path ids to decode
+    :type ids: np.ndarray | list[int] | int
+    :return: bingo numbers with a trailing dimension of five
+    :rtype: np.ndarray
+    """
+    ids = np.asarray(ids, dtype=np.int64)
+    return (ids[..., None] // PLACE_VALUES) % COLUMN_SIZE + COLUMN_OFFSETS
+
+
+class PathLedger(object):
+    """
+    Packed bit array with one bit for every possible winning path. Lookups and additions work on whole arrays of
+    path ids at once.
+    """
+
+    def __init__(self, bits: np.ndarray | None = None):
+        """
+        :param bits: existing bitmap to start from (it is copied)
+        :type bits: np.ndarray | None
+        """
+        if bits is None:
+            self.bits = np.zeros((PATH_SPACE + 7) // 8, dtype=np.uint8)
+            self.count = 0
+        else:
+            self.bits = np.array(bits, dtype=np.uint8, copy=True)
+            self.count = int(np.unpackbits(self.bits).sum(dtype=np.int64))
+
+    def __len__(self) -> int:
+        return self.count
+
+    def taken(self, ids) -> np.ndarray:
+        """
+        Return a boolean array that is True wherever the matching path id is already taken.
+
+        :param ids: path ids to check
+        :type ids: np.ndarray
+        :return: taken flags shaped like ids
+        :rtype: np.ndarray
+        """
+        ids = np.asarray(ids, dtype=np.int64)
+        return ((self.bits[ids >> 3] >> (ids & 7).astype(np.uint8)) & 1).astype(bool)
+
+    def any_taken(self, ids) -> bool:
+        """
+        Check if any of the passed path ids are already taken.
+
+        :param ids: path ids to check
+        :type ids: np.ndarray
+        :return: True if there is at least one collision
+        :rtype: bool
+        """
+        return bool(self.taken(ids).any())
+
+    def add(self, ids) -> None:
+        """
+        Mark the passed path ids as taken.
+
+        :param ids: path ids to add
+        :type ids: np.ndarray
+        :return: None
+        :rtype: None
+        """
+        ids = np.unique(np.asarray(ids, dtype=np.int64))
+        if len(ids) == 0:
+            return
+        self.count += int(np.count_nonzero(~self.taken(ids)))
+        np.bitwise_or.at(self.bits, ids >> 3, (1 << (ids & 7)).astype(np.uint8))
+
+    def clear(self) -> None:
+        """
+        Release every path.
+
+        :return: None
+        :rtype: None
+        """
+        self.bits[:] = 0
+        self.count = 0
+
+    def copy(self) -> 'PathLedger':
+        """
+        Return an independent copy of this ledger.
+
+        :return: copy of the ledger
+        :rtype: PathLedger
+        """
+        return PathLedger(self.bits)
@@ -0,0 +1,97 @@
+"""
+Progress reporting for the long-running generators.
+
+The generators used to print a running count to the console as they worked (a number for every face, a line for
+every few hundred attempts). That's a lot of I/O in the middle of a hot loop, and none of it reaches the GUI. They
+report to a Progress object instead, which hands ProgressEvents to a callback:
+
+|  stage:    what's being made (a face type, bingo ball permutations, and so on)
+|  done:     how many have been made so far
+|  total:    how many are needed
+|  rejects:  how many candidates have been thrown out along the way
+
+A Progress only passes an event along when the stage changes, when the stage is finished, or when at least
+PROGRESS_INTERVAL seconds have gone by since the last one, so a callback that redraws a window or prints a line
+doesn't slow the generator down. NO_PROGRESS (the default everywhere) has no callback and does nothing at all.
+"""
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+# Minimum number of seconds between events passed along for the same stage.
+PROGRESS_INTERVAL = 0.25
+
+
+@dataclass(frozen=True)
+class ProgressEvent:
+    """How far along a generator is with one stage of its work."""
+    stage: str
+    done: int
+    total: int
+    rejects: int = 0
+
+    @property
+    def fraction(self) -> float:
+        """Share of the stage that's finished (0.0 - 1.0)."""
+        return min(1.0, self.done / self.total) if self.total > 0 else 1.0
+
+
+ProgressCallback = Callable[[ProgressEvent], None]
+
+
+class Progress(object):
+    """
+    Throttled link between a generator and whoever is watching it.
+    """
+
+    def __init__(self, callback: ProgressCallback | None = None, interval: float | None = None):
+        """
+        :param callback: function that receives the progress events (None ignores them)
+        :type callback: ProgressCallback | None
+        :param interval: minimum number of seconds between events for the same stage (None uses PROGRESS_INTERVAL)
+        :type interval: float | None
+        """
+        self.callback = callback
+        self.interval = PROGRESS_INTERVAL if interval is None else interval
+        self.stage = None
+        self.sent_at = 0.0
+
+    def report(self, stage: str, done: int, total: int, rejects: int = 0) -> None:
+        """
+        Pass an event along to the callback, unless one went out for the same stage too recently. The first and
+        last events of a stage always go out.
+
+        :param stage: what's being made
+        :type stage: str
+        :param done: number made so far
+        :type done: int
+        :param total: number needed
+        :type total: int
+        :param rejects: number of candidates thrown out so far
+        :type rejects: int
+        :return: None
+        :rtype: None
+        """
+        if self.callback is None:
+            return
+        now = time.monotonic()
+        if stage == self.stage and done < total and now - self.sent_at < self.interval:
+            return
+        self.stage = stage
+        self.sent_at = now
+        self.callback(ProgressEvent(stage, done, total, rejects))
+
+
+NO_PROGRESS = Progress()
+
+
+def print_progress(event: ProgressEvent) -> None:
+    """
+    Callback that prints each event on its own line (for running the generators from the console).
+
+    :param event: progress event
+    :type event: ProgressEvent
+    :return: None
+    :rtype: None
+    """
+    print(f"      {event.stage}: {event.done} of {event.total} ({event.rejects} rejected)")
@@ -0,0 +1,142 @@
+"""
+Random order for number ranges too big to list.
+
+Nonwinner and shaded tickets can draw from ranges in the millions, and listing a range like that (then shuffling
+it) every time a pool runs dry costs far more than the handful of numbers a ticket needs. A RangeSampler never lists
+the range. It puts the range in random order with a keyed bijection instead: every position in the range is mapped
+to a different position by a small Feistel network, so walking through the positions 0, 1, 2, ... visits every
+number exactly once, in an order that looks random.
+
+|  Feistel network:  FEISTEL_ROUNDS rounds over a power-of-four domain just big enough to hold the range, keyed with
+|                    random round keys
+|  cycle-walking:    a position that lands outside the range is sent through the network again until it lands
+|                    inside, which keeps the mapping a bijection on the range itself
+|  filtering:        numbers the keep function rejects (flagged suffixes, repdigits) are skipped as they come up
+
+Memory stays the same whatever the size of the range (a few round keys and a counter), and no number repeats until
+the whole range has been used. Then the sampler draws new keys and starts again in a new order.
+
+A RangeSampler can be called with no arguments to get its next SAMPLE_BATCH numbers, so it can be the source of a
+NumberPool.
+"""
+import random as rn
+from typing import Callable
+
+import numpy as np
+
+# Rounds of the Feistel network (four are plenty for a shuffle nobody needs to be cryptographically strong).
+FEISTEL_ROUNDS = 4
+# Numbers handed over each time the sampler is called as a pool's source.
+SAMPLE_BATCH = 4096
+# Odd 64-bit multiplier used to mix each round (the golden ratio constant).
+MIXER = np.uint64(0x9E3779B97F4A7C15)
+
+
+class RangeSampler(object):
+    """
+    Lazily produces the numbers between first and last in random order, skipping the ones that aren't wanted.
+    """
+
+    def __init__(self, first: int, last: int, keep: Callable[[np.ndarray], np.ndarray] | None = None,
+                 seed: int | None = None):
+        """
+        :param first: lowest number in the range
+        :type first: int
+        :param last: highest number in the range
+        :type last: int
+        :param keep: function flagging which of an array of numbers can be used (None uses all of them)
+        :type keep: Callable[[np.ndarray], np.ndarray] | None
+        :param seed: seed for the round keys (None draws one from the random module, so a seeded job still
+                     samples the same way every time)
+        :type seed: int | None
+        """
+        if last < first:
+            raise ValueError(f"The range {first} - {last} doesn't hold any numbers.")
+        self.first = first
+        self.size = last - first + 1
+        self.keep = keep
+        # Split the positions into two halves of equal size for the network.
+        self.half_bits = max(1, ((self.size - 1).bit_length() + 1) // 2)
+        self.mask = np.uint64((1 << self.half_bits) - 1)
+        self.random = rn.Random(rn.getrandbits(64) if seed is None else seed)
+        self.keys = []
+        self.counter = 0
+        self.kept = 0
+        self.passes = 0
+        self.reshuffle()
+
+    def reshuffle(self) -> None:
+        """
+        Draw new round keys and start a new pass through the range.
+
+        :return: None
+        :rtype: None
+        """
+        self.keys = [np.uint64(self.random.getrandbits(64)) for _ in range(FEISTEL_ROUNDS)]
+        self.counter = 0
+        self.kept = 0
+        self.passes += 1
+
+    def feistel(self, positions: np.ndarray) -> np.ndarray:
+        """
+        Run positions through the Feistel network (a bijection on the whole power-of-four domain).
+
+        :param positions: positions to map
+        :type positions: np.ndarray
+        :return: mapped positions
+        :rtype: np.ndarray
+        """
+        half = np.uint64(self.half_bits)
+        left, right = positions >> half, positions & self.mask
+        for key in self.keys:
+            mixed = (right ^ key) * MIXER
+            left, right = right, left ^ ((mixed ^ (mixed >> np.uint64(29))) & self.mask)
+        return (left << half) | right
+
+    def permute(self, positions: np.ndarray) -> np.ndarray:
+        """
+        Map positions in the range to other positions in the range, cycle-walking the ones the network sends
+        outside it.
+
+        :param positions: positions within the range
+        :type positions: np.ndarray
+        :return: mapped positions
+        :rtype: np.ndarray
+        """
+        mapped = self.feistel(positions.astype(np.uint64))
+        outside = mapped >= self.size
+        while outside.any():
+            mapped[outside] = self.feistel(mapped[outside])
+            outside = mapped >= self.size
+        return mapped
+
+    def sample(self, count: int) -> np.ndarray:
+        """
+        Return the next numbers in the sampler's order, starting a new pass whenever the range has been used up.
+
+        :param count: number of numbers needed
+        :type count: int
+        :return: the numbers
+        :rtype: np.ndarray
+        """
+        found = []
+        needed = count
+        while needed > 0:
+            if self.counter >= self.size:
+                if self.kept == 0:
+                    raise ValueError(f"None of the numbers between {self.first} and "
+                                     f"{self.first + self.size - 1} can be used.")
+                self.reshuffle()
+            # Never map more positions than there are numbers still needed, so nothing is skipped over unused.
+            stop = min(self.size, self.counter + needed)
+            numbers = self.permute(np.arange(self.counter, stop, dtype=np.uint64)).astype(np.int64) + self.first
+            self.counter = stop
+            if self.keep is not None:
+                numbers = numbers[self.keep(numbers)]
+            self.kept += len(numbers)
+            needed -= len(numbers)
+            found.append(numbers)
+        return np.concatenate(found) if found else np.zeros(0, dtype=np.int64)
+
+    def __call__(self) -> np.ndarray:
+        return self.sample(SAMPLE_BATCH)
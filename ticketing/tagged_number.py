@@ -0,0 +1,54 @@
+"""
+Winning numbers that carry a DesignMerge tag.
+
+A winning number is printed in a different font (or color) from the rest of the ticket, which DesignMerge does with
+a tag inside the csv value: in front of the whole number, or in front of its last two digits.
+
+|  whole:   <@redFONT>12345
+|  suffix:  123<@redFONT>45
+
+The tag used to be written into the number as soon as a pool was built, so pools held long strings and anything that
+needed to know which spot held the winner had to search the strings for the tag again. A TaggedNumber keeps the
+number as an integer alongside a NumberTag (shared by every number tagged the same way) and isn't turned into text
+until the ticket is written to its csv file.
+"""
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class NumberTag:
+    """DesignMerge tag and where it goes."""
+    name: str
+    whole: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class TaggedNumber:
+    """A number that's written with a DesignMerge tag."""
+    number: int
+    tag: NumberTag
+    width: int = 0
+
+    def __str__(self) -> str:
+        return tag_number(self.number, self.tag.name, self.tag.whole, self.width)
+
+
+def tag_number(number: int, tag: str, whole: bool, width: int = 0) -> str:
+    """
+    Format a winning number with a DesignMerge tag, either in front of the whole number or in front of its suffix.
+
+    :param number: winning number
+    :type number: int
+    :param tag: DesignMerge tag name
+    :type tag: str
+    :param whole: does the tag apply to every digit, or just the suffix?
+    :type whole: bool
+    :param width: number of digits to zero-fill the number to
+    :type width: int
+    :return: tagged number
+    :rtype: str
+    """
+    num = str(number).zfill(width)
+    if whole:
+        return f'<@{tag}>{num}'
+    return f'{num[:-2]}<@{tag}>{num[-2:]}'
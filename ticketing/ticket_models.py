@@ -266,6 +266,10 @@ class GameInfo:
     subflats: int
     schisms: int
     image_suffix: str
+    # Ledger store shared by games played together, and the name this game's paths are reserved under
+    # (verified bingo holds only; a blank folder means no store)
+    ledger_folder: str = ''
+    reservation: str = ''
 
 
 @dataclass
@@ -72,7 +72,9 @@ class UniversalTicket(BonanzaTicket):
     def csv_line(self) -> str:
         """
         Gather all the information associated with this ticket and send it back to the
-        caller as a comma-delimited string. Ticket number, all images, all numbers, permutation, up
+        caller as a comma-delimited string. Ticket number, all images, all numbers, permutation, up.
+        Numbers that aren't strings yet (integers, or winners still carrying their DesignMerge tag
+        separately) are formatted here.
 
         :return: comma-delimited string representing the ticket's values
         """
@@ -80,7 +82,7 @@ class UniversalTicket(BonanzaTicket):
         if len(self.images) > 0:
             line += f",{','.join(self.images)}"
         if len(self.numbers) > 0:
-            line += f",{','.join(self.numbers)}"
+            line += f",{','.join(str(number) for number in self.numbers)}"
         line += f",{self.permutation},{self.up}"
         if self.subflat != 0:
             line += f",{self.subflat}"
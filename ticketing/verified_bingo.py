@@ -1,13 +1,30 @@
 import itertools as iters
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import nullcontext
 
-from numpy import matrix
+import numpy as np
 import random as rn
 
+from .bingo_checkpoint import BingoCheckpoint, job_fingerprint, unit_key
 from .bingo_face_list import BingoFaceList
+from .bingo_stats import GenerationStats
+from .bingo_schedule import OrderingStrategy, ScheduledJob, build_jobs, by_path_demand
+from .ledger_store import LedgerStore, check_reservation_name
+from .path_expansion import ParallelEvaluator, batch_size, select_candidates
+from .path_ledger import COLUMN_SIZE, COLUMNS, PathLedger
+from .progress import NO_PROGRESS, Progress
+
+# Once this many candidates have been drawn for a face type, give up if even FAIL_FAST_MARGIN times the acceptance
+# rate so far couldn't produce the faces that are still needed from what's left in the pool.
+FAIL_FAST_SAMPLE = 100
+FAIL_FAST_MARGIN = 2
 
 
 def create_pseudo_faces(face_list: BingoFaceList, amt: int, frees: int, size: int, csv_rows: int,
-                        staggered: bool = True) -> list[list[str | list[str]]]:
+                        staggered: bool = True, progress: Progress = NO_PROGRESS, stage: str = 'Hold faces',
+                        evaluator: ParallelEvaluator | None = None) -> list[list[str | list[str]]]:
     """
     Create hold tickets of varying sizes and free spaces. Use this method when the free spaces are not
     confined to the same column in both rows (i.e., they are placed single spots rather than full columns).
@@ -32,57 +49,111 @@ def create_pseudo_faces(face_list: BingoFaceList, amt: int, frees: int, size: in
     :type staggered: bool
     :param face_list: list of available bingo faces
     :type face_list: BingoFaceList
+    :param progress: where to report how many faces have been made
+    :type progress: Progress
+    :param stage: name the progress is reported under
+    :type stage: str
+    :param evaluator: threads to expand and score the candidates on (None does it all on this thread)
+    :type evaluator: ParallelEvaluator | None
     :return: list of pseudo bingo faces
     :rtype: list[list[str | list[str]]]
     """
-    d_rejects = 0  # List to hold created tickets
     temp_faces = []
     # KEEPING THIS BECAUSE I'LL NEED THE EXPLANATION LATER ON.
     # If the base image needs to be included in the csv, change the value to the appropriate name (convention is "base"
     # + the number of lines padded with zeroes + the extension "ai"), otherwise, simply set it to an empty string.
     # base_file = f"base{str(size).zfill(2)}.ai" if add_base_file else ''
 
+    # Every rotation of a candidate's free spaces across the columns is a variant of it, and the least conflicted
+    # variant is the one that gets used. Ties go to whichever rotation puts the free spaces in the columns the
+    # placer has used least, and the placer is told where they really went once the batch has been settled.
+    variants = COLUMNS if frees > 0 else 1
+    drawn = 0
+    rejects = 0
     while len(temp_faces) < amt:
-        face = face_list.get_two_unique_paths_with_verification()
-        if face[0] is None:
+        wanted = amt - len(temp_faces)
+        # Give up now if what's left in the pool can't possibly cover what's still needed.
+        shortage = check_face_supply(face_list, drawn, len(temp_faces), wanted)
+        if shortage is not None:
+            return shortage
+        # Draw a batch of candidate faces (no more than are still needed, so nothing drawn goes to waste)
+        # and add the free spaces to each of them.
+        candidates = []
+        numbers = []
+        picks = []
+        face = None
+        for _ in range(batch_size(size, frees, wanted, variants)):
+            face = face_list.draw_path_pair(prune=True)
+            if face[0] is None:
+                break
+            # If only one path is needed, leave the second one out
+            picks.append(face[:size + 1])
+            face = [face_list.catalog.verification(face[0])] + [face_list.path_strings(face[0], slot)
+                                                               for slot in face[1:size + 1]]
+            numbers.append([[int(spot) for spot in line] for line in face[1:]])
+            candidates.append(face_list.add_free_spaces(face, frees, staggered))
+        if len(candidates) == 0:
             return face
-        # If only one path is needed, delete the second one
-        if size == 1:
-            face.pop()
-        face = face_list.add_free_spaces(face, frees, staggered)
-        # Get a list representing all possible bingo values then check if there are any collisions.
-        # Next, line takes one or two five-member bingo lines and creates five arrays using the one
-        # or two values in each spot as members. If there is a free spot, *all* 15 numbers for that
-        # spot will be injected it.
-        temp_list = face_list.create_verification_lists(face)
-        # Use the five-member list created above to
-        # calculate the possible winning combinations.
-        combos = face_list.create_winning_combinations(temp_list)
-
-        # Check if there are any possible collisions with previously used paths. If not, create a new
-        # ticket and add it to the ticket array. Otherwise, do nothing.
-        if face_list.paths_collision_free(combos):
-            if len(temp_faces) == 0:
-                print('      ', end='')
-            # ticker = create_one_hold_ticket(base_file, combos, face, size, staggered)
-            # Add these possible winning paths to the paths taken list
-            face_list.add_combos_to_paths_taken(combos)
-            very = face.pop(0)
-            new_face = [very, face]
+        drawn += len(candidates)
+        # Look up the winning paths of every variant of every candidate at once. A free spot means *all* 15
+        # numbers for that column can be matched, so each variant is described by the columns holding a free
+        # spot on any of its lines, and the expansion index does the rest.
+        numbers = np.array(numbers)
+        picks = np.array(picks)
+        masks = np.array([[[spot == '' for spot in line] for line in candidate[1:]] for candidate in candidates])
+        masks = np.stack([np.roll(masks, shift, axis=2) for shift in range(variants)], axis=1)
+        # add_free_spaces counted the unrotated columns as used. Take them back now; the columns that really get
+        # used are counted below. Order each candidate's rotations by how much their columns have been used so far
+        # (expecting the earlier candidates in the batch to get their first choice, and keeping the unrotated
+        # placement first among equals), so a candidate that has to be rotated still lands somewhere sparse.
+        free_columns = masks.any(axis=2)
+        for candidate in range(len(candidates)):
+            face_list.placer.release(np.flatnonzero(free_columns[candidate, 0]).tolist())
+        expected = np.array(face_list.placer.counts)
+        order = np.empty((len(candidates), variants), dtype=np.intp)
+        for candidate in range(len(candidates)):
+            order[candidate] = np.argsort(free_columns[candidate] @ expected, kind='stable')
+            expected += free_columns[candidate, order[candidate, 0]]
+        masks = np.take_along_axis(masks, order[:, :, None, None], axis=1)
+        free_columns = np.take_along_axis(free_columns, order[:, :, None], axis=1)
+        patterns = (masks.any(axis=2) << np.arange(COLUMNS)).sum(axis=2).ravel()
+        faces = np.repeat(picks[:, 0], variants)
+        slots = np.repeat(picks[:, 1:], variants, axis=0)
+
+        def expand(start: int, stop: int) -> np.ndarray:
+            rows = slice(start * variants, stop * variants)
+            return face_list.catalog.candidate_paths(faces[rows], slots[rows], patterns[rows])
+
+        # Score every variant against previously used paths in one pass (split across the evaluator's threads when
+        # there is one), then keep the best collision-free variant of as many candidates as possible (adding their
+        # winning paths to the paths taken ledger along the way).
+        if evaluator is None:
+            combos, conflicts = expand(0, len(candidates)), None
+        else:
+            combos, conflicts = evaluator.evaluate(expand, len(candidates), variants, face_list.paths_taken)
+        groups = np.repeat(np.arange(len(candidates)), variants)
+        accepted = select_candidates(face_list.paths_taken, combos, wanted, groups, conflicts)
+        face_list.d_rejects += len(candidates) - len(accepted)
+        rejects += len(candidates) - len(accepted)
+        for index in accepted:
+            candidate, shift = divmod(index, variants)
+            mask = masks[candidate, shift]
+            face_list.placer.commit(np.flatnonzero(free_columns[candidate, shift]).tolist())
+            lines = [['' if mask[row, column] else str(numbers[candidate, row, column]) for column in range(COLUMNS)]
+                     for row in range(size)]
+            new_face = [candidates[candidate][0], lines]
             new_face += [size, frees, staggered]
             temp_faces.append(new_face)
-            print(f"{len(temp_faces)}", end=" ")
-            if len(temp_faces) % 30 == 0:
-                print('')
-                print('      ', end='')
-        else:
-            d_rejects += 1
-    print('')
+        progress.report(stage, len(temp_faces), amt, rejects)
+        # If the faces ran out before the batch was filled, there's no point in going on.
+        if face_list.get_usable_faces_size() == 0 and len(temp_faces) < amt:
+            return [None, "!!!!! ERROR: WE'VE RUN OUT OF BINGO FACES! !!!!!"]
     return temp_faces
 
 
-def create_single_line_either_or_faces(face_list: BingoFaceList, deets: list[int],
-                                       verbose: bool = False) -> list[list[list[str | list[str]]]]:
+def create_single_line_either_or_faces(face_list: BingoFaceList, deets: list[int], progress: Progress = NO_PROGRESS,
+                                       stage: str = 'Either-or faces', evaluator: ParallelEvaluator | None = None
+                                       ) -> list[list[list[str | list[str]]]]:
     """
     Create a list of single-line bingos with possible either-or and/or free spots.
     (Any tickets that have no either-or spots will probably be handled by other methods.)
@@ -96,23 +167,22 @@ def create_single_line_either_or_faces(face_list: BingoFaceList, deets: list[int
     :param deets: Specifications for face creation, where deets[0] is the quantity of faces, deets[1] is
                   the number of free spaces, and deets[2] is the number of either-or spaces.
     :type deets: list[int]
-    :param verbose: Flag to control whether detailed information is printed during the process.
-    :type verbose: bool
+    :param progress: Where to report how many faces have been made.
+    :type progress: Progress
+    :param stage: Name the progress is reported under.
+    :type stage: str
+    :param evaluator: Threads to expand and score the candidates on (None does it all on this thread).
+    :type evaluator: ParallelEvaluator | None
     :return: List of created bingo faces, each with several structured lines.
     :rtype: list[list[list[str | list[str]]]]
     """
+    # Get all the either-or bingo faces based on specs.
+    temp_faces = create_pseudo_either_or_faces(face_list, deets[1], deets[2], deets[0], progress, stage, evaluator)
+    # If we got none, we're screwed. So, just bail and return the error.
+    if len(temp_faces) > 0 and temp_faces[0] is None:
+        return temp_faces
     faces = []
-    # Loop until there are the required faces (deets[0] = quantity).
-    while len(faces) < deets[0]:
-        # Print info to console if desired.
-        if verbose:
-            if len(faces) == 0:
-                print('      ', end='')
-        # Get a single either-or bingo face based on specs.
-        temp_face = create_single_line_pseudo_either_or(face_list, deets[1], deets[2])
-        # If we got none, we're screwed. So, just bail and return None.
-        if temp_face[0] is None:
-            return temp_face
+    for temp_face in temp_faces:
         # Create a list for the face with the validation number at the zero index.
         face = [temp_face[0]]
         # Create a list with three elements that represent the csv columns used to properly place
@@ -136,12 +206,6 @@ def create_single_line_either_or_faces(face_list: BingoFaceList, deets: list[int
         # Add the lines to the face and the face to the faces list.
         face.append(lines)
         faces.append(face)
-        # Print info to console if desired.
-        if verbose:
-            print(f"{len(faces)}", end=" ")
-            if len(faces) % 30 == 0:
-                print('')
-                print('      ', end='')
     # Return the faces list.
     return faces
 
@@ -149,12 +213,7 @@ def create_single_line_either_or_faces(face_list: BingoFaceList, deets: list[int
 def create_single_line_pseudo_either_or(face_list: BingoFaceList, frees: int,
                                         doubles: int) -> list[list[str | list[str]] | None]:
     """
-    Creates a pseudo either-or bingo face sequence based on specified parameters.
-
-    The function orchestrates the setup of a bingo face, ensuring that it complies with
-    certain criteria such as free spaces, double spaces, and unique verification numbers.
-    It alters the internal state of the given BingoFaceList and performs validation to
-    prevent duplicated winning paths.
+    Creates a single pseudo either-or bingo face (see create_pseudo_either_or_faces).
 
     :param face_list: Instance of BingoFaceList that holds and manages the bingo faces
         and paths taken.
@@ -163,99 +222,154 @@ def create_single_line_pseudo_either_or(face_list: BingoFaceList, frees: int,
     :type frees: int
     :param doubles: Number of spots that will have two numbers.
     :type doubles: int
-
     :return: A list representing the final bingo face. The list contains two elements:
         1. A single integer string representing the bingo verification number.
         2. A list of lists where each inner list represents a bingo column and contains
            either a single number string, a double number string, or a blank (free) space.
     :rtype: list[list[str | list[str]] | None]
     """
-    go_again = True
-    final_face = None
-    pop_first = True
-    while go_again:
-        faces = face_list.get_two_unique_paths_with_verification()
-        go_again = False
-        if faces is None or len(faces) < 2:
-            return [None, "!!!!! ERROR: WE'VE RUN OUT OF BINGO FACES! !!!!!"]
-        # noinspection PyTypeChecker
-        # Transpose the two five-member lists into five two-number lists
-        spots_list = matrix([faces[1], faces[2]]).transpose().tolist()
-        if spots_list[0] is None:
-            return spots_list
-
-        # Create a list representing the indexes of the columns of the bingo face and shuffle it
-        # a few times. This will be used to determine where to place either-or and free spots.
-        spaces = list(range(5))
-        for x in range(rn.randint(4, 10)):
-            rn.shuffle(spaces)
-
-        # Create a list of the spots that have two numbers by popping column indexes off of the spaces list.
-        # This is really rather superfluous, since no change is effected on these columns. But I may, one day,
-        # decide to do things differently and this will be in place.
-        combo_spaces = []
-        for x in range(doubles):
-            combo_spaces.append(spaces.pop())
-
-        # Create a list of the spots that will contain a free space by popping column indexes off the spaces list.
-        # These columns will be replaced by lists containing every possible value for the spot, since any value
-        # could be called and matched here. This is used to check for possible collisions with previously taken
-        # winning paths.
-        free_spaces = []
-        for x in range(frees):
-            free_spaces.append(spaces.pop())
-
-        # The remaining spots will have only one number on them, so traverse the list of
-        # spaces and use it as an index to remove the second number at those positions.
-        for x in spaces:
-            # popper = 1 if pop_first else 0
-            spots_list[x].pop(1 if pop_first else 0)
-            # spots_list[x].pop(popper)
-            pop_first = not pop_first
-
-        # Traverse the list of free space positions and replace the two-number list there with a list
-        # of all fifteen possible numbers. This allows the product of the lists to account for every
-        # possible winning combination and avoid duplicate winners.
-        for x in free_spaces:
-            bottom = x * 15
-            spot = list(range(bottom + 1, bottom + 16))
-            spots_list[x] = [str(s) for s in spot]
-
-        # Use set mathematics to produce a list of possible winning combinations.
-        # Cycle through the resulting list and check each value against those in
-        # the paths_taken set. If a duplicate is found, chuck this face and try again.
-        combos = set(iters.product(*spots_list))
-        for combo in combos:
-            if combo in face_list.paths_taken:
-                go_again = True
-                break
+    faces = create_pseudo_either_or_faces(face_list, frees, doubles, 1)
+    return faces if faces[0] is None else faces[0]
 
-        # If there was a collision, don't go beyond this point! Start over, right flippin' now!!
-        if go_again:
-            continue
 
-        # This face will be used, so add its winning paths to the paths_taken set.
-        for combo in combos:
-            face_list.paths_taken.add(combo)
+def create_pseudo_either_or_faces(face_list: BingoFaceList, frees: int, doubles: int, amt: int,
+                                  progress: Progress = NO_PROGRESS, stage: str = 'Either-or faces',
+                                  evaluator: ParallelEvaluator | None = None
+                                  ) -> list[list[str | list[str]]] | list[None | str]:
+    """
+    Creates pseudo either-or bingo faces based on specified parameters.
+
+    Each face is made from two lines of a catalog face. A double spot shows both lines' numbers, a free spot
+    matches any number in its column, and a single spot keeps the number from one line or the other
+    (alternating across the columns). Every way the double and free spots can be arranged across the columns is
+    scored against the paths taken, and a face is built from one that has no conflicts (tried in random order,
+    so the layout stays unpredictable).
 
-        # Create the final faces list which contains two members: the first is a single integer string
+    The candidates are drawn and scored a batch at a time: every arrangement of every candidate in the batch is
+    expanded into integer path ids with the catalog's expansion index and checked against the paths taken ledger
+    in a single pass. A candidate whose arrangements all collide gives its two lines back to its face, and the face
+    goes back into the pool, so a rejected candidate doesn't cost any catalog capacity.
+
+    :param face_list: Instance of BingoFaceList that holds and manages the bingo faces
+        and paths taken.
+    :type face_list: BingoFaceList
+    :param frees: Number of free spaces to be included in each bingo face.
+    :type frees: int
+    :param doubles: Number of spots that will have two numbers.
+    :type doubles: int
+    :param amt: Number of faces needed.
+    :type amt: int
+    :param progress: Where to report how many faces have been made.
+    :type progress: Progress
+    :param stage: Name the progress is reported under.
+    :type stage: str
+    :param evaluator: Threads to expand and score the candidates on (None does it all on this thread).
+    :type evaluator: ParallelEvaluator | None
+    :return: The faces (each a verification number string and a list of the five bingo columns, see
+        create_single_line_pseudo_either_or), or [None, error message] if the faces ran out.
+    :rtype: list[list[str | list[str]]] | list[None | str]
+    """
+    # List every way the double and free spots can be arranged across the columns. The rest of the columns are
+    # single spots.
+    arrangements = [(combo_spaces, free_spaces)
+                    for combo_spaces in iters.combinations(range(COLUMNS), doubles)
+                    for free_spaces in iters.combinations([x for x in range(COLUMNS) if x not in combo_spaces], frees)]
+    masks = [(sum(1 << x for x in combo_spaces), sum(1 << x for x in free_spaces))
+             for combo_spaces, free_spaces in arrangements]
+    variants = len(arrangements)
+    faces = []
+    drawn = 0
+    rejects = 0
+    while len(faces) < amt:
+        wanted = amt - len(faces)
+        # Give up now if what's left in the pool can't possibly cover what's still needed.
+        shortage = check_face_supply(face_list, drawn, len(faces), wanted)
+        if shortage is not None:
+            return shortage
+        picks = []
+        pick = None
+        for _ in range(batch_size(2, frees, wanted, variants, (COLUMN_SIZE ** frees) * (2 ** doubles))):
+            pick = face_list.draw_path_pair()
+            if pick[0] is None:
+                break
+            picks.append(pick)
+        if len(picks) == 0:
+            return pick
+        drawn += len(picks)
+        picks = np.array(picks)
+
+        # Expand every arrangement of every candidate, shuffle each candidate's arrangements, and keep the first
+        # one without collisions (adding its paths to the paths taken ledger).
+        line_ids = face_list.catalog.line_ids[picks[:, :1], picks[:, 1:]]
+        order = np.array([rn.sample(range(variants), variants) for _ in range(len(picks))])
+
+        def expand(start: int, stop: int) -> np.ndarray:
+            combos = np.stack([face_list.catalog.expansion.expand_either_or(line_ids[start:stop], combo_mask, free_mask)
+                               for combo_mask, free_mask in masks], axis=1)
+            return np.take_along_axis(combos, order[start:stop, :, None], axis=1).reshape((stop - start) * variants, -1)
+
+        if evaluator is None:
+            combos, conflicts = expand(0, len(picks)), None
+        else:
+            combos, conflicts = evaluator.evaluate(expand, len(picks), variants, face_list.paths_taken)
+        groups = np.repeat(np.arange(len(picks)), variants)
+        accepted = select_candidates(face_list.paths_taken, combos, wanted, groups, conflicts)
+
+        # Create the final faces, each of which contains two members: the first is a single integer string
         # representing the bingo verification number. The second is a list composed of five lists
         # representing the bingo columns. Those lists contain a single number string, a double number
-        # string, or a blank (free) space. The construction is described below.
-        final_face = [faces[0], []]
-        for spots in spots_list:
-            # Sort the list so the lowest number will be at the front.
-            spots.sort(key=int)
-            # If the length of the list in this position is greater than two, it
-            # means this is a free spot. Add a list to final_faces that contains
-            # a single blank string.
-            if len(spots) > 2:
-                final_face[1].append([''])
-            # Otherwise, just add the list at this position to final_faces
-            else:
-                # noinspection PyTypeChecker
-                final_face[1].append(spots)
-    return final_face
+        # string (lowest number first), or a blank (free) space.
+        used = set()
+        for index in accepted:
+            candidate, variant = divmod(index, variants)
+            used.add(candidate)
+            face, slot1, slot2 = picks[candidate].tolist()
+            pair = face_list.catalog.paths[face, [slot1, slot2]].tolist()
+            combo_spaces, free_spaces = arrangements[order[candidate, variant]]
+            singles = [x for x in range(COLUMNS) if x not in combo_spaces and x not in free_spaces]
+            final_face = [face_list.catalog.verification(face), []]
+            for x in range(COLUMNS):
+                if x in free_spaces:
+                    final_face[1].append([''])
+                elif x in combo_spaces:
+                    final_face[1].append([str(spot) for spot in sorted([pair[0][x], pair[1][x]])])
+                else:
+                    final_face[1].append([str(pair[singles.index(x) % 2][x])])
+            faces.append(final_face)
+        # Every arrangement of the others collided with something. Their lines go back to their faces.
+        for candidate in range(len(picks)):
+            if candidate not in used:
+                face_list.return_path_pair(*picks[candidate].tolist())
+                face_list.d_rejects += 1
+                rejects += 1
+        progress.report(stage, len(faces), amt, rejects)
+    return faces
+
+
+def check_face_supply(face_list: BingoFaceList, drawn: int, accepted: int, wanted: int) -> list[None | str] | None:
+    """
+    Decide whether it's worth drawing any more faces. Every candidate uses up a pair of lines, so there's no hope
+    if the pool has fewer pairs left than faces still needed. Once FAIL_FAST_SAMPLE candidates have been drawn,
+    the acceptance rate so far is used to project how many more faces the pool can produce, and the job is
+    called off if even FAIL_FAST_MARGIN times that projection falls short.
+
+    :param face_list: list of available bingo faces
+    :type face_list: BingoFaceList
+    :param drawn: number of candidates drawn so far
+    :type drawn: int
+    :param accepted: number of those candidates that were used
+    :type accepted: int
+    :param wanted: number of faces still needed
+    :type wanted: int
+    :return: None if it's worth going on, otherwise [None, error message]
+    :rtype: list[None | str] | None
+    """
+    supply = face_list.usable_faces.pairs_left()
+    projected = supply if drawn < FAIL_FAST_SAMPLE else int(supply * (accepted + 1) / (drawn + 1))
+    if supply >= wanted and projected * FAIL_FAST_MARGIN >= wanted:
+        return None
+    return [None, f"!!!!! ERROR: WE'RE RUNNING OUT OF BINGO FACES! {wanted} MORE ARE NEEDED, BUT ONLY ABOUT "
+                  f"{min(supply, projected)} CAN STILL BE MADE. !!!!!"]
 
 
 def print_usable_face_info_to_screen(faces: BingoFaceList, size=0):
@@ -276,14 +390,63 @@ def print_usable_face_info_to_screen(faces: BingoFaceList, size=0):
     indent = ''
     for i in range(size):
         indent += '  '
-    print(f"{indent}Usable faces array contains {faces.length()} members.")
-    print(f"{indent}There are {faces.calculate_remaining_bingo_lines()} discrete bingo lines remaining.")
-    print(f"{indent}{faces.number_of_paths_taken()} discrete winning paths have been taken.\n")
+    capacity = faces.capacity()
+    print(f"{indent}Usable faces array contains {capacity.faces} members.")
+    print(f"{indent}There are {capacity.lines} discrete bingo lines remaining.")
+    print(f"{indent}{capacity.paths_taken} discrete winning paths have been taken.")
+    print(f"{indent}{capacity.discards} faces discarded, {capacity.pruned} lines pruned, "
+          f"{capacity.rejects} candidates rejected.\n")
+
+
+def create_scheduled_faces(face_list: BingoFaceList, job: ScheduledJob, csv_rows: int,
+                           progress: Progress = NO_PROGRESS, stage: str | None = None,
+                           stats: GenerationStats | None = None, permutation: int = 0,
+                           evaluator: ParallelEvaluator | None = None) -> list[list[str | list[str]]]:
+    """
+    Create the faces for one scheduled job, handing it to the generator for its face type.
+
+    :param face_list: list of available bingo faces
+    :type face_list: BingoFaceList
+    :param job: face type and the number of faces needed
+    :type job: ScheduledJob
+    :param csv_rows: number of rows needed for the csv file
+    :type csv_rows: int
+    :param progress: where to report how many faces have been made
+    :type progress: Progress
+    :param stage: name the progress is reported under (None uses the face type's description)
+    :type stage: str | None
+    :param stats: statistics to add the job to (None doesn't keep any)
+    :type stats: GenerationStats | None
+    :param permutation: index of the permutation the faces are for (only used for the statistics)
+    :type permutation: int
+    :param evaluator: threads to expand and score the candidates on (None does it all on this thread)
+    :type evaluator: ParallelEvaluator | None
+    :return: list of bingo faces, or [None, error message] if the faces ran out
+    :rtype: list[list[str | list[str]]]
+    """
+    face_type = job.face_type
+    if stage is None:
+        stage = face_type.description
+    before = face_list.capacity()
+    started = time.perf_counter()
+    if face_type.is_either_or:
+        faces = create_single_line_either_or_faces(face_list, job.deets, progress, stage, evaluator)
+    else:
+        faces = create_pseudo_faces(face_list, job.amount, face_type.frees, face_type.lines, csv_rows,
+                                    face_type.staggered, progress, stage, evaluator)
+    if stats is not None:
+        made = 0 if len(faces) > 0 and faces[0] is None else len(faces)
+        stats.record(face_type.key, permutation, made, before, face_list.capacity(), time.perf_counter() - started)
+    return faces
 
 
 def create_all_bingo_permutations_without_reset(bingo_amts: list[list[int] | list[list[int]] | bool | str],
-                                                perms, csv_rows: int, v_size=False,
-                                                verbose=False) -> list[list[str | list[str]]] | None:
+                                                perms, csv_rows: int, v_size=False, verbose=False,
+                                                order: OrderingStrategy = by_path_demand,
+                                                checkpoint: str | None = None, store: LedgerStore | None = None,
+                                                reservation: str | None = None, progress: Progress = NO_PROGRESS,
+                                                stats: GenerationStats | None = None, catalog: str | None = None,
+                                                workers: int | None = 1) -> list[list[str | list[str]]] | None:
     """
     This method creates the total number of tickets needed for all permutations for each ticket specification based on
     the number of possible winning paths generated (by combining its free, double, and single spaces), before moving on
@@ -291,6 +454,23 @@ def create_all_bingo_permutations_without_reset(bingo_amts: list[list[int] | lis
     given permutation before moving on to the next. Doing this makes it easier to find less demanding tickets as the
     method progresses and has been shown to provide a better chance of generating all the desired tickets.
 
+    The face types and the order they're created in come from bingo_schedule. Whatever the order, each finished
+    permutation lists its faces in FACE_TYPES order (either-ors first, then each group of holds).
+
+    If a checkpoint file is passed, the run's progress is saved to it as it goes (see bingo_checkpoint), and a run
+    started with the same file and specifications picks up where the last checkpoint left off. The file is removed
+    once every permutation is done.
+
+    Games that are played together need to stay clear of each other's winning paths, too. Pass a LedgerStore and a
+    reservation name, and the job starts with every path the store has reserved already taken, then reserves the
+    paths it adds under that name when it's done (see ledger_store).
+
+    The permutations share one ledger here, so they can't be farmed out to processes the way they are with a reset.
+    The work inside each batch of candidates can be, though: with more than one worker, the expansion and scoring of
+    every batch is split across threads (see ParallelEvaluator), while accepting the faces and taking their paths
+    stays on this thread. The batches are the same either way, so the faces don't depend on the number of workers.
+    Threads only help when there are cores to run them on; on a single core, leave workers at 1.
+
     :param bingo_amts: list containing the number of bingo faces needed for each type of face: lines and free spaces
     :type bingo_amts: list[list[int] | | list[list[int]] | bool | str]
     :param perms: the number of permutations needed
@@ -301,514 +481,138 @@ def create_all_bingo_permutations_without_reset(bingo_amts: list[list[int] | lis
     :type v_size: bool
     :param verbose: should status info be printed to the screen
     :type verbose: bool
+    :param order: strategy that decides which face types are created first
+    :type order: OrderingStrategy
+    :param checkpoint: file to save progress to and resume from (None doesn't save anything)
+    :type checkpoint: str | None
+    :param store: persistent ledger shared by games that are played together
+    :type store: LedgerStore | None
+    :param reservation: name to reserve this job's paths under in the store
+    :type reservation: str | None
+    :param progress: where to report how many faces of each type have been made
+    :type progress: Progress
+    :param stats: statistics to add every face type and permutation to (None doesn't keep any)
+    :type stats: GenerationStats | None
+    :param catalog: compiled catalog to draw the faces from instead of the packaged one (a superset written by
+                    face_generator; v_size still says whether it starts from the standard or extended faces)
+    :type catalog: str | None
+    :param workers: number of threads to expand and score candidates on (1 uses this one, None uses every core)
+    :type workers: int | None
     :return list of info for bingo faces
     :rtype: list[list[str | list[str]]]
     """
-    sloes = ['f2d2', 'f2d1', 'f1d2', 'f1d1', 'f0d2', 'f0d1', 'f0d3']
-    # Create and shuffle a new list of usable faces
-    face_list = BingoFaceList(v_size)
-    face_list.shuffle_usable_faces()
-    numbs = []
-    for i in range(5):
-        numbs.append(bingo_amts[i])
-
-    # Break up the bingo requirements by type (single- or double-lines staggered or not, plus either-ors)
-    [q_nonstaggered_double_holds, q_staggered_double_holds,
-     q_nonstaggered_single_holds, q_staggered_single_holds, q_single_line_either_ors] = numbs
+    if workers is None:
+        workers = os.cpu_count() or 1
+    # Create a new list of usable faces (it's shuffled before each face type is created)
+    face_list = BingoFaceList(v_size, catalog)
+    jobs = build_jobs(bingo_amts)
+    if store is not None:
+        if reservation is None:
+            return [None, "!!!!! ERROR: A RESERVATION NAME IS NEEDED TO USE A LEDGER STORE. !!!!!"]
+        try:
+            check_reservation_name(reservation)
+        except ValueError:
+            return [None, f"!!!!! ERROR: '{reservation}' CAN'T BE USED AS A RESERVATION NAME. !!!!!"]
+        if reservation in store.reservations():
+            return [None, f"!!!!! ERROR: THERE IS ALREADY A RESERVATION NAMED '{reservation}'. !!!!!"]
+        face_list.paths_taken = store.snapshot()
+    base = face_list.paths_taken.copy() if store is not None else None
+    saved = None
+    if checkpoint is not None:
+        try:
+            saved = BingoCheckpoint.open(checkpoint, job_fingerprint('without_reset', bingo_amts, perms, v_size,
+                                                                     order, catalog=catalog))
+        except ValueError as err:
+            return [None, f"!!!!! ERROR: {err} !!!!!"]
+        saved.resume(face_list)
+        # A resumed run keeps measuring its paths against the snapshot it started from.
+        if saved.base is not None:
+            base = PathLedger(saved.base)
+        elif store is not None:
+            saved.base = base.bits
     if verbose:
         print_usable_face_info_to_screen(face_list)
         print(f"----------> Creating {perms} permutations without resetting the usable faces array. <----------")
 
-    # Create lists to hold the faces for each type and add a sublist for each permutation.
-    nonstaggered_double_holds = [[] for _ in range(perms)]
-    staggered_double_holds = [[] for _ in range(perms)]
-    nonstaggered_single_holds = [[] for _ in range(perms)]
-    staggered_single_holds = [[] for _ in range(perms)]
-    single_line_either_ors = [{} for _ in range(perms)]
-
-    # Create a dictionary to hold faces for either/ors, using their parameters
-    # to create the keys: an either/or with 1 free space and 2 either/or spots
-    # would be referred to by the key 'sloef1d2'.
-    q_either_ors = {}
-    if q_single_line_either_ors[0][0] != 0:
-        for sloe in q_single_line_either_ors:
-            q_either_ors[f"sloef{sloe[1]}d{sloe[2]}"] = sloe
-
-    # Create the permutations list and a list for each permutation. Also, create a list in each
-    # for the number of possible free spots (0 - 3). The index represents the number of free spots,
-    # and the list will contain all the tickets for that slot.
-    permutations = []
-    for i in range(perms):
-        permutations.append([])
-        nonstaggered_double_holds[i] = [[] for _ in range(4)]
-        staggered_double_holds[i] = [[] for _ in range(4)]
-        nonstaggered_single_holds[i] = [[] for _ in range(4)]
-        staggered_single_holds[i] = [[] for _ in range(4)]
-        for eeyore in q_either_ors:
-            single_line_either_ors[i][eeyore] = []
-
-    # BEGIN TICKET GENERATION (in order of the number of possible winning paths)
-    # Two-line tickets with three-nonstaggered free spots (13500 winning paths)
-    if q_nonstaggered_double_holds[3] > 0:
-        if verbose:
-            print(f"  Creating {perms} permutations of non-staggered, double-line hold with three free spaces.")
-        for i in range(perms):
-            face_list.shuffle_usable_faces()
-            if verbose:
-                print(f"    Permutation #{i + 1}: Creating {q_nonstaggered_double_holds[3]} non-staggered, "
-                      f"double-line holds with three free spaces.")
-            temp_list = create_pseudo_faces(face_list, q_nonstaggered_double_holds[3], 3, 2, csv_rows, False)
-            if temp_list[0] is None:
-                return temp_list
-            nonstaggered_double_holds[i][3].append(temp_list)
-            if verbose:
-                print('    Done.')
-                print_usable_face_info_to_screen(face_list, 2)
-        if verbose:
-            print('  Done.')
-
-    # Two-line tickets with three-staggered free spots (13500 winning paths)
-    if q_staggered_double_holds[3] > 0:
-        if verbose:
-            print(f"  Creating {perms} permutations of staggered, double-line hold with three free spaces.")
-        for i in range(perms):
-            face_list.shuffle_usable_faces()
-            if verbose:
-                print(f"    Permutation #{i + 1}: Creating {q_staggered_double_holds[3]} staggered, double-line "
-                      f"holds with three free spaces.")
-            temp_list = create_pseudo_faces(face_list, q_staggered_double_holds[3], 3, 2, csv_rows, True)
-            if temp_list[0] is None:
-                return temp_list
-            staggered_double_holds[i][3].append(temp_list)
-            if verbose:
-                print('    Done.')
-                print_usable_face_info_to_screen(face_list, 2)
-        if verbose:
-            print('  Done.')
-
-    # One-line tickets with three-nonstaggered free spots (3375 winning paths)
-    if q_nonstaggered_single_holds[3] > 0:
-        if verbose:
-            print(f"  Creating {perms} permutations of non-staggered, single-line hold with three free spaces.")
-        for i in range(perms):
-            face_list.shuffle_usable_faces()
-            if verbose:
-                print(f"    Permutation #{i + 1}: Creating {q_nonstaggered_single_holds[3]} staggered, single-line "
-                      f"tickets with three free spaces.")
-            temp_list = create_pseudo_faces(face_list, q_nonstaggered_single_holds[3],
-                                            3, 1, csv_rows, False)
-            if temp_list[0] is None:
-                return temp_list
-            nonstaggered_single_holds[i][3].append(temp_list)
-            if verbose:
-                print('    Done.')
-                print_usable_face_info_to_screen(face_list, 2)
-        if verbose:
-            print('  Done.')
-
-    # Two-line tickets with two-nonstaggered free spots (1800 winning paths)
-    if q_nonstaggered_double_holds[2] > 0:
-        if verbose:
-            print(f"  Creating {perms} permutations of non-staggered, double line hold with two free spaces.")
-        for i in range(perms):
-            face_list.shuffle_usable_faces()
-            if verbose:
-                print(f"    Permutation #{i + 1}: Creating {q_nonstaggered_double_holds[2]} non-staggered, double-line "
-                      f"tickets with two free spaces.")
-            temp_list = create_pseudo_faces(face_list, q_nonstaggered_double_holds[2], 2, 2, csv_rows, False)
-            if temp_list[0] is None:
-                return temp_list
-            nonstaggered_double_holds[i][2].append(temp_list)
-            if verbose:
-                print('    Done.')
-                print_usable_face_info_to_screen(face_list, 2)
-        if verbose:
-            print('  Done.')
-
-    # Two-line tickets with two-staggered free spots (1800 winning paths)
-    if q_staggered_double_holds[2] > 0:
-        if verbose:
-            print(f"  Creating {perms} permutations of staggered, double line hold with two free spaces.")
-        for i in range(perms):
-            face_list.shuffle_usable_faces()
-            if verbose:
-                print(f"    Permutation #{i + 1}: Creating {q_staggered_double_holds[2]} staggered, double-line "
-                      f"tickets with two free spaces.")
-            temp_list = create_pseudo_faces(face_list, q_staggered_double_holds[2], 2, 2, csv_rows, True)
-            if temp_list[0] is None:
-                return temp_list
-            staggered_double_holds[i][2].append(temp_list)
-            if verbose:
-                print('    Done.')
-                print_usable_face_info_to_screen(face_list, 2)
-        if verbose:
-            print('  Done.')
-
-    # Single-line ticket with two free spaces and two either/or spots (900 winning paths)
-    if 'sloef2d2' in q_either_ors:
-        if verbose:
-            print(f"  Creating {perms} permutations of single-line hold with two free and two either/or spaces.")
-        for i in range(perms):
-            face_list.shuffle_usable_faces()
-            if verbose:
-                print(f"    Permutation #{i + 1}: Creating {q_either_ors['sloef2d2'][0]} single-line "
-                      f"tickets with two free spaces and two either-or spots.")
-            temp_list = create_single_line_either_or_faces(face_list, q_either_ors['sloef2d2'])
-            if temp_list[0] is None:
-                return temp_list
-            single_line_either_ors[i]['sloef2d2'] = temp_list
-            if verbose:
-                print('  Done.')
-                print_usable_face_info_to_screen(face_list, 2)
-        if verbose:
-            print('  Done.')
-
-    # Single-line ticket with two free spaces and two either/or spots (450 winning paths)
-    if 'sloef2d1' in q_either_ors:
-        if verbose:
-            print(f"  Creating {perms} permutations of single-line hold with two free and one either/or space.")
-        for i in range(perms):
-            face_list.shuffle_usable_faces()
-            if verbose:
-                print(f"    Permutation #{i + 1}: Creating {q_either_ors['sloef2d1'][0]} single-line "
-                      f"tickets with two free spaces and two either-or spots.")
-            temp_list = create_single_line_either_or_faces(face_list, q_either_ors['sloef2d1'])
-            if temp_list[0] is None:
-                return temp_list
-            single_line_either_ors[i]['sloef2d1'] = temp_list
-            if verbose:
-                print('  Done.')
-                print_usable_face_info_to_screen(face_list, 2)
-        if verbose:
-            print('  Done.')
-
-    # Two-line tickets with one nonstaggered free spot (240 winning paths)
-    if q_nonstaggered_double_holds[1] > 0:
-        face_list.shuffle_usable_faces()
-        if verbose:
-            print(f"  Creating {perms} permutations of non-staggered, double line hold with one free space.")
-        for i in range(perms):
-            if verbose:
-                print(f"    Permutation #{i + 1}: Creating {q_nonstaggered_double_holds[1]} non-staggered, double-line "
-                      f"tickets with one free space.")
-            temp_list = create_pseudo_faces(face_list, q_nonstaggered_double_holds[1], 1, 2, csv_rows, False)
-            if temp_list[0] is None:
-                return temp_list
-            nonstaggered_double_holds[i][1].append(temp_list)
-            if verbose:
-                print('  Done.')
-                print_usable_face_info_to_screen(face_list, 2)
-        if verbose:
-            print('  Done.')
-
-    # Two-line tickets with one staggered free spot (240 winning paths)
-    if q_staggered_double_holds[1] > 0:
-        face_list.shuffle_usable_faces()
-        if verbose:
-            print(f"  Creating {perms} permutations of staggered, double line hold with one free space.")
-        for i in range(perms):
-            if verbose:
-                print(f"    Permutation #{i + 1}: Creating {q_staggered_double_holds[1]} non-staggered, double-line "
-                      f"tickets with one free space.")
-            temp_list = create_pseudo_faces(face_list, q_staggered_double_holds[1], 1, 2, csv_rows, True)
-            if temp_list[0] is None:
-                return temp_list
-            staggered_double_holds[i][1].append(temp_list)
-            if verbose:
-                print('  Done.')
-                print_usable_face_info_to_screen(face_list, 2)
-        if verbose:
-            print('  Done.')
-
-    # Single-line tickets with two-nonstaggered free spots (225 winning paths)
-    if q_nonstaggered_single_holds[2] > 0:
-        if verbose:
-            print(f"  Creating {perms} permutations of nonstaggered, single-line hold with two free space.")
-        for i in range(perms):
-            face_list.shuffle_usable_faces()
-            if verbose:
-                print(f"    Permutation #{i + 1}: Creating {q_nonstaggered_single_holds[2]} nonstaggered, single-line "
-                      f"tickets with two free spaces.")
-            temp_list = create_pseudo_faces(face_list, q_nonstaggered_single_holds[2], 2, 1, csv_rows, False)
-            if temp_list[0] is None:
-                return temp_list
-            nonstaggered_single_holds[i][2].append(temp_list)
-            if verbose:
-                print('  Done.')
-                print_usable_face_info_to_screen(face_list, 2)
-        if verbose:
-            print('  Done.')
-
-    # Single-line tickets with two staggered free spots (225 winning paths)
-    if q_staggered_single_holds[2] > 0:
-        if verbose:
-            print(f"  Creating {perms} permutations of staggered, single-line hold with two free spaces.")
-        for i in range(perms):
-            face_list.shuffle_usable_faces()
-            if verbose:
-                print(f"    Permutation #{i + 1}: Creating {q_staggered_single_holds[2]} staggered, single-line "
-                      f"tickets with two free spaces.")
-            temp_list = create_pseudo_faces(face_list, q_staggered_single_holds[2], 2, 1, csv_rows, True)
-            if temp_list[0] is None:
-                return temp_list
-            staggered_single_holds[i][2].append(temp_list)
-            if verbose:
-                print('  Done.')
-                print_usable_face_info_to_screen(face_list, 2)
-        if verbose:
-            print('  Done.')
-
-    # Double-line tickets with no free spaces. (Nonstaggered, but that's irrelevant.) (32 winning paths)
-    if q_nonstaggered_double_holds[0] > 0:
-        if verbose:
-            print(f"  Creating {perms} permutations of nonstaggered, double-line hold with no free spaces.")
-        for i in range(perms):
-            face_list.shuffle_usable_faces()
-            if verbose:
-                print(f"    Permutation #{i + 1}: Creating {q_nonstaggered_double_holds[0]} nonstaggered, double-line "
-                      f"tickets with no free spaces.")
-            temp_list = create_pseudo_faces(face_list, q_nonstaggered_double_holds[0], 0, 2, csv_rows, False)
-            if temp_list[0] is None:
-                return temp_list
-            nonstaggered_double_holds[i][0].append(temp_list)
-            if verbose:
-                print('  Done.')
-                print_usable_face_info_to_screen(face_list, 2)
-        if verbose:
-            print('  Done.')
-
-    # Single-line ticket with one free space and two either/or spot (60 winning paths)
-    if 'sloef1d2' in q_either_ors:
-        if verbose:
-            print(f"  Creating {perms} permutations of single-line hold with one free and two either/or spaces.")
-        for i in range(perms):
-            face_list.shuffle_usable_faces()
-            if verbose:
-                print(f"    Permutation #{i + 1}: Creating {q_either_ors['sloef1d2'][0]} single-line "
-                      f"tickets with two free spaces and two either-or spots.")
-            temp_list = create_single_line_either_or_faces(face_list, q_either_ors['sloef1d2'])
-            if temp_list[0] is None:
-                return temp_list
-            single_line_either_ors[i]['sloef1d2'] = temp_list
-            if verbose:
-                print('  Done.')
-                print_usable_face_info_to_screen(face_list, 2)
-        if verbose:
-            print('  Done.')
-
-    # Double-line tickets with no free spaces. (Staggered, but that's irrelevant.) (32 winning paths)
-    if q_staggered_double_holds[0] > 0:
-        if verbose:
-            print(f"  Creating {perms} permutations of staggered, double-line hold with no free spaces.")
-        for i in range(perms):
-            face_list.shuffle_usable_faces()
-            if verbose:
-                print(f"    Permutation #{i + 1}: Creating {q_staggered_double_holds[0]} staggered, double-line "
-                      f"tickets with no free spaces.")
-            temp_list = create_pseudo_faces(face_list, q_staggered_double_holds[0], 0, 2, csv_rows, False)
-            if temp_list[0] is None:
-                return temp_list
-            staggered_double_holds[i][0].append(temp_list)
-            if verbose:
-                print('  Done.')
-                print_usable_face_info_to_screen(face_list, 2)
-        if verbose:
-            print('  Done.')
-
-    # Single-line tickets with one staggered free space. (15 winning paths)
-    if q_staggered_single_holds[1] > 0:
-        if verbose:
-            print(f"  Creating {perms} permutations of staggered, single-line hold with one free space.")
-        for i in range(perms):
-            face_list.shuffle_usable_faces()
-            if verbose:
-                print(f"    Permutation #{i + 1}: Creating {q_staggered_single_holds[1]} staggered, single-line "
-                      f"tickets with one free space.")
-            temp_list = create_pseudo_faces(face_list, q_staggered_single_holds[1],
-                                            1, 1, csv_rows, True)
-            if temp_list[0] is None:
-                return temp_list
-            staggered_single_holds[i][1].append(temp_list)
-            if verbose:
-                print('  Done.')
-                print_usable_face_info_to_screen(face_list, 2)
-        if verbose:
-            print('  Done.')
-
-    # Single-line tickets with one nonstaggered free space. (15 winning paths)
-    if q_nonstaggered_single_holds[1] > 0:
-        if verbose:
-            print(f"  Creating {perms} permutations of non-staggered, single-line hold with one free space.")
-        for i in range(perms):
-            face_list.shuffle_usable_faces()
-            if verbose:
-                print(f"    Permutation #{i + 1}: Creating {q_nonstaggered_single_holds[1]} non-staggered, single-line "
-                      f"tickets with one free space.")
-            temp_list = create_pseudo_faces(face_list, q_nonstaggered_single_holds[1], 1, 1, csv_rows, False)
-            if temp_list[0] is None:
-                return temp_list
-            nonstaggered_single_holds[i][1].append(temp_list)
-            if verbose:
-                print('  Done.')
-                print_usable_face_info_to_screen(face_list, 2)
-        if verbose:
-            print('  Done.')
-
-    # Single-line ticket with one free space and one either/or spot (15 winning paths)
-    if 'sloef1d1' in q_either_ors:
-        if verbose:
-            print(f"  Creating {perms} permutations of single-line hold with one free and one either/or spaces.")
-        for i in range(perms):
-            face_list.shuffle_usable_faces()
-            if verbose:
-                print(f"    Permutation #{i + 1}: Creating {q_either_ors['sloef1d1'][0]} single-line "
-                      f"tickets with no free spaces and one either-or spots.")
-            temp_list = create_single_line_either_or_faces(face_list, q_either_ors['sloef1d1'])
-            if temp_list[0] is None:
-                return temp_list
-            single_line_either_ors[i]['sloef1d1'] = temp_list
-            if verbose:
-                print('  Done.')
-                print_usable_face_info_to_screen(face_list, 2)
-        if verbose:
-            print('  Done.')
-
-    # Single-line ticket with zero free spaces and three either/or spot (8 winning paths)
-    if 'sloef0d3' in q_either_ors:
-        if verbose:
-            print(f"  Creating {perms} permutations of single-line hold with zero free and two either/or spaces.")
-        for i in range(perms):
-            face_list.shuffle_usable_faces()
-            if verbose:
-                print(f"    Permutation #{i + 1}: Creating {q_either_ors['sloef0d3'][0]} single-line "
-                      f"tickets with no free spaces and one either-or spots.")
-            temp_list = create_single_line_either_or_faces(face_list, q_either_ors['sloef0d3'])
-            if temp_list[0] is None:
-                return temp_list
-            single_line_either_ors[i]['sloef0d3'] = temp_list
-            if verbose:
-                print('  Done.')
-                print_usable_face_info_to_screen(face_list, 2)
-        if verbose:
-            print('  Done.')
-
-    # Single-line ticket with zero free spaces and two either/or spot (4 winning paths)
-    if 'sloef0d2' in q_either_ors:
-        if verbose:
-            print(f"  Creating {perms} permutations of single-line hold with zero free and two either/or spaces.")
-        for i in range(perms):
-            face_list.shuffle_usable_faces()
-            if verbose:
-                print(f"    Permutation #{i + 1}: Creating {q_either_ors['sloef0d2'][0]} single-line "
-                      f"tickets with no free spaces and one either-or spots.")
-            temp_list = create_single_line_either_or_faces(face_list, q_either_ors['sloef0d2'])
-            if temp_list[0] is None:
-                return temp_list
-            single_line_either_ors[i]['sloef0d2'] = temp_list
+    # Create every permutation's faces for one face type before moving on to the next, keeping
+    # them in a dictionary for each permutation keyed by face type.
+    created = [{} for _ in range(perms)]
+    # The evaluator's threads (if there are any) are shut down however the loop ends.
+    with ParallelEvaluator(workers) if workers > 1 else nullcontext() as evaluator:
+        for job in order(jobs):
+            face_type = job.face_type
+            # Anything the checkpoint already has doesn't need to be made again.
+            pending = []
+            for i in range(perms):
+                if saved is not None and saved.done(unit_key(i, face_type.key)):
+                    created[i][face_type.key] = saved.faces(unit_key(i, face_type.key))
+                else:
+                    pending.append(i)
+            if len(pending) == 0:
+                continue
+            if verbose:
+                print(f"  Creating {len(pending)} permutations of {face_type.description}.")
+            # A face type the checkpoint stopped partway through carries on with the pool as it was saved.
+            if len(pending) == perms:
+                face_list.shuffle_usable_faces()
+            for i in pending:
+                if verbose:
+                    print(f"    Permutation #{i + 1}: Creating {job.amount} {face_type.description}.")
+                temp_list = create_scheduled_faces(face_list, job, csv_rows, progress,
+                                                   f"Permutation #{i + 1}: {face_type.description}", stats, i,
+                                                   evaluator)
+                if len(temp_list) > 0 and temp_list[0] is None:
+                    return temp_list
+                created[i][face_type.key] = temp_list
+                if saved is not None:
+                    saved.record(unit_key(i, face_type.key), temp_list, face_list)
+                if verbose:
+                    print('    Done.')
+                    print_usable_face_info_to_screen(face_list, 2)
+            if saved is not None:
+                saved.save(face_list)
             if verbose:
                 print('  Done.')
-                print_usable_face_info_to_screen(face_list, 2)
-        if verbose:
-            print('  Done.')
-
-    # Single-line ticket with zero free spaces and one either/or spot (2 winning paths)
-    if 'sloef0d1' in q_either_ors:
-        if verbose:
-            print(f"  Creating {perms} permutations of single-line hold with one free and one either/or spaces.")
-        for i in range(perms):
-            face_list.shuffle_usable_faces()
-            if verbose:
-                print(f"    Permutation #{i + 1}: Creating {q_either_ors['sloef0d1'][0]} single-line "
-                      f"tickets with no free spaces and one either-or spots.")
-            temp_list = create_single_line_either_or_faces(face_list, q_either_ors['sloef0d1'])
-            if temp_list is None:
-                return temp_list
-            single_line_either_ors[i]['sloef0d1'] = temp_list
-            if verbose:
-                print('  Done.')
-                print_usable_face_info_to_screen(face_list, 2)
-        if verbose:
-            print('  Done.')
-
-    # Single-line nonstaggered tickets with no free spaces. (1 winning path)
-    if q_nonstaggered_single_holds[0] > 0:
-        if verbose:
-            print(f"  Creating {perms} permutations of non-staggered, single-line hold with no free spaces.")
-        for i in range(perms):
-            face_list.shuffle_usable_faces()
-            if verbose:
-                print(f"    Permutation #{i + 1}: Creating {q_nonstaggered_single_holds[0]} non-staggered, single-line "
-                      f"tickets with one free space.")
-            temp_list = create_pseudo_faces(face_list, q_nonstaggered_single_holds[0], 0, 1, csv_rows, False)
-            if temp_list[0] is None:
-                return temp_list
-            nonstaggered_single_holds[i][0].append(temp_list)
-            if verbose:
-                print('  Done.')
-                print_usable_face_info_to_screen(face_list, 2)
-        if verbose:
-            print('  Done.')
-
-    # Single-line staggered tickets with no free spaces. (1 winning path)
-    if q_staggered_single_holds[0] > 0:
-        if verbose:
-            print(f"  Creating {perms} permutations of non-staggered, single-line hold with no free spaces.")
-        for i in range(perms):
-            face_list.shuffle_usable_faces()
-            if verbose:
-                print(f"    Permutation #{i + 1}: Creating {q_staggered_single_holds[0]} non-staggered, single-line "
-                      f"tickets with one free space.")
-            temp_list = create_pseudo_faces(face_list, q_staggered_single_holds[0], 0, 1, csv_rows, True)
-            if temp_list[0] is None:
-                return temp_list
-            staggered_single_holds[i][0].append(temp_list)
-            if verbose:
-                print('  Done.')
-                print_usable_face_info_to_screen(face_list, 2)
-        if verbose:
-            print('  Done.')
-
-    for i in range(perms):
-        for sloe in sloes:
-            if f'sloe{sloe}' in single_line_either_ors[i].keys():
-                for ticket in single_line_either_ors[i][f'sloe{sloe}']:
-                    permutations[i].append(ticket)
-
-        nonstaggered_double_holds[i].reverse()
-        for frees in nonstaggered_double_holds[i]:
-            for free in frees:
-                for ticket in free:
-                    permutations[i].append(ticket)
-
-        staggered_double_holds[i].reverse()
-        for frees in staggered_double_holds[i]:
-            for free in frees:
-                for ticket in free:
-                    permutations[i].append(ticket)
-
-        nonstaggered_single_holds[i].reverse()
-        for frees in nonstaggered_single_holds[i]:
-            for free in frees:
-                for ticket in free:
-                    permutations[i].append(ticket)
-
-        staggered_single_holds[i].reverse()
-        for frees in staggered_single_holds[i]:
-            for free in frees:
-                for ticket in free:
-                    permutations[i].append(ticket)
-
+    # Claim the new paths before anything is handed back. If another job got to any of them first, these faces
+    # can't be used with its games.
+    if store is not None:
+        try:
+            reserved = store.reserve(reservation, face_list.paths_taken, base)
+        except (ValueError, TimeoutError) as err:
+            return [None, f"!!!!! ERROR: {err} !!!!!"]
+        if verbose:
+            print(f"Reserved {reserved} winning paths as '{reservation}'.")
+    if saved is not None:
+        saved.finish()
+
+    # Put each permutation together in FACE_TYPES order.
+    permutations = [[face for job in jobs for face in created[i][job.face_type.key]] for i in range(perms)]
     if verbose:
+        if stats is not None:
+            print(stats.summary())
         print('Done.')
     return permutations
 
 
 def create_all_bingo_permutations_with_reset(bingo_amts: list[list[int] | bool | str],
-                                             perms: int, csv_rows: int, v_size=False, verbose=False):
+                                             perms: int, csv_rows: int, v_size=False, verbose=False,
+                                             workers: int = 1, seed: int | None = None,
+                                             order: OrderingStrategy = by_path_demand,
+                                             checkpoint: str | None = None, progress: Progress = NO_PROGRESS,
+                                             stats: GenerationStats | None = None, catalog: str | None = None):
     """
     This method creates each permutation of bingo numbers in its entirety and resets the usable faces list for
     successive iterations. It creates the bingo faces in order of the greatest number of possible winning paths.
 
+    Since every permutation starts with a fresh face list and its own paths taken, the permutations don't depend on
+    one another and can be spread across worker processes. Each permutation is given its own seed, so a job run
+    with a seed produces the same faces whether it runs on one process or many. The results are always returned
+    in permutation order.
+
+    If a checkpoint file is passed, every finished permutation is saved to it (see bingo_checkpoint), along with
+    the permutation seeds, and a run started with the same file and specifications only makes the permutations
+    that are missing. The file is removed once every permutation is done.
+
     :param bingo_amts: list containing the number of bingo faces for each type of face: lines and free spaces
     :type bingo_amts: list[list[int] | bool | str]
     :param perms: the number of permutations needed
@@ -819,305 +623,223 @@ def create_all_bingo_permutations_with_reset(bingo_amts: list[list[int] | bool |
     :type v_size: bool
     :param verbose: should status info be printed to the screen
     :type verbose: bool
+    :param workers: number of worker processes (1 runs everything in this process, None uses every core)
+    :type workers: int | None
+    :param seed: seed for the random number generator (None leaves the generator alone when running in this process)
+    :type seed: int | None
+    :param order: strategy that decides which face types are created first (must be a module-level function
+                  when workers are used, so it can be sent to them)
+    :type order: OrderingStrategy
+    :param checkpoint: file to save progress to and resume from (None doesn't save anything)
+    :type checkpoint: str | None
+    :param progress: where to report how many faces have been made (or, with worker processes, how many
+                     permutations have been finished)
+    :type progress: Progress
+    :param stats: statistics to add every face type and permutation to (None doesn't keep any)
+    :type stats: GenerationStats | None
+    :param catalog: compiled catalog to draw the faces from instead of the packaged one (see face_generator)
+    :type catalog: str | None
+    :return: list of bingo faces for each permutation, or [None, error message] if the faces ran out
+    :rtype: list[list[str | list[str]]]
     """
-    # Create a list to hold the permutations
-    permutations = []
-    for i in range(perms):
-        permutations.append([])
-
-    # I'LL PROBABLY TAKE THIS OUT. I'M JUST PARANOID. ----------------------------------------------------------------
-    # Take the first five
-    # numbs = []
-    # for i in range(5):
-    #     numbs.append(bingo_amts[i])
-    # Break up the bingo requirements by type (single- or double-lines staggered or not, plus either-ors)
-    # [q_nonstaggered_double_holds, q_staggered_double_holds,
-    #  q_nonstaggered_single_holds, q_staggered_single_holds, q_single_line_either_ors] = numbs
-    # ----------------------------------------------------------------------------------------------------------------
-
-    # Break up the bingo requirements by type (single- or double-lines staggered or not, plus either-ors)
-    [q_nonstaggered_double_holds, q_staggered_double_holds,
-     q_nonstaggered_single_holds, q_staggered_single_holds, q_single_line_either_ors] = bingo_amts
-    # Create a dictionary to hold faces for either/ors, using their parameters
-    # to create the keys: an either/or with 1 free space and 2 either/or spots
-    # would be referred to by the key 'sloef1d2'.
-    q_either_ors = {}
-    if q_single_line_either_ors[0][0] != 0:
-        for sloe in q_single_line_either_ors:
-            q_either_ors[f"sloef{sloe[1]}d{sloe[2]}"] = sloe
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, perms))
+    saved = None
+    if checkpoint is not None:
+        try:
+            saved = BingoCheckpoint.open(checkpoint, job_fingerprint('with_reset', bingo_amts, perms, v_size, order,
+                                                                     seed, catalog))
+        except ValueError as err:
+            return [None, f"!!!!! ERROR: {err} !!!!!"]
+        saved.resume()
+    # Reuse the seeds a resumed run was started with, so the permutations it still has to make are the ones it
+    # would have made.
+    if saved is not None and saved.seeds is not None:
+        seeds = saved.seeds
+    else:
+        seeds = permutation_seeds(perms, seed, workers > 1)
+        if saved is not None:
+            saved.seeds = seeds
+    permutations = [saved.faces(unit_key(i)) if saved is not None and saved.done(unit_key(i)) else None
+                    for i in range(perms)]
+    pending = [i for i in range(perms) if permutations[i] is None]
 
     if verbose:
         print(f"==========> Creating {perms} permutations resetting the usable faces array for each one. <==========")
 
-    # Create the faces needed for each permutation, resetting the faces list with each iteration. Call
-    # create_pseudo_faces for regular bingos and create_single_line_either_or_faces for either/or tickets.
-    for i in range(perms):
-        if verbose:
-            print(f"  Creating PERMUTATION #{i + 1}")
-            print("    Creating and shuffling usable faces list.")
-        # Create a new list of bingo faces.
-        face_list = BingoFaceList(v_size)
-        face_list.shuffle_usable_faces()
-        if verbose:
-            print_usable_face_info_to_screen(face_list, 2)
-
-        # Two-line tickets with three nonstaggered free spots (13,500) (let's hope it never happens)
-        if q_nonstaggered_double_holds[3] > 0:
-            face_list.shuffle_usable_faces()
-            if verbose:
-                print(f"    Permutation #{i + 1}: Creating {q_nonstaggered_double_holds[3]} non-staggered, double-line "
-                      "tickets with three free spaces.")
-            permutations[i] += create_pseudo_faces(face_list, q_nonstaggered_double_holds[3],
-                                                   3, 2, csv_rows, False)
-            if verbose:
-                print('    Done.')
-                print_usable_face_info_to_screen(face_list, 2)
-
-        # Two-line tickets with three staggered free spots (13,500)
-        if q_staggered_double_holds[3] > 0:
-            face_list.shuffle_usable_faces()
-            if verbose:
-                print(f"    Permutation #{i + 1}: Creating {q_staggered_double_holds[3]} staggered, double-line "
-                      "tickets with three free spaces.")
-            permutations[i] += create_pseudo_faces(face_list, q_staggered_double_holds[3],
-                                                   3, 2, csv_rows, True)
-            if verbose:
-                print('    Done.')
-                print_usable_face_info_to_screen(face_list, 2)
-
-        # One-line tickets with three nonstaggered free spots (3375 winning paths)
-        if q_nonstaggered_single_holds[3] > 0:
-            face_list.shuffle_usable_faces()
-            if verbose:
-                print(f"    Permutation #{i + 1}: Creating {q_nonstaggered_single_holds[3]} non-staggered, double-line "
-                      f"tickets with three free spaces.")
-            permutations[i] += create_pseudo_faces(face_list, q_nonstaggered_single_holds[3],
-                                                   3, 1, csv_rows, False)
-            if verbose:
-                print('    Done.')
-                print_usable_face_info_to_screen(face_list, 2)
-
-        # Two-line tickets with two-nonstaggered free spots (1800 winning paths)
-        if q_nonstaggered_double_holds[2] > 0:
-            face_list.shuffle_usable_faces()
-            if verbose:
-                print(f"    Permutation #{i + 1}: Creating {q_nonstaggered_double_holds[2]} non-staggered, double-line "
-                      f"tickets with two free spaces.")
-            permutations[i] += create_pseudo_faces(face_list, q_nonstaggered_double_holds[2],
-                                                   2, 2, csv_rows, False)
-            if verbose:
-                print('    Done.')
-                print_usable_face_info_to_screen(face_list, 2)
-
-        # Two-line tickets with two-staggered free spots (1800 winning paths)
-        if q_staggered_double_holds[2] > 0:
-            face_list.shuffle_usable_faces()
-            if verbose:
-                print(f"    Permutation #{i + 1}: Creating {q_staggered_double_holds[2]} staggered, double-line "
-                      f"tickets with two free spaces.")
-            permutations[i] += create_pseudo_faces(face_list, q_staggered_double_holds[2],
-                                                   2, 2, csv_rows, True)
-            if verbose:
-                print('    Done.')
-                print_usable_face_info_to_screen(face_list, 2)
-
-        # Single-line ticket with two free spaces and two either/or spots (900 winning paths)
-        if 'sloef2d2' in q_either_ors:
-            face_list.shuffle_usable_faces()
-            if verbose:
-                print(f"    Permutation #{i + 1}: Creating {q_either_ors['sloef2d2'][0]} single-line "
-                      f"tickets with two free spaces and two either-or spots.")
-            permutations[i] += create_single_line_either_or_faces(face_list, q_either_ors['sloef2d2'])
-            if verbose:
-                print('    Done.')
-                print_usable_face_info_to_screen(face_list, 2)
-
-        # Single-line ticket with two free spaces and one either/or spot (450 winning paths)
-        if 'sloef2d1' in q_either_ors:
-            face_list.shuffle_usable_faces()
-            if verbose:
-                print(f"    Permutation #{i + 1}: Creating {q_either_ors['sloef2d1'][0]} single-line "
-                      f"tickets with two free spaces and one either-or spot.")
-            permutations[i] += create_single_line_either_or_faces(face_list, q_either_ors['sloef2d1'])
-            if verbose:
-                print('    Done.')
-                print_usable_face_info_to_screen(face_list, 2)
-
-        # Two-line tickets with one nonstaggered free spot (240 winning paths)
-        if q_nonstaggered_double_holds[1] > 0:
-            face_list.shuffle_usable_faces()
-            if verbose:
-                print(f"    Permutation #{i + 1}: Creating {q_nonstaggered_double_holds[1]} non-staggered, double-line "
-                      f"tickets with one free space.")
-            permutations[i] += create_pseudo_faces(face_list, q_nonstaggered_double_holds[1],
-                                                   1, 2, csv_rows, False)
-            if verbose:
-                print('    Done.')
-                print_usable_face_info_to_screen(face_list, 2)
-
-        # Two-line tickets with one staggered free spot (240 winning paths)
-        if q_staggered_double_holds[1] > 0:
-            face_list.shuffle_usable_faces()
-            if verbose:
-                print(f"    Permutation #{i + 1}: Creating {q_staggered_double_holds[1]} non-staggered, double-line "
-                      f"tickets with one free space.")
-            permutations[i] += create_pseudo_faces(face_list, q_staggered_double_holds[1],
-                                                   1, 2, csv_rows, True)
-            if verbose:
-                print('    Done.')
-                print_usable_face_info_to_screen(face_list, 2)
-
-        # Single-line tickets with two staggered free spots (225 winning paths)
-        if q_staggered_single_holds[2] > 0:
-            face_list.shuffle_usable_faces()
-            if verbose:
-                print(f"    Permutation #{i + 1}: Creating {q_staggered_single_holds[2]} staggered, single-line "
-                      f"tickets with two free spaces.")
-            permutations[i] += create_pseudo_faces(face_list, q_staggered_single_holds[2],
-                                                   2, 1, csv_rows, True)
-            if verbose:
-                print('    Done.')
-                print_usable_face_info_to_screen(face_list, 2)
-
-        # Single-line tickets with two-nonstaggered free spots (225 winning paths)
-        if q_nonstaggered_single_holds[2] > 0:
-            face_list.shuffle_usable_faces()
-            if verbose:
-                print(f"    Permutation #{i + 1}: Creating {q_nonstaggered_single_holds[2]} nonstaggered, single-line "
-                      f"tickets with two free spaces.")
-            permutations[i] += create_pseudo_faces(face_list, q_nonstaggered_single_holds[2],
-                                                   2, 1, csv_rows, False)
-            if verbose:
-                print('    Done.')
-                print_usable_face_info_to_screen(face_list, 2)
+    # Create the faces needed for each permutation, resetting the faces list with each iteration. Either do
+    # them one after another, or hand them out to a pool of worker processes and collect them in order.
+    if workers > 1 and len(pending) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(create_bingo_permutation_with_stats, bingo_amts, i, csv_rows,
+                                       v_size, verbose, seeds[i], order, catalog): i for i in pending}
+            for future in as_completed(futures):
+                permutation, worker_stats = future.result()
+                finish_permutation(permutations, futures[future], permutation, saved)
+                if stats is not None:
+                    stats.extend(worker_stats)
+                progress.report('Permutations', perms - permutations.count(None), perms)
+    else:
+        for i in pending:
+            finish_permutation(permutations, i, create_bingo_permutation_with_reset(bingo_amts, i, csv_rows, v_size,
+                                                                                    verbose, seeds[i], order,
+                                                                                    progress, stats, catalog),
+                               saved)
+    if saved is not None:
+        saved.save()
+
+    # If any permutation ran out of faces, pass its error along.
+    for permutation in permutations:
+        if len(permutation) > 0 and permutation[0] is None:
+            return permutation
+    if saved is not None:
+        saved.finish()
+    if verbose:
+        if stats is not None:
+            print(stats.summary())
+        print('Done.')
+    return permutations
 
-        # Single-line ticket with one free space2 and two either/or spots (60 winning paths)
-        if 'sloef1d2' in q_either_ors:
-            face_list.shuffle_usable_faces()
-            if verbose:
-                print(f"    Permutation #{i + 1}: Creating {q_either_ors['sloef1d2'][0]} single-line "
-                      f"tickets with two free spaces and one either-or spot.")
-            permutations[i] += create_single_line_either_or_faces(face_list, q_either_ors['sloef1d2'])
-            if verbose:
-                print('    Done.')
-                print_usable_face_info_to_screen(face_list, 2)
 
-        # Double-line tickets with no free spaces. (Nonstaggered, but that's irrelevant.) (32 winning paths)
-        if q_nonstaggered_double_holds[0] > 0:
-            face_list.shuffle_usable_faces()
-            if verbose:
-                print(f"    Permutation #{i + 1}: Creating {q_nonstaggered_double_holds[0]} nonstaggered, double-line "
-                      f"tickets with no free spaces.")
-            permutations[i] += create_pseudo_faces(face_list, q_nonstaggered_double_holds[0],
-                                                   0, 2, csv_rows, False)
-            if verbose:
-                print('    Done.')
-                print_usable_face_info_to_screen(face_list, 2)
+def finish_permutation(permutations: list[list[str | list[str]] | None], i: int,
+                       permutation: list[list[str | list[str]]], saved: BingoCheckpoint | None) -> None:
+    """
+    Put a finished permutation in its place and record it in the checkpoint (if there is one). Permutations that
+    ran out of faces aren't recorded, so a resumed run tries them again.
+
+    :param permutations: permutations made so far (None where one is still missing)
+    :type permutations: list[list[str | list[str]] | None]
+    :param i: index of the permutation
+    :type i: int
+    :param permutation: faces of the permutation, or [None, error message] if the faces ran out
+    :type permutation: list[list[str | list[str]]]
+    :param saved: checkpoint for the run
+    :type saved: BingoCheckpoint | None
+    :return: None
+    :rtype: None
+    """
+    permutations[i] = permutation
+    if saved is not None and not (len(permutation) > 0 and permutation[0] is None):
+        saved.record(unit_key(i), permutation)
 
-        # Double-line tickets with no free spaces. (Staggered, but that's irrelevant.) (32 winning paths)
-        if q_staggered_double_holds[0] > 0:
-            face_list.shuffle_usable_faces()
-            if verbose:
-                print(f"    Permutation #{i + 1}: Creating {q_staggered_double_holds[0]} staggered, double-line "
-                      f"tickets with no free spaces.")
-            permutations[i] += create_pseudo_faces(face_list, q_staggered_double_holds[0],
-                                                   0, 2, csv_rows, False)
-            if verbose:
-                print('    Done.')
-                print_usable_face_info_to_screen(face_list, 2)
 
-        # Single-line ticket with one free space and one either/or spot (15 winning paths)
-        if 'sloef1d1' in q_either_ors:
-            face_list.shuffle_usable_faces()
-            if verbose:
-                print(f"    Permutation #{i + 1}: Creating {q_either_ors['sloef1d1'][0]} single-line "
-                      f"tickets with one free space and one either-or spot.")
-            permutations[i] += create_single_line_either_or_faces(face_list, q_either_ors['sloef1d1'])
-            if verbose:
-                print('    Done.')
-                print_usable_face_info_to_screen(face_list, 2)
+def permutation_seeds(perms: int, seed: int | None, parallel: bool = False) -> list[int | None]:
+    """
+    Create a seed for each permutation. A seeded job derives them from its seed. An unseeded parallel job draws
+    them from the random module, so worker processes don't all start from the same state. An unseeded job that
+    runs in this process doesn't reseed anything.
 
-        # Single-line tickets with one staggered free space. (15 winning paths)
-        if q_staggered_single_holds[1] > 0:
-            face_list.shuffle_usable_faces()
-            if verbose:
-                print(f"    Permutation #{i + 1}: Creating {q_staggered_single_holds[1]} staggered, single-line "
-                      f"tickets with one free space.")
-            permutations[i] += create_pseudo_faces(face_list, q_staggered_single_holds[1],
-                                                   1, 1, csv_rows, True)
-            if verbose:
-                print('    Done.')
-                print_usable_face_info_to_screen(face_list, 2)
+    :param perms: the number of permutations needed
+    :type perms: int
+    :param seed: seed for the whole job
+    :type seed: int | None
+    :param parallel: will the permutations run in worker processes?
+    :type parallel: bool
+    :return: seed for each permutation
+    :rtype: list[int | None]
+    """
+    if seed is not None:
+        seeder = rn.Random(seed)
+        return [seeder.getrandbits(64) for _ in range(perms)]
+    if parallel:
+        return [rn.getrandbits(64) for _ in range(perms)]
+    return [None] * perms
+
+
+def create_bingo_permutation_with_reset(bingo_amts: list[list[int] | bool | str], i: int, csv_rows: int,
+                                        v_size=False, verbose=False,
+                                        seed: int | None = None,
+                                        order: OrderingStrategy = by_path_demand,
+                                        progress: Progress = NO_PROGRESS, stats: GenerationStats | None = None,
+                                        catalog: str | None = None) -> list[list[str | list[str]]]:
+    """
+    Create a single permutation of bingo faces from a fresh face list, in order of the greatest number of possible
+    winning paths. This is the unit of work create_all_bingo_permutations_with_reset hands to its worker processes.
 
-        # Single-line tickets with one nonstaggered free space. (15 winning paths)
-        if q_nonstaggered_single_holds[1] > 0:
-            face_list.shuffle_usable_faces()
-            if verbose:
-                print(f"    Permutation #{i + 1}: Creating {q_nonstaggered_single_holds[1]} non-staggered, single-line "
-                      f"tickets with one free space.")
-            permutations[i] += create_pseudo_faces(face_list, q_nonstaggered_single_holds[1],
-                                                   1, 1, csv_rows, False)
-            if verbose:
-                print('    Done.')
-                print_usable_face_info_to_screen(face_list, 2)
+    :param bingo_amts: list containing the number of bingo faces for each type of face: lines and free spaces
+    :type bingo_amts: list[list[int] | bool | str]
+    :param i: index of the permutation (only used for status info)
+    :type i: int
+    :param csv_rows: number of rows needed for the csv file
+    :type csv_rows: int
+    :param v_size: Should the standard or extended usable faces be read?
+    :type v_size: bool
+    :param verbose: should status info be printed to the screen
+    :type verbose: bool
+    :param seed: seed for the random number generator (None leaves it alone)
+    :type seed: int | None
+    :param order: strategy that decides which face types are created first
+    :type order: OrderingStrategy
+    :param progress: where to report how many faces have been made (progress can't be reported from a worker
+                     process, so workers leave this alone)
+    :type progress: Progress
+    :param stats: statistics to add every face type to (None doesn't keep any)
+    :type stats: GenerationStats | None
+    :param catalog: compiled catalog to draw the faces from instead of the packaged one (see face_generator)
+    :type catalog: str | None
+    :return: list of bingo faces for the permutation, or [None, error message] if the faces ran out
+    :rtype: list[list[str | list[str]]]
+    """
+    if seed is not None:
+        rn.seed(seed)
 
-        # Single-line ticket with no free spaces and three either/or spots (8 winning paths)
-        if 'sloef0d3' in q_either_ors:
-            face_list.shuffle_usable_faces()
-            if verbose:
-                print(f"    Permutation #{i + 1}: Creating {q_either_ors['sloef0d3'][0]} single-line "
-                      f"tickets with no free space spaces and two either-or spots.")
-            permutations[i] += create_single_line_either_or_faces(face_list, q_either_ors['sloef0d3'])
-            if verbose:
-                print('    Done.')
-                print_usable_face_info_to_screen(face_list, 2)
+    if verbose:
+        print(f"  Creating PERMUTATION #{i + 1}")
+        print("    Creating and shuffling usable faces list.")
+    # Create a new list of bingo faces (it's shuffled before each face type is created).
+    face_list = BingoFaceList(v_size, catalog)
+    if verbose:
+        print_usable_face_info_to_screen(face_list, 2)
 
-        # Single-line ticket with no free spaces and two either/or spots (4 winning paths)
-        if 'sloef0d2' in q_either_ors:
-            face_list.shuffle_usable_faces()
-            if verbose:
-                print(f"    Permutation #{i + 1}: Creating {q_either_ors['sloef0d2'][0]} single-line "
-                      f"tickets with no free space spaces and two either-or spots.")
-            permutations[i] += create_single_line_either_or_faces(face_list, q_either_ors['sloef0d2'])
-            if verbose:
-                print('    Done.')
-                print_usable_face_info_to_screen(face_list, 2)
+    # Create the faces for each face type in the scheduled order, adding them to the permutation as they're made.
+    permutation = []
+    for job in order(build_jobs(bingo_amts)):
+        face_list.shuffle_usable_faces()
+        if verbose:
+            print(f"    Permutation #{i + 1}: Creating {job.amount} {job.face_type.description}.")
+        temp_list = create_scheduled_faces(face_list, job, csv_rows, progress,
+                                           f"Permutation #{i + 1}: {job.face_type.description}", stats, i)
+        if len(temp_list) > 0 and temp_list[0] is None:
+            return temp_list
+        permutation += temp_list
+        if verbose:
+            print('    Done.')
+            print_usable_face_info_to_screen(face_list, 2)
 
-        # Single-line ticket with no free spaces and one either/or spot (2 winning paths)
-        if 'sloef0d1' in q_either_ors:
-            face_list.shuffle_usable_faces()
-            if verbose:
-                print(f"    Permutation #{i + 1}: Creating {q_either_ors['sloef0d1'][0]} single-line "
-                      f"tickets with no free space spaces and one either-or spot.")
-            permutations[i] += create_single_line_either_or_faces(face_list, q_either_ors['sloef0d1'])
-            if verbose:
-                print('    Done.')
-                print_usable_face_info_to_screen(face_list, 2)
+    if verbose:
+        print('  Done.')
+    return permutation
 
-        # Single-line nonstaggered tickets with no free spaces. (1 winning path)
-        if q_nonstaggered_single_holds[0] > 0:
-            face_list.shuffle_usable_faces()
-            if verbose:
-                print(f"    Permutation #{i + 1}: Creating {q_nonstaggered_single_holds[0]} non-staggered, single-line "
-                      f"tickets with one free space.")
-            permutations[i] += create_pseudo_faces(face_list, q_nonstaggered_single_holds[0],
-                                                   0, 1, csv_rows, False)
-            if verbose:
-                print('    Done.')
-                print_usable_face_info_to_screen(face_list, 2)
 
-        # Single-line staggered tickets with no free spaces. (1 winning path)
-        if q_staggered_single_holds[0] > 0:
-            face_list.shuffle_usable_faces()
-            if verbose:
-                print(f"    Permutation #{i + 1}: Creating {q_staggered_single_holds[0]} non-staggered, single-line "
-                      f"tickets with one free space.")
-            permutations[i] += create_pseudo_faces(face_list, q_staggered_single_holds[0],
-                                                   0, 1, csv_rows, True)
-            if verbose:
-                print('    Done.')
-                print_usable_face_info_to_screen(face_list, 2)
+def create_bingo_permutation_with_stats(bingo_amts: list[list[int] | bool | str], i: int, csv_rows: int,
+                                        v_size=False, verbose=False, seed: int | None = None,
+                                        order: OrderingStrategy = by_path_demand, catalog: str | None = None
+                                        ) -> list[list[list[str | list[str]]] | GenerationStats]:
+    """
+    Create a single permutation (see create_bingo_permutation_with_reset) along with its statistics. Worker
+    processes can't add to the caller's statistics, so they send their own back with the faces.
 
-        print('  Done.')
-    print('Done.')
-    return permutations
+    :param bingo_amts: list containing the number of bingo faces for each type of face: lines and free spaces
+    :type bingo_amts: list[list[int] | bool | str]
+    :param i: index of the permutation
+    :type i: int
+    :param csv_rows: number of rows needed for the csv file
+    :type csv_rows: int
+    :param v_size: Should the standard or extended usable faces be read?
+    :type v_size: bool
+    :param verbose: should status info be printed to the screen
+    :type verbose: bool
+    :param seed: seed for the random number generator (None leaves it alone)
+    :type seed: int | None
+    :param order: strategy that decides which face types are created first
+    :type order: OrderingStrategy
+    :param catalog: compiled catalog to draw the faces from instead of the packaged one (see face_generator)
+    :type catalog: str | None
+    :return: the permutation (or [None, error message]) and its statistics
+    :rtype: list[list[list[str | list[str]]] | GenerationStats]
+    """
+    stats = GenerationStats()
+    permutation = create_bingo_permutation_with_reset(bingo_amts, i, csv_rows, v_size, verbose, seed, order,
+                                                      stats=stats, catalog=catalog)
+    return [permutation, stats]